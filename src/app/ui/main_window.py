@@ -6,81 +6,206 @@ from matplotlib.figure import Figure
 import numpy as np
 from datetime import datetime
 import os
+import copy
 import time
+import threading
+from collections import OrderedDict
 from src.core.utils.file_io import save_to_csv
+from src.core.utils.decimation import DecimatedLine
+from src.core.utils.figure_export import GRAPH_PANELS, export_result_figures
 from PyQt6.QtCore import QTimer, QThread, pyqtSignal
-from src.core.calculations.beam_calculation import calculate_beam_analysis, calculate_moment
+from src.core.calculations.beam_calculation import calculate_beam_analysis, calculate_beam_batch, calculate_moment
+from src.core.calculations.formula_registry import SUPPORT_CONDITIONS
 from math import ceil, sqrt
 from src.core.calculations.load_types import calculate_uniform_load, calculate_triangular_load
 from src.core.calculations.reinforcement import calculate_reinforcement
-from concurrent.futures import ThreadPoolExecutor
-import threading
+from src.core.calculations.serviceability import check_results_serviceability
+from src.core.calculations.design_checks import check_results_design
 from src.app.ui.scenario_results_dialog import ScenarioResultsDialog
 from src.app.ui.scenario_dialog import ScenarioDialog
 from src.app.ui.visualization_3d import Beam3DVisualization
 
-class CalculationThread(QThread):
+# Canlı modda son düzenlemeden sonra hesaba kadar beklenen süre (ms)
+LIVE_DEBOUNCE_MS = 100
+
+# Hesap iş parçacığının sakladığı son sonuç sayısı
+CALCULATION_CACHE_SIZE = 32
+
+def run_calculation(params, progress=None):
+    """
+    Tek kiriş hesabını yapar ve sonuç sözlüğünü döndürür.
+
+    Hesap düğmesi ve canlı mod aynı yolu kullanır; progress verilirse
+    ilerleme yüzdesiyle çağrılır.
+    """
+    progress = progress or (lambda value: None)
+    start_time = time.time()
+    progress(10)
+    
+    # Parametreleri al
+    length = params["length"]
+    load = params["load"]
+    width = params["width"]
+    height = params["height"]
+    concrete_class = params["concrete_class"]
+    load_type = params["load_type"]
+    support_condition = params.get("support_condition", "Basit Mesnetli")
+    calc_reinforcement = params["with_reinforcement"]
+    
+    # Hesaplama işlemlerini core modülüne taşıyoruz
+    progress(30)
+    
+    # Hesaplama sonuçlarını al
+    beam_results = calculate_beam_analysis(
+        length, load, width, height, concrete_class, 
+        load_type=load_type, 
+        with_reinforcement=calc_reinforcement,
+        support_condition=support_condition
+    )
+    
+    progress(70)
+    
+    # Giriş parametrelerini sonuçlara ekle
+    beam_results["length"] = length
+    beam_results["load"] = load
+    beam_results["width"] = width
+    beam_results["height"] = height
+    beam_results["concrete_class"] = concrete_class
+    
+    # Donatı seçildiyse servis durumu (çatlak genişliği) kontrolü
+    check_results_serviceability([beam_results])
+    check_results_design([beam_results])
+    
+    # Zaman bilgisini ekle
+    beam_results["elapsed_time"] = time.time() - start_time
+    
+    progress(100)
+    return beam_results
+
+class CalculationWorker(QThread):
+    """
+    Tek kiriş hesapları için uzun ömürlü iş parçacığı.
+
+    Hesap düğmesi ve canlı mod istekleri aynı iş parçacığına gönderilir.
+    Bekleyen tek bir istek tutulur: yeni istek eskisinin yerine geçer, böylece
+    kuyruk birikmez. Her isteğe artan bir kimlik verilir; hesap bitene kadar
+    daha yeni bir istek geldiyse sonuç gönderilmez. Son sonuçlar parametrelere
+    göre önbellekte tutulur; aynı girişler yeniden hesaplanmaz.
+    """
     calculation_complete = pyqtSignal(dict)
-    calculation_error = pyqtSignal(str)
+    calculation_error = pyqtSignal(int, str)
     progress_update = pyqtSignal(int)
     
-    def __init__(self, params):
+    def __init__(self):
         super().__init__()
-        self.params = params
+        self.condition = threading.Condition()
+        self.pending = None
+        self.latest_id = 0
+        self.running = True
+        self.result_cache = OrderedDict()
+    
+    def submit(self, params):
+        """İsteği bekleyen isteğin yerine koyar ve istek kimliğini döndürür"""
+        with self.condition:
+            self.latest_id += 1
+            self.pending = (self.latest_id, dict(params))
+            self.condition.notify()
+            return self.latest_id
+    
+    def stop(self):
+        """İş parçacığını durdurur ve bitmesini bekler"""
+        with self.condition:
+            self.running = False
+            self.pending = None
+            self.condition.notify()
+        self.wait()
+    
+    def is_stale(self, request_id):
+        """Daha yeni bir istek geldiyse True döner"""
+        with self.condition:
+            return request_id != self.latest_id
+    
+    def calculate(self, params):
+        """
+        Önbellekte yoksa hesaplar; önbellek sonuçlarının derin kopyası döner.
+
+        Önbellek girdileri hiçbir zaman dışarı verilmez: donatı alt sözlükleri
+        ve dağılım dizileri de kopyalanır, böylece sonucu değiştiren arayüz
+        kodu önbelleği bozmaz. Önbellekten dönen sonuçta "cached" True olur ve
+        "elapsed_time" gerçek arama süresidir.
+        """
+        start_time = time.time()
+        key = tuple(sorted(params.items()))
+        if key in self.result_cache:
+            self.result_cache.move_to_end(key)
+            results = copy.deepcopy(self.result_cache[key])
+            results["cached"] = True
+            results["elapsed_time"] = time.time() - start_time
+            self.progress_update.emit(100)
+            return results
+        results = run_calculation(params, self.progress_update.emit)
+        self.result_cache[key] = results
+        if len(self.result_cache) > CALCULATION_CACHE_SIZE:
+            self.result_cache.popitem(last=False)
+        return copy.deepcopy(results)
     
     def run(self):
-        try:
-            start_time = time.time()
-            self.progress_update.emit(10)
-            
-            # Parametreleri al
-            length = self.params["length"]
-            load = self.params["load"]
-            width = self.params["width"]
-            height = self.params["height"]
-            concrete_class = self.params["concrete_class"]
-            load_type = self.params["load_type"]
-            calc_reinforcement = self.params["with_reinforcement"]
-            
-            # Hesaplama işlemlerini core modülüne taşıyoruz
-            self.progress_update.emit(30)
-            
-            # Yapay gecikmeleri kaldır
-            # time.sleep(0.3)  # 300 ms gecikme
-            
-            # Hesaplama sonuçlarını al
-            beam_results = calculate_beam_analysis(
-                length, load, width, height, concrete_class, 
-                load_type=load_type, 
-                with_reinforcement=calc_reinforcement
-            )
-            
-            self.progress_update.emit(70)
-            
-            # Yapay gecikmeleri kaldır
-            # time.sleep(0.2)  # 200 ms gecikme
-            
-            # Giriş parametrelerini sonuçlara ekle
-            beam_results["length"] = length
-            beam_results["load"] = load
-            beam_results["width"] = width
-            beam_results["height"] = height
-            beam_results["concrete_class"] = concrete_class
-            
-            # Zaman bilgisini ekle
-            elapsed_time = time.time() - start_time
-            beam_results["elapsed_time"] = elapsed_time
-            
-            # Hesaplama süresini görselleştirme için formatla
-            if "elapsed_time" in beam_results:
-                elapsed_time_str = f"{beam_results['elapsed_time']:.8f}"  # 8 ondalık basamak göster
-                result_text = f"Hesaplama Süresi: {elapsed_time_str} saniye"
+        while True:
+            with self.condition:
+                while self.running and self.pending is None:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                request_id, params = self.pending
+                self.pending = None
             
-            self.progress_update.emit(100)
-            self.calculation_complete.emit(beam_results)
+            try:
+                results = self.calculate(params)
+            except Exception as e:
+                if not self.is_stale(request_id):
+                    self.calculation_error.emit(request_id, str(e))
+                continue
             
+            # Hesap sırasında yeni istek geldiyse sonuç bayattır
+            if not self.is_stale(request_id):
+                results["request_id"] = request_id
+                self.calculation_complete.emit(results)
+
+class FigureExportThread(QThread):
+    """
+    Grafikleri arayüz iş parçacığı dışında dosyalara yazar.
+
+    Çizim canlı pencereden değil sonuç verisinden export_result_figures ile
+    Agg üzerinde yapılır; çok sayıda sonuç işçi süreçlere dağıtılır.
+    """
+    export_complete = pyqtSignal(list)
+    export_error = pyqtSignal(str)
+    progress_update = pyqtSignal(int)
+    
+    def __init__(self, results, directory, prefix, formats=("png",), dpi=300, max_workers=None):
+        super().__init__()
+        self.results = results
+        self.directory = directory
+        self.prefix = prefix
+        self.formats = formats
+        self.dpi = dpi
+        self.max_workers = max_workers
+        self.cancel_event = threading.Event()
+    
+    def cancel(self):
+        """Dışa aktarmayı durdurur; başlamamış grafikler yazılmaz"""
+        self.cancel_event.set()
+    
+    def run(self):
+        try:
+            written = export_result_figures(
+                self.results, self.directory, self.prefix, self.formats, self.dpi, self.max_workers,
+                progress=lambda done, total: self.progress_update.emit(int(100 * done / total)),
+                cancel_event=self.cancel_event
+            )
+            self.export_complete.emit(written)
         except Exception as e:
-            self.calculation_error.emit(str(e))
+            self.export_error.emit(str(e))
 
 class ScenarioCalculationThread(QThread):
     calculation_complete = pyqtSignal(list)
@@ -90,14 +215,7 @@ class ScenarioCalculationThread(QThread):
     def __init__(self, scenarios):
         super().__init__()
         self.scenarios = scenarios
-        self.lock = threading.Lock()
-        self.completed = 0
         self.results = []
-        # Boş liste durumunda hata oluşmasını önle
-        if not scenarios:
-            self.max_workers = 1
-        else:
-            self.max_workers = min(4, len(scenarios))  # CPU çekirdek sayısına göre, en fazla senaryo sayısı kadar
     
     def run(self):
         try:
@@ -105,72 +223,35 @@ class ScenarioCalculationThread(QThread):
             if not self.scenarios:
                 self.calculation_complete.emit([])
                 return
-                
-            # ThreadPoolExecutor ile paralel hesaplama
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Tüm senaryolar için hesaplama işlemlerini başlat
-                future_to_scenario = {
-                    executor.submit(self.calculate_scenario, i, scenario): (i, scenario)
-                    for i, scenario in enumerate(self.scenarios)
-                }
-                
-                # Tamamlanan hesaplamaları topla
-                for future in future_to_scenario:
-                    try:
-                        # Hesaplama sonucunu al
-                        future.result()
-                    except Exception as e:
-                        # Hata durumunda işlemi durdur
-                        self.calculation_error.emit(f"Senaryo hesaplama hatası: {str(e)}")
-                        return
-            
-            # Sonuçları sırala (senaryo indeksine göre)
-            self.results.sort(key=lambda x: x["scenario_index"])
+            
+            # Senaryolar çekirdeklere göre gruplanıp vektörel olarak hesaplanır
+            self.progress_update.emit(10)
+            results = calculate_beam_batch(self.scenarios)
+            self.progress_update.emit(90)
+            
+            # Senaryo parametrelerini sonuçlara ekle
+            for index, (scenario, result) in enumerate(zip(self.scenarios, results)):
+                result.update({
+                    "scenario_index": index,
+                    "length": scenario["length"],
+                    "load": scenario["load"],
+                    "width": scenario["width"],
+                    "height": scenario["height"],
+                    "concrete_class": scenario["concrete_class"],
+                    "with_reinforcement": scenario.get("with_reinforcement", False)
+                })
+            
+            # Donatılı senaryoların servis kontrolleri tek vektörel çağrıda yapılır
+            check_results_serviceability(results)
+            check_results_design(results)
+            self.results = results
             
             # Sonuçları gönder
+            self.progress_update.emit(100)
             self.calculation_complete.emit(self.results)
             
         except Exception as e:
             self.calculation_error.emit(f"Senaryo hesaplama hatası: {str(e)}")
-    
-    def calculate_scenario(self, index, scenario):
-        """Tek bir senaryo için hesaplama yap"""
-        try:
-            # Hesaplama yap
-            result = calculate_beam_analysis(
-                length=scenario["length"],
-                load=scenario["load"],
-                width=scenario["width"],
-                height=scenario["height"],
-                concrete_class=scenario["concrete_class"],
-                load_type=scenario.get("load_type", "Tekil Yük"),
-                with_reinforcement=scenario.get("with_reinforcement", False)  # Donatı hesabı parametresini ekle
-            )
-            
-            # Senaryo parametrelerini sonuca ekle
-            result.update({
-                "scenario_index": index,
-                "length": scenario["length"],
-                "load": scenario["load"],
-                "width": scenario["width"],
-                "height": scenario["height"],
-                "concrete_class": scenario["concrete_class"],
-                "load_type": scenario.get("load_type", "Tekil Yük"),
-                "with_reinforcement": scenario.get("with_reinforcement", False)  # Donatı hesabı bilgisini sonuca ekle
-            })
-            
-            # Thread-safe bir şekilde sonuçları ekle
-            with self.lock:
-                self.results.append(result)
-                self.completed += 1
-                # Boş senaryo listesi kontrolü ekle
-                if len(self.scenarios) > 0:
-                    progress = int((self.completed / len(self.scenarios)) * 100)
-                    self.progress_update.emit(progress)
-            
-        except Exception as e:
-            print(f"Senaryo {index} hesaplama hatası: {str(e)}")
-            raise e
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -246,6 +327,14 @@ class MainWindow(QMainWindow):
         load_type_layout.addWidget(self.load_type)
         right_layout.addLayout(load_type_layout)
         
+        # Mesnet koşulu
+        support_layout = QHBoxLayout()
+        support_layout.addWidget(QLabel("Mesnet Koşulu:"))
+        self.support_condition = QComboBox()
+        self.support_condition.addItems(SUPPORT_CONDITIONS)
+        support_layout.addWidget(self.support_condition)
+        right_layout.addLayout(support_layout)
+        
         # Donatı hesabı
         reinforcement_layout = QHBoxLayout()
         self.reinforcement_check = QCheckBox("Donatı Hesabı Yap")
@@ -257,6 +346,27 @@ class MainWindow(QMainWindow):
         self.show_reinforcement_table.setChecked(True)
         right_layout.addWidget(self.show_reinforcement_table)
         
+        # Canlı hesap: girişler değiştikçe sonuçlar güncellenir
+        self.live_check = QCheckBox("Canlı Hesap")
+        self.live_check.toggled.connect(self.schedule_live_calculation)
+        right_layout.addWidget(self.live_check)
+        
+        self.calc_worker = None
+        self.export_thread = None
+        self.last_results = None
+        self.request_id = 0
+        self.button_request_id = None
+        self.pending_3d_results = None
+        self.live_timer = QTimer(self)
+        self.live_timer.setSingleShot(True)
+        self.live_timer.setInterval(LIVE_DEBOUNCE_MS)
+        self.live_timer.timeout.connect(self.live_calculate)
+        for line_edit in (self.length_input, self.load_input, self.width_input, self.height_input):
+            line_edit.textChanged.connect(self.schedule_live_calculation)
+        for combo in (self.concrete_class, self.load_type, self.support_condition):
+            combo.currentIndexChanged.connect(self.schedule_live_calculation)
+        self.reinforcement_check.toggled.connect(self.schedule_live_calculation)
+        
         # Sol ve sağ layoutları ana layout'a ekle
         input_layout.addLayout(left_layout)
         input_layout.addLayout(right_layout)
@@ -276,6 +386,11 @@ class MainWindow(QMainWindow):
         self.btn_reset.clicked.connect(self.reset)
         button_layout.addWidget(self.btn_reset)
         
+        # Grafikleri kaydet butonu
+        self.btn_save_graphs = QPushButton("Grafikleri Kaydet")
+        self.btn_save_graphs.clicked.connect(self.save_graphs)
+        button_layout.addWidget(self.btn_save_graphs)
+        
         # Ayarlar Butonu
         self.btn_settings = QPushButton("Ayarlar")
         self.btn_settings.clicked.connect(self.show_settings)
@@ -323,12 +438,18 @@ class MainWindow(QMainWindow):
         graph_layout.addWidget(self.toolbar)
         graph_layout.addWidget(self.canvas)
         
+        # Kalıcı grafik eksenleri ve çizgileri (draw_graphs ilk çağrıda oluşturur)
+        self.discard_graphs()
+        self.canvas.mpl_connect('draw_event', self.on_graph_draw)
+        self.canvas.mpl_connect('resize_event', self.on_graph_resize)
+        
         # 3D görselleştirme sekmesi
         self.visualization_3d = Beam3DVisualization()
         
         # Sekmeleri ekle
         self.result_tabs.addTab(graph_widget, "2D Grafikler")
         self.result_tabs.addTab(self.visualization_3d, "3D Görünüm")
+        self.result_tabs.currentChanged.connect(self.apply_pending_3d)
         
         # Ana layout'a tab widget'ı ekle (mevcut graph_group yerine)
         main_layout.addWidget(result_group)
@@ -343,24 +464,54 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(central_widget)
 
     def save_graphs(self):
-        """Grafikleri kaydet"""
-        try:
-            # Zaman damgası oluştur
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            # Grafik dosya yolunu oluştur
-            filename = f"beam_graphs_{timestamp}.png"
-            filepath = os.path.join(self.graph_path, filename)
-            
-            # Grafikleri kaydet
-            self.figure.savefig(filepath, dpi=300, bbox_inches='tight')
-            
-            # Kullanıcıya bilgi ver
-            self.result_label.setText(f"{self.result_label.toPlainText()}\n\nGrafikler kaydedildi: {filepath}")
-            
-        except Exception as e:
-            print(f"Grafik kaydetme hatası: {str(e)}")
-            self.result_label.setText(f"{self.result_label.toPlainText()}\n\nGrafik kaydetme hatası: {str(e)}")
+        """Son sonucun grafiklerini arka planda PNG ve SVG olarak kaydet"""
+        if self.last_results is None or "x_values" not in self.last_results:
+            self.result_label.setText(f"{self.result_label.toPlainText()}\n\nKaydedilecek grafik yok.")
+            return
+        
+        # Zaman damgası oluştur
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.start_figure_export([self.last_results], self.graph_path, f"beam_graphs_{timestamp}",
+                                 formats=("png", "svg"), max_workers=1)
+    
+    def export_scenario_graphs(self, results):
+        """Her senaryo için bir grafik dosyasını paralel olarak üret"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        directory = os.path.join(self.graph_path, f"scenarios_{timestamp}")
+        self.start_figure_export([result for result in results if "x_values" in result], directory, "scenario")
+    
+    def start_figure_export(self, results, directory, prefix, formats=("png",), max_workers=None):
+        """Grafik dışa aktarma iş parçacığını başlatır; ilerleme çubuğunu günceller"""
+        if self.export_thread is not None and self.export_thread.isRunning():
+            self.result_label.setText(f"{self.result_label.toPlainText()}\n\nÖnceki grafik kaydı sürüyor.")
+            return
+        if not results:
+            return
+        
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+        self.export_thread = FigureExportThread(results, directory, prefix, formats, max_workers=max_workers)
+        self.export_thread.progress_update.connect(self.progress_bar.setValue)
+        self.export_thread.export_complete.connect(self.on_export_complete)
+        self.export_thread.export_error.connect(self.on_export_error)
+        self.export_thread.start()
+    
+    def on_export_complete(self, written):
+        """Kaydedilen dosyaları kullanıcıya bildir"""
+        self.progress_bar.setVisible(False)
+        if self.export_thread is not None and self.export_thread.cancel_event.is_set():
+            message = f"Grafik kaydı iptal edildi ({len(written)} grafik yazıldı)."
+        elif len(written) == 1:
+            message = f"Grafikler kaydedildi: {', '.join(written[0])}"
+        else:
+            message = f"{len(written)} grafik kaydedildi: {os.path.dirname(written[0][0])}"
+        self.result_label.setText(f"{self.result_label.toPlainText()}\n\n{message}")
+    
+    def on_export_error(self, error_message):
+        """Grafik kaydetme hatasını göster"""
+        self.progress_bar.setVisible(False)
+        print(f"Grafik kaydetme hatası: {error_message}")
+        self.result_label.setText(f"{self.result_label.toPlainText()}\n\nGrafik kaydetme hatası: {error_message}")
 
     def save_results_to_csv(self, results):
         """Hesaplama sonuçlarını CSV dosyasına kaydet"""
@@ -376,7 +527,8 @@ class MainWindow(QMainWindow):
                 ["Maksimum Moment", results["moment"], "kNm"],
                 ["Maksimum Kesme Kuvveti", results["shear"], "kN"],
                 ["Maksimum Sehim", results["max_deflection"]*1000, "mm"],  # m -> mm dönüşümü
-                ["Hesaplama Süresi", results.get("elapsed_time", 0), "saniye"]
+                ["Hesaplama Süresi", results.get("elapsed_time", 0),
+                 "saniye (önbellek)" if results.get("cached") else "saniye"]
             ]
             
             # Donatı sonuçları varsa ekle
@@ -396,6 +548,40 @@ class MainWindow(QMainWindow):
                         f"{option['count']} adet Ø{option['diameter']} mm",
                         f"Alan: {option['area']:.2f} mm², Aralık: {option['spacing']:.1f} mm"
                     ])
+                
+                # Etriye tasarımı varsa ekle
+                if "stirrups" in reinforcement:
+                    stirrups = reinforcement["stirrups"]
+                    data.append(["", "", ""])
+                    data.append(["Etriye Tasarımı", "", ""])
+                    data.append(["Sıklaştırma Bölgesi",
+                                 f"Ø{stirrups['dense_diameter']}/{stirrups['dense_spacing']:.0f}",
+                                 f"mm, {stirrups['dense_length']:.2f} m"])
+                    data.append(["Orta Bölge",
+                                 f"Ø{stirrups['normal_diameter']}/{stirrups['normal_spacing']:.0f}", "mm"])
+                    data.append(["Etriye Sayısı", stirrups["count"], "adet"])
+            
+            # Servis durumu kontrolleri varsa ekle
+            if "serviceability" in results:
+                serviceability = results["serviceability"]
+                data.append(["", "", ""])
+                data.append(["Servis Durumu Kontrolleri", "", ""])
+                data.append(["Donatı Gerilmesi", serviceability["steel_stress"], "MPa"])
+                data.append(["Çatlak Aralığı", serviceability["crack_spacing"], "mm"])
+                data.append(["Çatlak Genişliği", serviceability["crack_width"], "mm"])
+                data.append(["Çatlak Genişliği Kullanım Oranı", serviceability["crack_width_utilization"], ""])
+                data.append(["Donatı Gerilmesi Kullanım Oranı", serviceability["steel_stress_utilization"], ""])
+                data.append(["Servis Kontrolü", "Uygun" if serviceability["passed"] else "Uygun Değil", ""])
+            
+            # Tasarım kontrolleri varsa ekle
+            if "design_checks" in results:
+                design_checks = results["design_checks"]
+                data.append(["", "", ""])
+                data.append(["Tasarım Kontrolleri", "", ""])
+                for name, utilization in design_checks["utilization"].items():
+                    data.append([f"Kullanım Oranı ({name})", utilization, ""])
+                data.append(["Yönetici Kontrol", design_checks["governing_check"], ""])
+                data.append(["Tasarım Kontrolü", "Uygun" if design_checks["passed"] else "Uygun Değil", ""])
             
             # CSV dosyasını kaydet
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -428,6 +614,7 @@ class MainWindow(QMainWindow):
             
             concrete_class = self.concrete_class.currentText()
             load_type = self.load_type.currentText()
+            support_condition = self.support_condition.currentText()
             calc_reinforcement = self.reinforcement_check.isChecked()
             
             # Değerleri kontrol et
@@ -471,6 +658,7 @@ class MainWindow(QMainWindow):
                 "height": height,
                 "concrete_class": concrete_class,
                 "load_type": load_type,
+                "support_condition": support_condition,
                 "with_reinforcement": calc_reinforcement
             }
             
@@ -478,27 +666,107 @@ class MainWindow(QMainWindow):
             self.progress_bar.setVisible(True)
             self.progress_bar.setValue(0)
             
-            # Hesaplama thread'ini başlat
-            self.calc_thread = CalculationThread(params)
-            self.calc_thread.calculation_complete.connect(self.on_calculation_complete)
-            self.calc_thread.calculation_error.connect(self.on_calculation_error)
-            self.calc_thread.progress_update.connect(self.progress_bar.setValue)
-            self.calc_thread.start()
+            # İsteği kalıcı hesap iş parçacığına gönder (bekleyen istek varsa yerine geçer)
+            self.button_request_id = self.submit_calculation(params)
             
         except Exception as e:
             import traceback
             traceback.print_exc()  # Konsola detaylı hata mesajı yazdır
             self.result_label.setText(f"Beklenmeyen hata: {str(e)}")
 
+    def setup_graphs(self):
+        """
+        Moment, kesme ve sehim eksenlerini ve çizgilerini bir kez oluşturur.
+
+        Çizgiler "animated" işaretlidir: tam çizimde arka plan çizgisiz
+        kaydedilir (on_graph_draw) ve sonraki güncellemelerde eksen sınırları
+        değişmediyse yalnızca çizgiler bu arka planın üzerine basılır (blit).
+        """
+        self.figure.clear()
+        self.graph_axes = []
+        self.graph_lines = []
+        self.graph_series = []
+        for index, (title, ylabel, color, _) in enumerate(GRAPH_PANELS):
+            ax = self.figure.add_subplot(len(GRAPH_PANELS), 1, index + 1)
+            line, = ax.plot([], [], color=color, linewidth=2, animated=True)
+            ax.set_ylabel(ylabel, fontsize=10)
+            ax.set_title(title, fontsize=12)
+            ax.grid(True)
+            self.graph_axes.append(ax)
+            self.graph_lines.append(line)
+            self.graph_series.append(DecimatedLine(line))
+        self.graph_axes[-1].set_xlabel("Konum (m)", fontsize=10)
+        self.graph_background = None
+        
+        # Yerleşim yalnızca eksenler oluşturulurken ve tuval yeniden boyutlanınca hesaplanır
+        self.figure.tight_layout()
+    
+    def discard_graphs(self):
+        """Kalıcı grafik eksenlerini bırakır (şekil başka amaçla temizlendiğinde)"""
+        self.graph_axes = None
+        self.graph_lines = None
+        self.graph_series = None
+        self.graph_background = None
+    
+    def on_graph_draw(self, event):
+        """
+        Tam çizimden sonra çizgisiz arka planı kaydeder ve çizgileri üstüne basar.
+
+        Yalnızca bu tuvalin ekran çizimleri işlenir; savefig sırasında
+        atlanır, animated çizgileri dosyaya savefig kendisi çizer.
+        """
+        # savefig çizimleri (başka tuval ya da aynı tuvalde farklı dpi) ekran çizimi değildir
+        if not self.graph_lines or event.canvas is not self.canvas or self.canvas.is_saving():
+            return
+        self.graph_background = self.canvas.copy_from_bbox(self.figure.bbox)
+        for line in self.graph_lines:
+            line.axes.draw_artist(line)
+    
+    def on_graph_resize(self, event):
+        """Tuval boyutu değiştiğinde yerleşimi yeniden hesaplar"""
+        self.graph_background = None
+        if self.graph_axes:
+            self.figure.tight_layout()
+    
+    @staticmethod
+    def autoscale_graph(ax, x_values, y_values):
+        """
+        Eksen sınırlarını veriye göre ayarlar; değişiklik olduysa True döner.
+
+        x sınırı kiriş boyuna eşitlenir. y sınırı veri mevcut aralığın dışına
+        taştığında ya da aralığın yarısından küçük kaldığında %10 payla
+        yeniden hesaplanır; böylece benzer sonuçlarda sınırlar sabit kalır ve
+        yeniden çizim yerine blit yapılabilir.
+        """
+        changed = False
+        x_limits = (float(x_values[0]), float(x_values[-1]))
+        if x_limits[1] > x_limits[0] and not np.allclose(ax.get_xlim(), x_limits):
+            ax.set_xlim(*x_limits)
+            changed = True
+        
+        low, high = float(np.min(y_values)), float(np.max(y_values))
+        bottom, top = ax.get_ylim()
+        span = max(high - low, 1e-12 * max(abs(low), abs(high), 1.0))
+        if low < bottom or high > top or span < 0.5 * (top - bottom):
+            margin = 0.1 * span if high > low else max(abs(high), 1.0) * 0.1
+            ax.set_ylim(low - margin, high + margin)
+            changed = True
+        return changed
+
     def draw_graphs(self, results):
-        """Hesaplama sonuçlarına göre grafikleri çiz"""
+        """
+        Hesaplama sonuçlarına göre grafikleri çiz.
+
+        Eksenler ve çizgiler kalıcıdır; her hesapta yalnızca set_data ile
+        güncellenir. Eksen sınırları değişmediyse kayıtlı arka plan üzerine
+        blit yapılır, aksi halde tuval bir sonraki olay döngüsünde çizilir.
+        """
         try:
-            # Grafik alanını temizle
-            self.figure.clear()
-            
             # Dağılım verilerini kontrol et
             if "x_values" not in results or "moment_distribution" not in results:
                 # Dağılım verileri yoksa basit bir grafik göster
+                self.figure.clear()
+                self.discard_graphs()
                 ax = self.figure.add_subplot(111)
                 ax.bar(["Moment", "Kesme", "Sehim"], 
                        [results["moment"], results["shear"], results["max_deflection"]*1000])
@@ -507,42 +775,35 @@ class MainWindow(QMainWindow):
                 self.canvas.draw()
                 return
             
+            if not self.graph_lines:
+                self.setup_graphs()
+            
             # Dağılım verilerini al
-            x_values = results["x_values"]
-            moment_distribution = results["moment_distribution"]
-            shear_distribution = results["shear_distribution"]
-            deflection_distribution = results["deflection_distribution"]
-            
-            # Grafik boyutlarını ayarla - Daha büyük alt grafikler için
-            self.figure.subplots_adjust(hspace=0.4)  # Alt grafikler arası boşluğu artır
-            
-            # 3 grafik çiz: Moment, Kesme Kuvveti ve Sehim
-            ax1 = self.figure.add_subplot(311)
-            ax1.plot(x_values, moment_distribution, 'b-', linewidth=2)
-            ax1.set_ylabel("Moment (kNm)", fontsize=10)
-            ax1.set_title("Moment Diyagramı", fontsize=12)
-            ax1.grid(True)
-            
-            ax2 = self.figure.add_subplot(312)
-            ax2.plot(x_values, shear_distribution, 'r-', linewidth=2)
-            ax2.set_ylabel("Kesme Kuvveti (kN)", fontsize=10)
-            ax2.set_title("Kesme Kuvveti Diyagramı", fontsize=12)
-            ax2.grid(True)
-            
-            ax3 = self.figure.add_subplot(313)
-            ax3.plot(x_values, deflection_distribution, 'g-', linewidth=2)
-            ax3.set_xlabel("Konum (m)", fontsize=10)
-            ax3.set_ylabel("Sehim (mm)", fontsize=10)
-            ax3.set_title("Sehim Diyagramı", fontsize=12)
-            ax3.grid(True)
-            
-            # Grafiklerin arasındaki boşluğu ayarla
-            self.figure.tight_layout()
-            self.canvas.draw()
+            x_values = np.asarray(results["x_values"], dtype=float)
+            distributions = (results["moment_distribution"], results["shear_distribution"],
+                             results["deflection_distribution"])
+            
+            changed = False
+            for series, (_, _, _, scale), values in zip(self.graph_series, GRAPH_PANELS, distributions):
+                # Yoğun dağılımlar görünen aralığın piksel başına min/max zarfına indirgenir;
+                # sınırlar değişirse zarf xlim_changed ile yeniden hesaplanır
+                y_values = np.asarray(values, dtype=float) * scale
+                series.set_data(x_values, y_values)
+                changed |= self.autoscale_graph(series.line.axes, x_values, y_values)
+            
+            if changed or self.graph_background is None:
+                self.canvas.draw_idle()
+            else:
+                self.canvas.restore_region(self.graph_background)
+                for line in self.graph_lines:
+                    line.axes.draw_artist(line)
+                self.canvas.blit(self.figure.bbox)
             
         except Exception as e:
             print(f"Grafik çizme hatası: {str(e)}")
             # Hata durumunda basit bir mesaj göster
+            self.figure.clear()
+            self.discard_graphs()
             ax = self.figure.add_subplot(111)
             ax.text(0.5, 0.5, f"Grafik çizilemedi: {str(e)}", 
                     horizontalalignment='center', verticalalignment='center')
@@ -553,6 +814,19 @@ class MainWindow(QMainWindow):
         # İlerleme çubuğunu gizle
         self.progress_bar.setVisible(False)
         
+        self.show_results(results)
+        
+        # Sonuçları CSV'ye kaydet
+        self.save_results_to_csv(results)
+        
+        # Donatı sonuçları varsa ve tablo gösterilmek isteniyorsa
+        if "reinforcement" in results and hasattr(self, 'show_reinforcement_table') and self.show_reinforcement_table.isChecked():
+            self.show_reinforcement_results_table(results["reinforcement"])
+
+    def show_results(self, results, update_3d=True):
+        """Sonuç metnini, grafikleri ve (update_3d ise) 3D görünümü günceller"""
+        self.last_results = results
+        
         # Sonuçları göster
         moment = results["moment"]
         shear = results["shear"]
@@ -567,6 +841,7 @@ class MainWindow(QMainWindow):
         height = results.get("height", 0)
         concrete_class = results.get("concrete_class", "")
         load_type = results.get("load_type", "Tekil Yük")
+        support_condition = results.get("support_condition", "Basit Mesnetli")
         
         # Sonuç metnini oluştur - Parametreleri de ekle
         result_text = (
@@ -576,13 +851,15 @@ class MainWindow(QMainWindow):
             f"Genişlik: {width:.1f} cm\n"
             f"Yükseklik: {height:.1f} cm\n"
             f"Beton sınıfı: {concrete_class}\n"
-            f"Yük tipi: {load_type}\n\n"
+            f"Yük tipi: {load_type}\n"
+            f"Mesnet koşulu: {support_condition}\n\n"
             f"Hesaplama Sonuçları:\n"
             f"Maksimum Moment: {moment:.2f} kNm\n"
             f"Maksimum Kesme Kuvveti: {shear:.2f} kN\n"
             f"Maksimum Sehim: {max_deflection*1000:.2f} mm\n"
             f"Elastisite Modülü: {elasticity_modulus:.1f} GPa\n"
             f"Hesaplama Süresi: {elapsed_time:.6f} saniye"
+            f"{' (önbellekten)' if results.get('cached') else ''}"
         )
         
         # QTextEdit için setPlainText kullan
@@ -591,27 +868,114 @@ class MainWindow(QMainWindow):
         # Grafikleri çiz
         self.draw_graphs(results)
         
-        # 3D görselleştirmeyi güncelle
-        if hasattr(self, 'visualization_3d'):
-            self.visualization_3d.set_beam_data(
-                length=results["length"],
-                width=results["width"],
-                height=results["height"],
-                x_values=results.get("x_values"),
-                deflection=results.get("deflection_distribution"),
-                load_type=results.get("load_type", "Tekil Yük")
-            )
-            
-            # Donatı sonuçları varsa ekle
-            if "reinforcement" in results:
-                self.visualization_3d.set_reinforcement_data(results["reinforcement"])
-        
-        # Sonuçları CSV'ye kaydet
-        self.save_results_to_csv(results)
+        # 3D görselleştirmeyi güncelle (görünmüyorsa sekme açılınca)
+        self.pending_3d_results = None if update_3d else results
+        if update_3d and hasattr(self, 'visualization_3d'):
+            self.update_3d_view(results)
+
+    def update_3d_view(self, results):
+        """Sonuçları 3D görünüme aktarır"""
+        self.visualization_3d.set_beam_data(
+            length=results["length"],
+            width=results["width"],
+            height=results["height"],
+            x_values=results.get("x_values"),
+            deflection=results.get("deflection_distribution"),
+            load_type=results.get("load_type", "Tekil Yük"),
+            moment_distribution=results.get("moment_distribution"),
+            shear_distribution=results.get("shear_distribution")
+        )
         
-        # Donatı sonuçları varsa ve tablo gösterilmek isteniyorsa
-        if "reinforcement" in results and hasattr(self, 'show_reinforcement_table') and self.show_reinforcement_table.isChecked():
-            self.show_reinforcement_results_table(results["reinforcement"])
+        # Donatı sonuçları varsa ekle
+        if "reinforcement" in results:
+            self.visualization_3d.set_reinforcement_data(results["reinforcement"])
+
+    def schedule_live_calculation(self, *args):
+        """Canlı mod açıksa hesabı son düzenlemeden LIVE_DEBOUNCE_MS sonraya erteler"""
+        if self.live_check.isChecked():
+            self.live_timer.start()
+        else:
+            self.live_timer.stop()
+    
+    def read_live_params(self):
+        """Girişleri uyarı göstermeden okur; geçersizse None döndürür"""
+        try:
+            length, load, width, height = (float(line_edit.text().replace(',', '.')) for line_edit in
+                                           (self.length_input, self.load_input, self.width_input, self.height_input))
+        except ValueError:
+            return None
+        if min(length, load, width, height) <= 0 or length > 100 or width > 1000 or height > 1000:
+            return None
+        return {
+            "length": length,
+            "load": load,
+            "width": width,
+            "height": height,
+            "concrete_class": self.concrete_class.currentText(),
+            "load_type": self.load_type.currentText(),
+            "support_condition": self.support_condition.currentText(),
+            "with_reinforcement": self.reinforcement_check.isChecked()
+        }
+    
+    def live_calculate(self):
+        """Güncel girişleri kalıcı hesap iş parçacığına gönderir"""
+        params = self.read_live_params()
+        if params is not None:
+            self.submit_calculation(params)
+    
+    def submit_calculation(self, params):
+        """
+        İsteği kalıcı hesap iş parçacığına gönderir ve istek kimliğini döndürür.
+
+        İş parçacığı ilk istekte başlatılır ve pencere kapanana kadar yaşar.
+        """
+        if self.calc_worker is None:
+            self.calc_worker = CalculationWorker()
+            self.calc_worker.calculation_complete.connect(self.on_worker_result)
+            self.calc_worker.calculation_error.connect(self.on_worker_error)
+            self.calc_worker.progress_update.connect(self.progress_bar.setValue)
+            self.calc_worker.start()
+        self.request_id = self.calc_worker.submit(params)
+        return self.request_id
+    
+    def on_worker_result(self, results):
+        """Hesap sonucunu isteğin kaynağına göre gösterir; bayat sonuçlar atılır"""
+        if results.get("request_id") != self.request_id:
+            return
+        if results["request_id"] == self.button_request_id:
+            self.on_calculation_complete(results)
+        elif self.live_check.isChecked():
+            self.progress_bar.setVisible(False)
+            self.show_results(results, update_3d=self.result_tabs.currentWidget() is self.visualization_3d)
+    
+    def on_worker_error(self, request_id, error_message):
+        """Hesap hatasını gösterir: düğme isteğinde iletişim kutusu, canlı modda sonuç alanı"""
+        if request_id != self.request_id:
+            return
+        if request_id == self.button_request_id:
+            self.on_calculation_error(error_message)
+        else:
+            self.progress_bar.setVisible(False)
+            self.result_label.setPlainText(f"Hata: {error_message}")
+    
+    def apply_pending_3d(self, index):
+        """3D sekmesi açıldığında bekleyen canlı sonucu 3D görünüme uygular"""
+        if self.pending_3d_results is None or self.result_tabs.widget(index) is not self.visualization_3d:
+            return
+        results, self.pending_3d_results = self.pending_3d_results, None
+        self.update_3d_view(results)
+    
+    def closeEvent(self, event):
+        """Pencere kapanırken hesap iş parçacığını durdur"""
+        self.live_timer.stop()
+        if self.calc_worker is not None:
+            self.calc_worker.stop()
+            self.calc_worker = None
+        if self.export_thread is not None:
+            # Süren toplu dışa aktarma iptal edilir; yalnızca çalışan parçalar beklenir
+            self.export_thread.cancel()
+            self.export_thread.wait()
+        super().closeEvent(event)
 
     def on_calculation_error(self, error_message):
         """Hesaplama hatası durumunda"""
@@ -677,6 +1041,8 @@ class MainWindow(QMainWindow):
         
         # Grafikleri temizle
         self.figure.clear()
+        self.discard_graphs()
+        self.last_results = None
         self.canvas.draw()
         
         # 3D görselleştirmeyi sıfırla
@@ -704,6 +1070,7 @@ class MainWindow(QMainWindow):
             
             concrete_class = self.concrete_class.currentText()
             load_type = self.load_type.currentText()  # Yük tipini al
+            support_condition = self.support_condition.currentText()
             
             # Değerlerin mantıklı aralıkta olduğunu kontrol et
             if length <= 0 or load <= 0 or width <= 0 or height <= 0:
@@ -711,7 +1078,7 @@ class MainWindow(QMainWindow):
                 return
             
             # Moment hesapla (yük tipini ilet)
-            moment = calculate_moment(load, length, load_type)
+            moment = calculate_moment(load, length, load_type, support_condition)
             
             # Değerleri konsola yazdır (debug için)
             print(f"Donatı hesabı parametreleri:")
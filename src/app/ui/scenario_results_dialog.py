@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout,
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import numpy as np
+from src.core.utils.decimation import DecimatedLine
 
 class ScenarioResultsDialog(QDialog):
     def __init__(self, results, parent=None):
@@ -39,6 +40,13 @@ class ScenarioResultsDialog(QDialog):
         
         # Butonlar
         button_layout = QHBoxLayout()
+        
+        # Her senaryo için grafik dosyası (dışa aktarma ana pencerede arka planda yapılır)
+        if hasattr(self.parent(), "export_scenario_graphs"):
+            export_button = QPushButton("Grafikleri Dışa Aktar")
+            export_button.clicked.connect(lambda: self.parent().export_scenario_graphs(self.results))
+            button_layout.addWidget(export_button)
+        
         close_button = QPushButton("Kapat")
         close_button.clicked.connect(self.close)
         button_layout.addWidget(close_button)
@@ -87,29 +95,31 @@ class ScenarioResultsDialog(QDialog):
         moments = [r['moment'] for r in self.results]
         shears = [r['shear'] for r in self.results]
         deflections = [r['max_deflection']*1000 for r in self.results]  # mm cinsinden
+        area_lengths = [r['length'] for r in self.results if 'reinforcement' in r]
         areas = [r['reinforcement']['required_area'] for r in self.results if 'reinforcement' in r]
         
-        # Grafikleri çiz
-        ax1.plot(lengths, moments, 'b-')
+        # Grafikleri çiz (çok sayıda senaryo piksel başına min/max zarfına indirgenir)
+        self.plot_series = []
+        self.plot_series_line(ax1, lengths, moments, 'b-')
         ax1.set_title('Maksimum Moment')
         ax1.set_xlabel('Kiriş Uzunluğu (m)')
         ax1.set_ylabel('Moment (kNm)')
         ax1.grid(True)
         
-        ax2.plot(lengths, shears, 'r-')
+        self.plot_series_line(ax2, lengths, shears, 'r-')
         ax2.set_title('Maksimum Kesme')
         ax2.set_xlabel('Kiriş Uzunluğu (m)')
         ax2.set_ylabel('Kesme Kuvveti (kN)')
         ax2.grid(True)
         
-        ax3.plot(lengths, deflections, 'g-')
+        self.plot_series_line(ax3, lengths, deflections, 'g-')
         ax3.set_title('Maksimum Sehim')
         ax3.set_xlabel('Kiriş Uzunluğu (m)')
         ax3.set_ylabel('Sehim (mm)')
         ax3.grid(True)
         
         if areas:  # Donatı hesabı yapıldıysa
-            ax4.plot(lengths, areas, 'm-')
+            self.plot_series_line(ax4, area_lengths, areas, 'm-')
             ax4.set_title('Gerekli Donatı Alanı')
             ax4.set_xlabel('Kiriş Uzunluğu (m)')
             ax4.set_ylabel('Donatı Alanı (mm²)')
@@ -117,4 +127,20 @@ class ScenarioResultsDialog(QDialog):
         
         fig.tight_layout()
         canvas = FigureCanvas(fig)
-        return canvas 
\ No newline at end of file
+        return canvas
+    
+    def plot_series_line(self, ax, x_values, y_values, style):
+        """Seriyi uzunluğa göre sıralı, indirgenmiş ve yakınlaştırmada yenilenen bir çizgiyle çizer"""
+        line, = ax.plot([], [], style)
+        series = DecimatedLine(line)
+        if len(x_values):
+            low, high = min(x_values), max(x_values)
+            if high > low:
+                ax.set_xlim(low, high)
+            else:
+                ax.set_xlim(low - 0.5, high + 0.5)
+        series.set_data(x_values, y_values)
+        ax.relim()
+        ax.autoscale_view(scalex=False)
+        self.plot_series.append(series)
+        return series 
\ No newline at end of file
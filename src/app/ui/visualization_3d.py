@@ -1,16 +1,166 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                            QSlider, QLabel, QComboBox, QGroupBox, QGridLayout, QSizePolicy)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d import Axes3D
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection, Line3DCollection
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import cm
 from matplotlib.animation import FuncAnimation
+from collections import OrderedDict, deque
+import time
+
+# Animasyon kare sayısı ve kareler arası süre (ms, 20 FPS hedef)
+ANIMATION_FRAMES = 50
+ANIMATION_INTERVAL = 50
+
+# Önbellekte tutulan en fazla ağ/renk dizisi sayısı
+GEOMETRY_CACHE_SIZE = 8
+
+# Ayrıntı düzeyi: etkileşim sırasında kaba ağ (boyuna × genişlik noktası), tam
+# çözünürlükte metre başına nokta sayısı (tuval genişliğiyle sınırlı) ve
+# etkileşim bittikten sonra tam çizime kadar beklenen süre (ms)
+LOD_COARSE_RESOLUTION = (20, 5)
+LOD_POINTS_PER_METER = 20
+LOD_PIXELS_PER_SEGMENT = 4
+LOD_DEBOUNCE_MS = 250
+MESH_WIDTH_POINTS = 30
+
+def build_beam_mesh(x_values, width, height, deflection=None, n_width=30, sides=True):
+    """
+    Kiriş yüzey ağını dörtgen köşe dizileri olarak tek adımda oluşturur.
+
+    Alt ve üst yüzeyler (n_width - 1) × (len(x_values) - 1) dörtgenden,
+    istenirse ön/arka yan yüzeyler x aralığı başına birer ve uç yüzeyler
+    genişlik aralığı başına birer dörtgenden oluşur. Köşe noktaları
+    deformasyonsuzdur; deformasyonlu ağ vertices[..., 2] += ölçek·deflection
+    ile elde edilir.
+
+    Args:
+        x_values: Kiriş boyunca noktalar (m)
+        width: Kesit genişliği (cm)
+        height: Kesit yüksekliği (cm)
+        deflection (optional): x_values noktalarındaki sehim (m)
+        n_width (int): Genişlik boyunca nokta sayısı
+        sides (bool): Yan ve uç yüzeyler de oluşturulsun mu
+
+    Returns:
+        dict: "vertices" (n, 4, 3), birim ölçekte köşe düşey yer
+            değiştirmeleri "deflection" (n, 4, cm), her yüzün x aralığı
+            "segment" (n,) ve alt/üst yüzey maskesi "surface" (n,)
+    """
+    x = np.asarray(x_values, dtype=float)
+    y = np.linspace(-width/2, width/2, n_width)
+    d = np.zeros_like(x) if deflection is None or len(deflection) == 0 else np.asarray(deflection, dtype=float) * 100
+    nx, ny = len(x) - 1, n_width - 1
+
+    # Alt ve üst yüzeyler: köşe sırası (x_i, y_j), (x_i+1, y_j), (x_i+1, y_j+1), (x_i, y_j+1)
+    xs = np.stack([x[:-1], x[1:], x[1:], x[:-1]], axis=-1)
+    ds = np.stack([d[:-1], d[1:], d[1:], d[:-1]], axis=-1)
+    ys = np.stack([y[:-1], y[:-1], y[1:], y[1:]], axis=-1)
+    grid_x = np.broadcast_to(xs, (ny, nx, 4)).reshape(-1, 4)
+    grid_y = np.broadcast_to(ys[:, None, :], (ny, nx, 4)).reshape(-1, 4)
+    grid_d = np.broadcast_to(ds, (ny, nx, 4)).reshape(-1, 4)
+    grid_segment = np.broadcast_to(np.arange(nx), (ny, nx)).ravel()
+
+    parts = [(grid_x, grid_y, np.full(grid_x.shape, -height/2), grid_d, grid_segment),
+             (grid_x, grid_y, np.full(grid_x.shape, height/2), grid_d, grid_segment)]
+    if sides:
+        # Ön ve arka yan yüzeyler (y = ∓b/2)
+        side_z = np.broadcast_to([-height/2, -height/2, height/2, height/2], (nx, 4))
+        for y_side in (y[0], y[-1]):
+            parts.append((xs, np.full(xs.shape, y_side), side_z, ds, np.arange(nx)))
+        # Sol ve sağ uç yüzeyler
+        end_y = np.stack([y[:-1], y[1:], y[1:], y[:-1]], axis=-1)
+        end_z = np.broadcast_to([-height/2, -height/2, height/2, height/2], (ny, 4))
+        for index, segment in ((0, 0), (-1, nx - 1)):
+            parts.append((np.full(end_y.shape, x[index]), end_y, end_z, np.full(end_y.shape, d[index]),
+                          np.full(ny, segment)))
+
+    vertices = np.concatenate([np.stack(np.broadcast_arrays(px, py, pz), axis=-1) for px, py, pz, _, _ in parts])
+    surface = np.zeros(len(vertices), dtype=bool)
+    surface[:2 * nx * ny] = True
+    return {
+        "vertices": vertices.astype(float),
+        "deflection": np.concatenate([np.broadcast_to(pd, px.shape) for px, _, _, pd, _ in parts]),
+        "segment": np.concatenate([ps for _, _, _, _, ps in parts]),
+        "surface": surface
+    }
+
+def build_reinforcement_lines(length, width, height, count, diameter, stirrup_positions, cover=5,
+                              hook_length=5, n_circles=10, n_theta=20):
+    """
+    Boyuna donatı ve etriye çizgilerini tek adımda NumPy çizgi dizileri olarak oluşturur.
+
+    Boyuna donatılar ve üzerlerindeki kesit halkaları aynı uzunlukta
+    (n_theta noktalı) çoklu çizgiler olarak, etriyelerin dört kenarı ve iki
+    kancası ise iki noktalı doğru parçaları olarak döndürülür; böylece her
+    malzeme tek bir Line3DCollection ile çizilebilir.
+
+    Args:
+        length: Kiriş uzunluğu (m)
+        width: Kesit genişliği (cm)
+        height: Kesit yüksekliği (cm)
+        count (int): Donatı adedi
+        diameter: Donatı çapı (cm)
+        stirrup_positions: Etriye konumları (m)
+        cover: Paspayı (cm)
+        hook_length: Etriye kanca boyu (cm)
+        n_circles (int): Donatı başına kesit halkası sayısı
+        n_theta (int): Halka ve çubuk çizgisi nokta sayısı
+
+    Returns:
+        dict: "bars" (çubuklar ve halkalar, (m, n_theta, 3)), "bar_widths"
+            (m,) ve "stirrups" (etriye doğru parçaları, (6·s, 2, 3))
+    """
+    z_bottom = -height/2 + cover
+    z_top = height/2 - cover
+    y_edge = width/2 - cover
+    
+    # Donatı yerleşimi: en fazla 6 çubuk gösterilir
+    if count <= 2:
+        y_positions = np.array([0.0])
+    else:
+        y_positions = np.linspace(-(width - 2 * cover)/2, (width - 2 * cover)/2, min(count, 6))
+    n_bars = len(y_positions)
+    
+    # Çubuk çizgileri
+    bars = np.empty((n_bars, n_theta, 3))
+    bars[..., 0] = np.linspace(0, length, n_theta)
+    bars[..., 1] = y_positions[:, None]
+    bars[..., 2] = z_bottom
+    
+    # Kesit halkaları (çubuk × halka konumu × açı)
+    theta = np.linspace(0, 2*np.pi, n_theta)
+    radius = diameter / 2
+    circle_x = np.linspace(0.1, length - 0.1, n_circles)
+    circles = np.empty((n_bars, n_circles, n_theta, 3))
+    circles[..., 0] = circle_x[None, :, None]
+    circles[..., 1] = y_positions[:, None, None] + radius * np.cos(theta)
+    circles[..., 2] = z_bottom + radius * np.sin(theta)
+    
+    # Etriyeler: dört kenar ve iki kanca, her biri iki noktalı doğru parçası
+    corners_y = np.array([-y_edge, y_edge, y_edge, -y_edge, -y_edge, y_edge])
+    corners_z = np.array([z_bottom, z_bottom, z_top, z_top, z_bottom, z_bottom])
+    end_index = [1, 2, 3, 0, 4, 5]
+    segment_y = np.stack([corners_y, corners_y[end_index]], axis=-1)
+    segment_z = np.stack([corners_z, corners_z[end_index]], axis=-1)
+    segment_z[4:, 1] += hook_length
+    positions = np.asarray(stirrup_positions, dtype=float)
+    stirrups = np.empty((len(positions), 6, 2, 3))
+    stirrups[..., 0] = positions[:, None, None]
+    stirrups[..., 1] = segment_y
+    stirrups[..., 2] = segment_z
+    
+    return {
+        "bars": np.concatenate([bars, circles.reshape(-1, n_theta, 3)]),
+        "bar_widths": np.concatenate([np.full(n_bars, diameter * 2), np.full(n_bars * n_circles, 2.0)]),
+        "stirrups": stirrups.reshape(-1, 2, 3)
+    }
 
 class Beam3DVisualization(QWidget):
     """Kiriş için 3D görselleştirme widget'ı"""
@@ -137,6 +287,17 @@ class Beam3DVisualization(QWidget):
         self.save_button.setStyleSheet(button_style)
         options_layout.addWidget(self.save_button, 4, 0, 1, 2)
         
+        # Animasyonun gerçekleşen kare hızı
+        self.fps_label = QLabel("")
+        options_layout.addWidget(self.fps_label, 5, 1)
+        
+        # Ayrıntı düzeyi: etkileşim sırasında kaba ağ göster
+        self.lod_button = QPushButton("Hızlı Etkileşim")
+        self.lod_button.setCheckable(True)
+        self.lod_button.setChecked(True)
+        self.lod_button.setStyleSheet(button_style)
+        options_layout.addWidget(self.lod_button, 5, 0)
+        
         # Kontrol grid'ine grupları ekle
         control_grid.addWidget(view_group, 0, 0)
         control_grid.addWidget(options_group, 0, 1)
@@ -150,6 +311,20 @@ class Beam3DVisualization(QWidget):
         self.beam_data = None
         self.reinforcement_data = None
         
+        # Kiriş verisine bağlı ağ ve renk dizileri önbelleği
+        self.geometry_cache = OrderedDict()
+        
+        # Ayrıntı düzeyi durumu: etkileşim bitince tam çözünürlüklü çizim ertelenmiş zamanlayıcıyla yapılır
+        self.beam_mesh = None
+        self.lod_coarse = False
+        self.lod_full_update = False
+        self.lod_timer = QTimer(self)
+        self.lod_timer.setSingleShot(True)
+        self.lod_timer.setInterval(LOD_DEBOUNCE_MS)
+        self.lod_timer.timeout.connect(self.finish_interaction)
+        self.canvas.mpl_connect('button_press_event', self.on_mouse_press)
+        self.canvas.mpl_connect('button_release_event', self.on_mouse_release)
+        
         # Animasyon için değişkenler
         self.animation = None
         self.is_animating = False
@@ -206,9 +381,70 @@ class Beam3DVisualization(QWidget):
     def update_scale_label(self, value):
         """Ölçek değeri etiketini güncelle"""
         self.scale_value.setText(f"{value/10:.1f}")
-        self.update_visualization()
+        if self.lod_active():
+            # Kaydırma sırasında kaba ağ; tam çizim kaydırma durduktan sonra
+            self.lod_full_update = True
+            self.render_mesh_level(coarse=True)
+            self.lod_timer.start()
+        else:
+            self.update_visualization()
+    
+    def lod_active(self):
+        """Ayrıntı düzeyi modu kullanılabilir mi (statik görünüm çizilmiş ve animasyon yok)"""
+        return (self.lod_button.isChecked() and self.beam_data is not None and not self.is_animating
+                and self.beam_mesh is not None and self.beam_mesh in self.ax.collections)
+    
+    def on_mouse_press(self, event):
+        """3D görünüm döndürülmeye başlarken kaba ağa geç"""
+        if event.inaxes is self.ax and self.lod_active():
+            self.lod_timer.stop()
+            self.render_mesh_level(coarse=True)
+    
+    def on_mouse_release(self, event):
+        """Döndürme bittiğinde tam çözünürlüklü çizimi ertele"""
+        if self.lod_coarse and self.lod_active():
+            self.lod_timer.start()
+    
+    def finish_interaction(self):
+        """Etkileşim bittikten sonra tam çözünürlüklü görünüme dön"""
+        if self.beam_data is None:
+            return
+        if self.lod_full_update or not self.lod_active():
+            # Ölçeğe bağlı çizgi ve etiketler de güncellenmeli
+            self.lod_full_update = False
+            self.update_visualization()
+        else:
+            self.render_mesh_level(coarse=False)
+    
+    def mesh_resolution(self, coarse=False):
+        """
+        Ağ çözünürlüğü (boyuna nokta, genişlik noktası).
+
+        Kaba düzeyde LOD_COARSE_RESOLUTION kullanılır; tam çözünürlükte boyuna
+        nokta sayısı kiriş boyuyla artar ve tuval genişliğinde
+        LOD_PIXELS_PER_SEGMENT pikselden sık olmayacak şekilde sınırlanır.
+        """
+        if coarse:
+            return LOD_COARSE_RESOLUTION
+        max_points = max(self.canvas.width() // LOD_PIXELS_PER_SEGMENT, LOD_COARSE_RESOLUTION[0])
+        n_length = int(np.clip(round(self.beam_data['length'] * LOD_POINTS_PER_METER),
+                               LOD_COARSE_RESOLUTION[0], max_points))
+        return n_length, MESH_WIDTH_POINTS
     
-    def set_beam_data(self, length, width, height, x_values=None, deflection=None, load_type=None):
+    def render_mesh_level(self, coarse):
+        """Eksenleri temizlemeden mevcut kiriş ağı koleksiyonunu kaba veya tam ağla günceller"""
+        stress_type = self.stress_combo.currentText()
+        n_length, n_width = self.mesh_resolution(coarse)
+        key = (n_width, stress_type != "Gösterme", n_length)
+        mesh = self.get_mesh(*key)
+        vertices = self.deformed_vertices(mesh, self.scale_slider.value() / 10.0)
+        self.beam_mesh.set_verts(vertices)
+        self.beam_mesh.set_facecolor(self.mesh_face_colors(mesh, vertices, stress_type, key))
+        self.lod_coarse = coarse
+        self.canvas.draw_idle()
+    
+    def set_beam_data(self, length, width, height, x_values=None, deflection=None, load_type=None,
+                      moment_distribution=None, shear_distribution=None):
         """Kiriş verilerini ayarla"""
         self.beam_data = {
             'length': length,
@@ -218,6 +454,13 @@ class Beam3DVisualization(QWidget):
             'deflection': deflection if deflection is not None else np.zeros(100),
             'load_type': load_type
         }
+        if moment_distribution is not None:
+            self.beam_data['moment_distribution'] = moment_distribution
+        if shear_distribution is not None:
+            self.beam_data['shear_distribution'] = shear_distribution
+        
+        # Yeni veri geldiğinde önbellekteki ağlar geçersizdir
+        self.geometry_cache.clear()
         self.update_visualization()
     
     def set_reinforcement_data(self, reinforcement_data):
@@ -239,6 +482,74 @@ class Beam3DVisualization(QWidget):
         # Veri değişkenlerini sıfırla
         self.beam_data = None
         self.reinforcement_data = None
+        self.geometry_cache.clear()
+    
+    def cached(self, key, factory):
+        """
+        Kiriş verisine bağlı bir diziyi önbellekten döndürür, yoksa factory ile oluşturur.
+
+        Önbellek en son kullanılana göre sıralıdır ve GEOMETRY_CACHE_SIZE
+        girdiyi aşınca en eski girdi atılır; set_beam_data önbelleği boşaltır.
+        """
+        if key in self.geometry_cache:
+            self.geometry_cache.move_to_end(key)
+            return self.geometry_cache[key]
+        value = factory()
+        self.geometry_cache[key] = value
+        if len(self.geometry_cache) > GEOMETRY_CACHE_SIZE:
+            self.geometry_cache.popitem(last=False)
+        return value
+    
+    def get_mesh(self, n_width=MESH_WIDTH_POINTS, sides=True, n_length=None):
+        """
+        Deformasyonsuz kiriş ağını, birim sehim alanını ve köşe tamponlarını önbellekten döndür.
+
+        n_length verilir ve veri noktası sayısından farklıysa sehim n_length
+        eşit aralıklı noktaya doğrusal olarak yeniden örneklenir.
+        """
+        def factory():
+            x_values = np.asarray(self.beam_data['x_values'], dtype=float)
+            deflection = np.asarray(self.beam_data['deflection'], dtype=float)
+            if len(deflection) != len(x_values):
+                deflection = np.zeros_like(x_values)
+            if n_length is not None and n_length != len(x_values):
+                mesh_x = np.linspace(x_values[0], x_values[-1], n_length)
+                deflection = np.interp(mesh_x, x_values, deflection)
+                x_values = mesh_x
+            mesh = build_beam_mesh(x_values, self.beam_data['width'], self.beam_data['height'],
+                                   deflection, n_width, sides)
+            mesh["x_values"] = x_values
+            mesh["buffer"] = mesh["vertices"].copy()
+            mesh["scaled"] = np.empty_like(mesh["deflection"])
+            return mesh
+        return self.cached(("mesh", n_width, sides, n_length), factory)
+    
+    def deformed_vertices(self, mesh, scale_factor):
+        """Ölçeklenmiş sehimi taban ağa önceden ayrılmış tamponlarda ekler (yeni dizi oluşturmaz)"""
+        np.multiply(mesh["deflection"], scale_factor, out=mesh["scaled"])
+        np.add(mesh["vertices"][..., 2], mesh["scaled"], out=mesh["buffer"][..., 2])
+        return mesh["buffer"]
+    
+    def get_stress_colors(self, stress_type, mesh_key, segment, mesh_x=None):
+        """Gerilme türüne göre yüz renklerini önbellekten döndür (gerekirse ağ noktalarına örnekleyerek)"""
+        def factory():
+            key = 'moment_distribution' if stress_type == "Moment" else 'shear_distribution'
+            x_values = self.beam_data['x_values']
+            stress_values = np.asarray(self.beam_data.get(key, np.zeros_like(x_values)), dtype=float)
+            if mesh_x is not None and len(mesh_x) != len(stress_values):
+                stress_values = np.interp(mesh_x, x_values, stress_values)
+            peak = np.max(np.abs(stress_values))
+            norm_stress = stress_values / peak if peak > 0 else np.zeros_like(stress_values)
+            return plt.cm.jet(0.5 + 0.5 * norm_stress)[segment]
+        return self.cached(("stress", stress_type) + mesh_key, factory)
+    
+    def mesh_face_colors(self, mesh, vertices, stress_type, mesh_key):
+        """Gerilme görünümünde gerilme renkleri, normal görünümde yüz ortalama kotuna göre renkler"""
+        if stress_type != "Gösterme":
+            return self.get_stress_colors(stress_type, mesh_key, mesh["segment"], mesh["x_values"])
+        face_z = vertices[..., 2].mean(axis=1)
+        span = np.ptp(face_z)
+        return cm.viridis((face_z - face_z.min()) / span if span > 0 else np.zeros_like(face_z))
     
     def update_visualization(self):
         """Görselleştirmeyi güncelle"""
@@ -259,19 +570,6 @@ class Beam3DVisualization(QWidget):
         # Deformasyon ölçeği
         scale_factor = self.scale_slider.value() / 10.0
         
-        # Kiriş mesh'i oluştur
-        X, Y = np.meshgrid(x_values, np.linspace(-width/2, width/2, 30))
-        Z_bottom = np.zeros_like(X) - height/2
-        Z_top = np.zeros_like(X) + height/2
-        
-        # Deformasyonu ekle
-        if deflection is not None and len(deflection) > 0:
-            # Deformasyonu y ekseni boyunca tekrarla
-            deflection_2d = np.tile(deflection, (Y.shape[0], 1))
-            # Ölçeklendir ve uygula
-            Z_bottom = Z_bottom + deflection_2d * scale_factor * 100  # cm'ye çevir
-            Z_top = Z_top + deflection_2d * scale_factor * 100  # cm'ye çevir
-        
         # Gerilme dağılımı
         stress_type = self.stress_combo.currentText()
         stress_values = None
@@ -284,122 +582,40 @@ class Beam3DVisualization(QWidget):
             else:  # Kesme Kuvveti
                 stress_values = self.beam_data.get('shear_distribution', np.zeros_like(x_values))
                 stress_label = "Kesme Kuvveti (kN)"
-            
-            # Normalize edilmiş gerilme değerleri (renk haritası için)
-            if np.max(np.abs(stress_values)) > 0:
-                norm_stress = stress_values / np.max(np.abs(stress_values))
-            else:
-                norm_stress = np.zeros_like(stress_values)
+        
+        # Önbellekteki ağa ölçeklenmiş deformasyonu uygula
+        n_length, n_width = self.mesh_resolution()
+        mesh_key = (n_width, stress_values is not None, n_length)
+        mesh = self.get_mesh(*mesh_key)
+        vertices = self.deformed_vertices(mesh, scale_factor)
+        colors = self.mesh_face_colors(mesh, vertices, stress_type, mesh_key)
+        self.lod_coarse = False
+        
+        # Çerçeve ve kesit çizgileri için alt/üst kenar kotları
+        d_cm = np.zeros_like(x_values) if deflection is None or len(deflection) == 0 else deflection * (scale_factor * 100)
+        z_bottom = d_cm - height/2
+        z_top = d_cm + height/2
         
         # Kiriş yüzeylerini çiz
         y_min, y_max = -width/2, width/2
         
         if stress_values is not None:
-            # Gerilme renklerini uygula
-            stress_colors = plt.cm.jet(0.5 + 0.5 * norm_stress)
-            
-            # Kiriş yüzeylerini gerilme renkleriyle çiz
-            for i in range(len(x_values)-1):
-                x = x_values[i]
-                x_next = x_values[i+1]
-                color = stress_colors[i]
-                
-                # Alt ve üst yüzeyler
-                for j in range(Y.shape[0]-1):
-                    y = Y[j, 0]
-                    y_next = Y[j+1, 0]
-                    
-                    # Alt yüzey
-                    verts_bottom = [
-                        (x, y, Z_bottom[j, i]),
-                        (x_next, y, Z_bottom[j, i+1]),
-                        (x_next, y_next, Z_bottom[j+1, i+1]),
-                        (x, y_next, Z_bottom[j+1, i])
-                    ]
-                    poly_bottom = Poly3DCollection([verts_bottom], alpha=0.7)
-                    poly_bottom.set_facecolor(color)
-                    self.ax.add_collection3d(poly_bottom)
-                    
-                    # Üst yüzey
-                    verts_top = [
-                        (x, y, Z_top[j, i]),
-                        (x_next, y, Z_top[j, i+1]),
-                        (x_next, y_next, Z_top[j+1, i+1]),
-                        (x, y_next, Z_top[j+1, i])
-                    ]
-                    poly_top = Poly3DCollection([verts_top], alpha=0.7)
-                    poly_top.set_facecolor(color)
-                    self.ax.add_collection3d(poly_top)
-                
-                # Yan yüzeyler (ön ve arka)
-                verts_front = [
-                    (x, y_min, Z_bottom[0, i]),
-                    (x_next, y_min, Z_bottom[0, i+1]),
-                    (x_next, y_min, Z_top[0, i+1]),
-                    (x, y_min, Z_top[0, i])
-                ]
-                poly_front = Poly3DCollection([verts_front], alpha=0.7)
-                poly_front.set_facecolor(color)
-                self.ax.add_collection3d(poly_front)
-                
-                verts_back = [
-                    (x, y_max, Z_bottom[-1, i]),
-                    (x_next, y_max, Z_bottom[-1, i+1]),
-                    (x_next, y_max, Z_top[-1, i+1]),
-                    (x, y_max, Z_top[-1, i])
-                ]
-                poly_back = Poly3DCollection([verts_back], alpha=0.7)
-                poly_back.set_facecolor(color)
-                self.ax.add_collection3d(poly_back)
-            
-            # Sol ve sağ yan yüzeyler
-            left_color = stress_colors[0]
-            right_color = stress_colors[-1]
-            
-            for j in range(Y.shape[0]-1):
-                y = Y[j, 0]
-                y_next = Y[j+1, 0]
-                
-                # Sol yüzey
-                verts_left = [
-                    (x_values[0], y, Z_bottom[j, 0]),
-                    (x_values[0], y_next, Z_bottom[j+1, 0]),
-                    (x_values[0], y_next, Z_top[j+1, 0]),
-                    (x_values[0], y, Z_top[j, 0])
-                ]
-                poly_left = Poly3DCollection([verts_left], alpha=0.7)
-                poly_left.set_facecolor(left_color)
-                self.ax.add_collection3d(poly_left)
-                
-                # Sağ yüzey
-                verts_right = [
-                    (x_values[-1], y, Z_bottom[j, -1]),
-                    (x_values[-1], y_next, Z_bottom[j+1, -1]),
-                    (x_values[-1], y_next, Z_top[j+1, -1]),
-                    (x_values[-1], y, Z_top[j, -1])
-                ]
-                poly_right = Poly3DCollection([verts_right], alpha=0.7)
-                poly_right.set_facecolor(right_color)
-                self.ax.add_collection3d(poly_right)
+            # Her yüz bulunduğu x aralığının gerilme rengini alır; tüm yüzler tek koleksiyonda
+            self.beam_mesh = Poly3DCollection(vertices, facecolors=colors, alpha=0.7)
         else:
-            # Normal görünüm - Renk haritası ile
-            # Alt yüzey
-            surf_bottom = self.ax.plot_surface(X, Y, Z_bottom, alpha=0.8, 
-                                              cmap=cm.viridis, linewidth=0.5, 
-                                              antialiased=True, edgecolor='k')
-            # Üst yüzey
-            surf_top = self.ax.plot_surface(X, Y, Z_top, alpha=0.8, 
-                                           cmap=cm.viridis, linewidth=0.5, 
-                                           antialiased=True, edgecolor='k')
-        
-        # Yan yüzeyler
-        for x_idx in range(0, len(x_values), 5):
-            x = x_values[x_idx]
-            xs = [x, x, x, x, x]
-            ys = [y_min, y_max, y_max, y_min, y_min]
-            zs_bottom = [Z_bottom[0, x_idx], Z_bottom[-1, x_idx], 
-                        Z_top[-1, x_idx], Z_top[0, x_idx], Z_bottom[0, x_idx]]
-            self.ax.plot(xs, ys, zs_bottom, 'k-', alpha=0.5, linewidth=1.5)
+            # Normal görünüm - alt ve üst yüzeyler yüz ortalama kotuna göre renklendirilir
+            self.beam_mesh = Poly3DCollection(vertices, facecolors=colors, alpha=0.8,
+                                              edgecolor='k', linewidth=0.5)
+        self.ax.add_collection3d(self.beam_mesh)
+        
+        # Yan yüzeyler: her 5. noktadaki kesit çerçeveleri tek koleksiyonda
+        frame_idx = np.arange(0, len(x_values), 5)
+        frames = np.empty((len(frame_idx), 5, 3))
+        frames[..., 0] = x_values[frame_idx, None]
+        frames[..., 1] = [y_min, y_max, y_max, y_min, y_min]
+        frames[..., 2] = np.stack([z_bottom[frame_idx], z_bottom[frame_idx], z_top[frame_idx],
+                                   z_top[frame_idx], z_bottom[frame_idx]], axis=-1)
+        self.ax.add_collection3d(Line3DCollection(frames, colors='k', alpha=0.5, linewidths=1.5))
         
         # Donatıları çiz
         if self.show_reinforcement.isChecked() and self.reinforcement_data:
@@ -420,7 +636,7 @@ class Beam3DVisualization(QWidget):
             
             # Kesit çizgisi
             self.ax.plot([x_section, x_section], [y_min, y_max], 
-                        [Z_bottom[0, section_idx], Z_bottom[-1, section_idx]], 
+                        [z_bottom[section_idx], z_bottom[section_idx]], 
                         'r-', linewidth=3, label='Kesit')
             
             # Kesit düzlemi
@@ -482,72 +698,32 @@ class Beam3DVisualization(QWidget):
         option = options[0]
         count = option.get('count', 4)
         diameter = option.get('diameter', 12) / 10  # mm -> cm
-        spacing = option.get('spacing', 10)
-        
-        # Donatı çubukları için x koordinatları
-        x_coords = np.linspace(0, length, 100)
-        
-        # Alt donatılar
-        bottom_cover = 5  # cm
-        z_bottom = -height/2 + bottom_cover
         
-        # Donatı yerleşimi
-        if count <= 2:
-            # Tek sıra donatı
-            y_positions = [0]
+        # Etriyeler - kesme tasarımından gelen konumlar (sıklaştırma bölgeleriyle)
+        stirrups = self.reinforcement_data.get('stirrups')
+        if stirrups is not None:
+            stirrup_positions = np.asarray(stirrups['positions'])
         else:
-            # Çoklu donatı
-            available_width = width - 2 * bottom_cover
-            y_positions = np.linspace(-available_width/2, available_width/2, min(count, 6))
-        
-        # Donatıları çiz - Daha gerçekçi görünüm
-        for y_pos in y_positions:
-            # Silindir şeklinde donatı çiz
-            theta = np.linspace(0, 2*np.pi, 20)
-            radius = diameter / 2
-            
-            # Donatı boyunca birkaç noktada silindir çiz
-            for x_pos in np.linspace(0.1, length-0.1, 10):
-                circle_x = np.ones_like(theta) * x_pos
-                circle_y = y_pos + radius * np.cos(theta)
-                circle_z = z_bottom + radius * np.sin(theta)
-                self.ax.plot(circle_x, circle_y, circle_z, 'r-', linewidth=2)
-            
-            # Donatı çubuğunu çiz
-            self.ax.plot(x_coords, [y_pos] * len(x_coords), [z_bottom] * len(x_coords), 
-                        'r-', linewidth=diameter*2, label='Donatı')
-        
-        # Etriyeler - Daha gerçekçi görünüm
-        stirrup_spacing = 20  # cm
-        num_stirrups = int(length * 100 / stirrup_spacing) + 1
-        stirrup_positions = np.linspace(0, length, num_stirrups)
-        
-        for x_pos in stirrup_positions:
-            # Etriye köşe noktaları
-            xs = [x_pos, x_pos, x_pos, x_pos, x_pos]
-            ys = [-width/2 + bottom_cover, width/2 - bottom_cover, 
-                 width/2 - bottom_cover, -width/2 + bottom_cover, -width/2 + bottom_cover]
-            zs = [z_bottom, z_bottom, height/2 - bottom_cover, 
-                 height/2 - bottom_cover, z_bottom]
-            self.ax.plot(xs, ys, zs, 'g-', linewidth=1.5, alpha=0.7)
-            
-            # Etriye kancaları
-            hook_length = 5  # cm
-            # Alt sol kanca
-            self.ax.plot([x_pos, x_pos], 
-                        [-width/2 + bottom_cover, -width/2 + bottom_cover], 
-                        [z_bottom, z_bottom + hook_length], 
-                        'g-', linewidth=1.5, alpha=0.7)
-            # Alt sağ kanca
-            self.ax.plot([x_pos, x_pos], 
-                        [width/2 - bottom_cover, width/2 - bottom_cover], 
-                        [z_bottom, z_bottom + hook_length], 
-                        'g-', linewidth=1.5, alpha=0.7)
+            stirrup_spacing = 20  # cm
+            num_stirrups = int(length * 100 / stirrup_spacing) + 1
+            stirrup_positions = np.linspace(0, length, num_stirrups)
+        
+        # Tüm çubuk, halka ve etriye geometrisi malzeme başına tek koleksiyonda çizilir
+        lines = build_reinforcement_lines(length, width, height, count, diameter, stirrup_positions)
+        self.ax.add_collection3d(Line3DCollection(lines["bars"], colors='r', linewidths=lines["bar_widths"],
+                                                  label='Donatı'))
+        self.ax.add_collection3d(Line3DCollection(lines["stirrups"], colors='g', linewidths=1.5, alpha=0.7,
+                                                  label='Etriye'))
         
         # Donatı bilgilerini göster
         self.ax.text(length/2, 0, -height/2 - 5, 
                     f"Donatı: {count}Φ{int(diameter*10)}mm", 
                     color='red', horizontalalignment='center')
+        if stirrups is not None:
+            self.ax.text(length/2, 0, height/2 + 5,
+                        f"Etriye: Φ{stirrups['dense_diameter']}/{stirrups['dense_spacing']/10:.0f} - "
+                        f"Φ{stirrups['normal_diameter']}/{stirrups['normal_spacing']/10:.0f} cm",
+                        color='green', horizontalalignment='center')
         
     def draw_load_type(self):
         """Yük tipini göster"""
@@ -624,65 +800,81 @@ class Beam3DVisualization(QWidget):
         """Deformasyon animasyonunu başlat"""
         if self.animation is not None:
             self.animation.event_source.stop()
+        self.lod_timer.stop()
+        
+        # Kiriş parametrelerini al
+        length = self.beam_data['length']
+        width = self.beam_data['width']
+        height = self.beam_data['height']
+        x_values = self.beam_data['x_values']
+        deflection = self.beam_data['deflection']
         
         # Animasyon için veri hazırla
-        frames = 50
+        frames = ANIMATION_FRAMES
         self.anim_scale_factors = np.linspace(0, self.scale_slider.value() / 10.0, frames)
         self.anim_frame = 0
         
-        # Animasyon fonksiyonu
+        # Ağ topolojisi bir kez kurulur; tüm karelerin z koordinatları ve renkleri önceden hesaplanır.
+        # Sehim genişlik boyunca sabit olduğundan genişlik yönünde tek aralık yeterlidir.
+        mesh = self.get_mesh(n_width=2)
+        self.anim_vertices = mesh["vertices"].copy()
+        self.anim_z = mesh["vertices"][..., 2] + self.anim_scale_factors[:, None, None] * mesh["deflection"]
+        face_deflection = mesh["deflection"].mean(axis=1)
+        max_deflection = np.max(np.abs(face_deflection)) * self.anim_scale_factors[-1]
+        if max_deflection > 0:
+            self.anim_colors = cm.coolwarm(0.5 + 0.5 * self.anim_scale_factors[:, None] * face_deflection / max_deflection)
+        else:
+            self.anim_colors = cm.coolwarm(np.full((frames, len(face_deflection)), 0.5))
+        
+        # Statik öğeler (eksenler, etiketler, sınırlar) yalnızca bir kez çizilir
+        self.ax.clear()
+        self.anim_mesh = Poly3DCollection(self.anim_vertices, facecolors=self.anim_colors[0],
+                                          alpha=0.7, linewidth=0)
+        self.ax.add_collection3d(self.anim_mesh)
+        self.ax.set_xlabel('Uzunluk (m)')
+        self.ax.set_ylabel('Genişlik (cm)')
+        self.ax.set_zlabel('Yükseklik (cm)')
+        self.ax.set_title('3D Kiriş Animasyonu')
+        self.ax.set_xlim(0, length)
+        self.ax.set_ylim(-width/2, width/2)
+        self.ax.set_zlim(min(self.anim_z.min(), -height/2) - 10, max(self.anim_z.max(), height/2) + 10)
+        
+        # Gerçekleşen kare hızı ölçümü
+        self.anim_frame_times = deque(maxlen=frames)
+        self.fps_label.setText("FPS: -")
+        
+        # Animasyon fonksiyonu: yalnızca köşe z koordinatları ve yüz renkleri güncellenir
         def update_anim(frame):
             if not self.is_animating:
-                return
-            
-            self.anim_frame = (self.anim_frame + 1) % frames
-            scale = self.anim_scale_factors[self.anim_frame]
-            
-            # Kiriş parametrelerini al
-            length = self.beam_data['length']
-            width = self.beam_data['width']
-            height = self.beam_data['height']
-            x_values = self.beam_data['x_values']
-            deflection = self.beam_data['deflection']
-            
-            # Önceki çizimleri temizle
-            self.ax.clear()
+                return ()
             
-            # Kiriş mesh'i güncelle
-            X, Y = np.meshgrid(x_values, np.linspace(-width/2, width/2, 20))
-            Z_bottom = np.zeros_like(X) - height/2
-            Z_top = np.zeros_like(X) + height/2
-            
-            # Deformasyonu ekle
-            if deflection is not None and len(deflection) > 0:
-                deflection_2d = np.tile(deflection, (Y.shape[0], 1))
-                Z_bottom = Z_bottom + deflection_2d * scale * 100
-                Z_top = Z_top + deflection_2d * scale * 100
-            
-            # Alt ve üst yüzeyleri çiz
-            self.ax.plot_surface(X, Y, Z_bottom, alpha=0.7, 
-                                cmap=cm.coolwarm, linewidth=0, antialiased=True)
-            self.ax.plot_surface(X, Y, Z_top, alpha=0.7, 
-                                cmap=cm.coolwarm, linewidth=0, antialiased=True)
-            
-            # Eksen etiketleri
-            self.ax.set_xlabel('Uzunluk (m)')
-            self.ax.set_ylabel('Genişlik (cm)')
-            self.ax.set_zlabel('Yükseklik (cm)')
-            self.ax.set_title('3D Kiriş Animasyonu')
-            
-            self.canvas.draw()
+            self.anim_frame = frame
+            self.anim_vertices[..., 2] = self.anim_z[frame]
+            self.anim_mesh.set_verts(self.anim_vertices)
+            self.anim_mesh.set_facecolor(self.anim_colors[frame])
+            self.update_frame_rate()
+            return (self.anim_mesh,)
         
         # Animasyonu başlat
         self.animation = FuncAnimation(self.figure, update_anim, frames=frames, 
-                                      interval=50, blit=False)
+                                      interval=ANIMATION_INTERVAL, blit=False, cache_frame_data=False)
         self.canvas.draw()
 
+    def update_frame_rate(self):
+        """Son karelerin zamanlarından gerçekleşen kare hızını hesaplayıp her 5 karede bir göster"""
+        self.anim_frame_times.append(time.perf_counter())
+        count = len(self.anim_frame_times)
+        if count >= 5 and self.anim_frame % 5 == 0:
+            elapsed = self.anim_frame_times[-1] - self.anim_frame_times[0]
+            if elapsed > 0:
+                self.fps_label.setText(f"FPS: {(count - 1) / elapsed:.1f}")
+
     def stop_animation(self):
         """Animasyonu durdur"""
         if self.animation is not None:
             self.animation.event_source.stop()
             self.animation = None
+        self.fps_label.setText("")
         
         # Normal görünüme dön
         self.update_visualization()
@@ -1,16 +1,76 @@
-from .beam_calculation import calculate_beam_analysis
-from .reinforcement import calculate_reinforcement, TS500
+from .beam_calculation import calculate_beam_analysis, calculate_beam_batch, calculate_design_gradients
+from .formula_registry import get_beam_kernel, SUPPORT_CONDITIONS, LOAD_TYPES
+from .reinforcement import calculate_reinforcement, calculate_required_steel_area, TS500
 from .load_types import (
     calculate_uniform_load,
     calculate_triangular_load,
     calculate_point_loads
 )
+from .influence_lines import calculate_influence_lines, calculate_moving_load_envelope
+from .finite_element import solve_beam_fe, calculate_beam_analysis_fe
+from .continuous_beam import solve_support_moments, calculate_continuous_beam
+from .reliability import iterate_failure_probability, calculate_failure_probability
+from .cracked_section import (
+    calculate_cracked_section,
+    calculate_effective_inertia,
+    calculate_cracked_deflection
+)
+from .long_term import (
+    calculate_creep_coefficient,
+    calculate_shrinkage_strain,
+    calculate_long_term_deflection
+)
+from .modal import solve_modal_fe, calculate_modal_analysis
+from .fiber_section import concrete_stress, steel_stress, calculate_moment_curvature
+from .shear_design import calculate_shear_capacity, calculate_shear_reinforcement, calculate_stirrup_positions
+from .serviceability import calculate_crack_width, check_results_serviceability
+from .design_checks import calculate_flexural_capacity, run_design_checks, check_results_design
+from .bar_schedule import calculate_bar_length, optimize_cutting_stock, collect_bar_pieces, calculate_bar_schedule
+from .quantity_takeoff import calculate_quantity_takeoff
 
 __all__ = [
     'calculate_beam_analysis',
+    'calculate_beam_batch',
+    'calculate_design_gradients',
+    'get_beam_kernel',
+    'SUPPORT_CONDITIONS',
+    'LOAD_TYPES',
     'calculate_reinforcement',
+    'calculate_required_steel_area',
     'TS500',
     'calculate_uniform_load',
     'calculate_triangular_load',
-    'calculate_point_loads'
+    'calculate_point_loads',
+    'calculate_influence_lines',
+    'calculate_moving_load_envelope',
+    'solve_beam_fe',
+    'calculate_beam_analysis_fe',
+    'solve_support_moments',
+    'calculate_continuous_beam',
+    'iterate_failure_probability',
+    'calculate_failure_probability',
+    'calculate_cracked_section',
+    'calculate_effective_inertia',
+    'calculate_cracked_deflection',
+    'calculate_creep_coefficient',
+    'calculate_shrinkage_strain',
+    'calculate_long_term_deflection',
+    'solve_modal_fe',
+    'calculate_modal_analysis',
+    'concrete_stress',
+    'steel_stress',
+    'calculate_moment_curvature',
+    'calculate_shear_capacity',
+    'calculate_shear_reinforcement',
+    'calculate_stirrup_positions',
+    'calculate_crack_width',
+    'check_results_serviceability',
+    'calculate_flexural_capacity',
+    'run_design_checks',
+    'check_results_design',
+    'calculate_bar_length',
+    'optimize_cutting_stock',
+    'collect_bar_pieces',
+    'calculate_bar_schedule',
+    'calculate_quantity_takeoff'
 ]
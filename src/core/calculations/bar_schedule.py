@@ -0,0 +1,329 @@
+from itertools import groupby
+from operator import itemgetter
+import numpy as np
+
+# Piyasada satılan donatı çubuğu boyu (m)
+STOCK_LENGTH = 12.0
+
+# Uç başına kanca boyu ve bindirmeli ek boyu (çap katı)
+HOOK_LENGTH_FACTOR = 10
+LAP_SPLICE_FACTOR = 40
+
+# Donatı çeliği birim hacim ağırlığı (kg/m³)
+STEEL_DENSITY = 7850
+
+def calculate_bar_length(length, diameter, cover=0.05):
+    """
+    Boyuna donatı parça boyu (vektörel, m).
+
+    Parça boyu kiriş boyundan iki uçtaki paspayı düşülüp iki uca
+    HOOK_LENGTH_FACTOR·φ kanca boyu eklenerek bulunur.
+
+    Args:
+        length: Kiriş uzunluğu (m)
+        diameter: Donatı çapı (mm)
+        cover (float): Paspayı (m)
+
+    Returns:
+        Parça boyu (m)
+    """
+    return (np.asarray(length, dtype=float) - 2 * cover
+            + 2 * HOOK_LENGTH_FACTOR * np.asarray(diameter, dtype=float) / 1000)
+
+def _split_long_pieces(lengths, counts, stock, lap):
+    """
+    Stok boyundan uzun parçaları bindirmeli eklerle stok boyunda parçalara böler.
+
+    Her ekte lap kadar boy kaybedilir; tam boy parçalar stok boyunda ve
+    kalan parça lap + artık boyda döndürülür. Boylar tam sayı mm'dir.
+
+    Returns:
+        tuple: (parça boyları, adetleri)
+    """
+    long_mask = lengths > stock
+    if not long_mask.any():
+        return lengths, counts
+    if lap >= stock:
+        raise ValueError("Bindirme boyu stok boyundan küçük olmalıdır")
+
+    n_full = -((stock - lengths[long_mask]) // (stock - lap))  # tavan((P - S)/(S - lap))
+    rest = lengths[long_mask] - n_full * (stock - lap)
+    return (np.concatenate([lengths[~long_mask], np.full(len(rest), stock), rest]),
+            np.concatenate([counts[~long_mask], n_full * counts[long_mask], counts[long_mask]]))
+
+def _first_fit(tree, size, need):
+    """Kalan kapasitesi need'i karşılayan ilk çubuğun sırası (yoksa -1)"""
+    if tree[1] < need:
+        return -1
+    node = 1
+    while node < size:
+        node *= 2
+        if tree[node] < need:
+            node += 1
+    return node - size
+
+def _update(tree, size, lo, hi):
+    """Yaprakları [lo, hi] aralığında değişen ağacın üst düğümlerini günceller"""
+    lo += size
+    hi += size
+    while lo > 1:
+        lo //= 2
+        hi //= 2
+        for node in range(lo, hi + 1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+
+def _place(tree, size, cuts, length, count):
+    """
+    Aynı boydaki parçaları açık çubuklara ilk uyan sırasıyla yerleştirir.
+
+    Her adımda bir çubuğa sığan tüm parçalar birlikte yerleştirilir.
+
+    Returns:
+        int: Yerleştirilemeyen parça adedi
+    """
+    while count:
+        bar = _first_fit(tree, size, length)
+        if bar < 0:
+            break
+        take = min(count, tree[size + bar] // length)
+        tree[size + bar] -= take * length
+        _update(tree, size, bar, bar)
+        cuts[bar].append([length, take])
+        count -= take
+    return count
+
+def _improve(piece_length, piece_bar, free, passes, max_swaps=50):
+    """
+    En boş çubukları değiş-tokuşlarla boşaltmaya çalışan yerel iyileştirme.
+
+    İlk uyan azalan yerleşimde bir parça önceki çubuklara sığmadığı için
+    doğrudan taşıma tek başına çubuk azaltmaz. Bu nedenle aday çubuktaki
+    parça, başka bir çubuktaki daha kısa bir parçayla o çubuğun artığını en
+    aza indirecek şekilde değiştirilir; aday çubuk küçüldükçe tüm parçaları
+    diğer çubukların artıklarına taşınabilir hale gelir ve çubuk kaldırılır.
+    piece_bar ve free yerinde güncellenir, kaldırılan çubukların artığı -1'dir.
+
+    Returns:
+        int: Kaldırılan çubuk sayısı
+    """
+    removed = 0
+    for bar in np.argsort(-free, kind="stable")[:passes]:
+        for _ in range(max_swaps):
+            members = np.flatnonzero(piece_bar == bar)
+            members = members[np.argsort(-piece_length[members], kind="stable")]
+
+            # Doğrudan taşıma: tüm parçalar diğer çubuklara sığıyor mu
+            trial = free.copy()
+            trial[bar] = -1
+            targets = []
+            for piece in members:
+                fits = np.flatnonzero(trial >= piece_length[piece])
+                if not len(fits):
+                    break
+                trial[fits[0]] -= piece_length[piece]
+                targets.append(fits[0])
+            else:
+                piece_bar[members] = targets
+                free[:] = trial
+                removed += 1
+                break
+
+            # Değiş-tokuş: daha kısa parçayla yer değiştirip diğer çubuğu doldur
+            for piece in members:
+                length = piece_length[piece]
+                slack = free[piece_bar] + piece_length - length
+                candidates = np.flatnonzero((piece_length < length) & (piece_bar != bar) & (slack >= 0))
+                if len(candidates):
+                    other = candidates[np.argmin(slack[candidates])]
+                    target = piece_bar[other]
+                    free[target] = slack[other]
+                    free[bar] += length - piece_length[other]
+                    piece_bar[piece], piece_bar[other] = target, bar
+                    break
+            else:
+                break
+    return removed
+
+def optimize_cutting_stock(lengths, counts=None, stock_length=STOCK_LENGTH, kerf=0.0, improvement_passes=100):
+    """
+    Tek çaptaki parçalar için kesim planı (ilk uyan azalan + yerel iyileştirme).
+
+    Parçalar mm'ye yukarı yuvarlanıp boyları azalan sırada, kalan
+    kapasitelerin maksimumunu tutan bir segment ağacı üzerinden ilk uyan
+    çubuğa yerleştirilir (parça başına O(log n)). Aynı boydaki parçalar
+    çubuk başına tek adımda yerleştirilir ve yeni çubuklar toplu açılır.
+    Ardından en boş çubuklar daha kısa parçalarla değiş-tokuş yapılarak
+    boşaltılmaya çalışılır (_improve); tüm parçaları diğer çubukların
+    artıklarına sığan çubuk plandan çıkarılır. Testere payı her parçaya eklenir, stok boyundan
+    uzun parçalar bindirmeli eklerle bölünmüş olarak verilmelidir.
+
+    Args:
+        lengths: Parça boyları (m)
+        counts (optional): Parça adetleri, varsayılan her boydan bir adet
+        stock_length (float): Stok çubuk boyu (m)
+        kerf (float): Testere payı (m)
+        improvement_passes (int): Boşaltılması denenecek en fazla çubuk sayısı
+
+    Returns:
+        dict: "patterns" (tekrar sayısına göre azalan kesim şablonları:
+            "cuts" [(boy (m), adet)], "repeat", "waste" (m)), "stock_count",
+            "piece_count", "used_length", "waste_length" (m), "waste_ratio"
+            ve alt sınır "lower_bound" = tavan(Σl/S)
+    """
+    lengths = np.atleast_1d(np.asarray(lengths, dtype=float))
+    counts = np.ones(len(lengths), dtype=np.int64) if counts is None else \
+        np.broadcast_to(np.asarray(counts, dtype=np.int64), lengths.shape)
+    if np.any(lengths <= 0) or np.any(counts < 0):
+        raise ValueError("Parça boyları pozitif, adetler negatif olmayan sayılar olmalıdır")
+
+    stock = int(round(stock_length * 1000))
+    saw = int(round(kerf * 1000))
+    pieces_mm = np.ceil(np.round(lengths * 1000, 6)).astype(np.int64)
+    if np.any(pieces_mm > stock):
+        raise ValueError("Stok boyundan uzun parçalar bindirmeli eklerle bölünmelidir")
+
+    # Aynı boydaki parçaları birleştir ve azalan sırada yerleştir
+    unique, inverse = np.unique(pieces_mm, return_inverse=True)
+    merged = np.bincount(inverse, weights=counts, minlength=len(unique)).astype(np.int64)
+    order = np.argsort(-unique)
+    unique, merged = unique[order] + saw, merged[order]
+    capacity = stock + saw
+
+    total = int(merged.sum())
+    size = 1 << max(int(total - 1).bit_length(), 0) if total > 1 else 1
+    tree = [0] * (2 * size)
+    cuts = [[] for _ in range(size)]
+    n_bars = 0
+
+    for length, count in zip(unique.tolist(), merged.tolist()):
+        count = _place(tree, size, cuts, length, count)
+        if count:
+            per_bar = capacity // length
+            full, rest = divmod(count, per_bar)
+            new = full + (rest > 0)
+            for bar in range(n_bars, n_bars + new):
+                take = per_bar if bar < n_bars + full else rest
+                tree[size + bar] = capacity - take * length
+                cuts[bar].append([length, take])
+            _update(tree, size, n_bars, n_bars + new - 1)
+            n_bars += new
+
+    # Yerleşimi düz parça dizilerine aç (parça boyu, çubuk sırası)
+    bar_of = np.repeat(np.arange(n_bars), [len(cuts[bar]) for bar in range(n_bars)])
+    flat = np.array([cut for bar in range(n_bars) for cut in cuts[bar]], dtype=np.int64).reshape(-1, 2)
+    piece_length = np.repeat(flat[:, 0], flat[:, 1])
+    piece_bar = np.repeat(bar_of, flat[:, 1])
+    free = np.array(tree[size:size + n_bars], dtype=np.int64)
+
+    removed = _improve(piece_length, piece_bar, free, improvement_passes)
+
+    # Aynı kesim düzenine sahip çubukları şablonlarda topla
+    patterns = {}
+    order = np.lexsort((-piece_length, piece_bar))
+    sorted_bars = piece_bar[order].tolist()
+    for _, group in groupby(zip(sorted_bars, (piece_length[order] - saw).tolist()), key=itemgetter(0)):
+        key = tuple((length, len(list(same))) for length, same in groupby(length for _, length in group))
+        patterns[key] = patterns.get(key, 0) + 1
+
+    pattern_list = [
+        {
+            "cuts": [(length / 1000, count) for length, count in key],
+            "repeat": repeat,
+            "waste": (stock - sum(length * count for length, count in key)) / 1000
+        }
+        for key, repeat in sorted(patterns.items(), key=lambda item: -item[1])
+    ]
+
+    stock_count = n_bars - removed
+    used_length = float(np.dot(pieces_mm, counts)) / 1000
+    waste_length = stock_count * stock_length - used_length
+    return {
+        "patterns": pattern_list,
+        "stock_count": stock_count,
+        "piece_count": total,
+        "used_length": used_length,
+        "waste_length": waste_length,
+        "waste_ratio": waste_length / (stock_count * stock_length) if stock_count else 0.0,
+        "lower_bound": int(-(-int(np.dot(pieces_mm, counts)) // stock))
+    }
+
+def collect_bar_pieces(results, option_index=0, cover=0.05, stock_length=STOCK_LENGTH):
+    """
+    Donatı hesabı içeren sonuçlardan çapa göre parça boyları ve adetlerini toplar.
+
+    Her sonuç için calculate_reinforcement seçeneklerinden option_index
+    sıradaki (yetersizse sonuncu) seçeneğin çubukları alınır. Stok boyunu
+    aşan parçalar LAP_SPLICE_FACTOR·φ bindirme boyuyla bölünür ve aynı
+    boydaki parçalar (mm) tek satırda toplanır.
+
+    Args:
+        results (list): "length" (m) ve "reinforcement" anahtarlarını içeren
+            sonuç sözlükleri
+        option_index (int): Kullanılacak donatı seçeneğinin sırası
+        cover (float): Paspayı (m)
+        stock_length (float): Stok çubuk boyu (m)
+
+    Returns:
+        dict: Çap (mm) -> {"lengths" (m), "counts"}
+    """
+    rows = [(result["length"], options[min(option_index, len(options) - 1)])
+            for result in results
+            for options in [(result.get("reinforcement") or {}).get("options")] if options]
+    if not rows:
+        return {}
+
+    diameters = np.array([option["diameter"] for _, option in rows], dtype=np.int64)
+    counts = np.array([option["count"] for _, option in rows], dtype=np.int64)
+    lengths = np.ceil(np.round(calculate_bar_length([length for length, _ in rows], diameters, cover) * 1000, 6))
+    lengths = lengths.astype(np.int64)
+
+    stock = int(round(stock_length * 1000))
+    pieces = {}
+    for diameter in np.unique(diameters):
+        mask = diameters == diameter
+        lap = LAP_SPLICE_FACTOR * int(diameter)
+        split_lengths, split_counts = _split_long_pieces(lengths[mask], counts[mask], stock, lap)
+        unique, inverse = np.unique(split_lengths, return_inverse=True)
+        pieces[int(diameter)] = {
+            "lengths": unique / 1000,
+            "counts": np.bincount(inverse, weights=split_counts).astype(np.int64)
+        }
+    return pieces
+
+def calculate_bar_schedule(results, option_index=0, cover=0.05, stock_length=STOCK_LENGTH, kerf=0.0,
+                           improvement_passes=100):
+    """
+    Proje genelinde donatı kesim planı ve fire istatistikleri.
+
+    Parçalar collect_bar_pieces ile çapa göre toplanır ve her çap için
+    optimize_cutting_stock ile ayrı kesim planı çıkarılır. Fire ağırlığı
+    φ çaplı çubuğun birim ağırlığı (π·φ²/4·ρ) ile hesaplanır.
+
+    Args:
+        results (list): Donatı hesabı içeren sonuç sözlükleri
+        option_index (int): Kullanılacak donatı seçeneğinin sırası
+        cover (float): Paspayı (m)
+        stock_length (float): Stok çubuk boyu (m)
+        kerf (float): Testere payı (m)
+        improvement_passes (int): Çap başına yerel iyileştirme deneme sayısı
+
+    Returns:
+        dict: Çap başına planlar ("diameters": optimize_cutting_stock sonucu
+            ve "waste_weight" (kg)), "total_stock_count", "total_waste_length"
+            (m), "total_waste_weight" (kg) ve "waste_ratio"
+    """
+    plans = {}
+    for diameter, pieces in collect_bar_pieces(results, option_index, cover, stock_length).items():
+        plan = optimize_cutting_stock(pieces["lengths"], pieces["counts"], stock_length, kerf, improvement_passes)
+        plan["waste_weight"] = plan["waste_length"] * np.pi * (diameter / 1000)**2 / 4 * STEEL_DENSITY
+        plans[diameter] = plan
+
+    stock_count = sum(plan["stock_count"] for plan in plans.values())
+    waste_length = sum(plan["waste_length"] for plan in plans.values())
+    return {
+        "diameters": plans,
+        "total_stock_count": stock_count,
+        "total_waste_length": waste_length,
+        "total_waste_weight": sum(plan["waste_weight"] for plan in plans.values()),
+        "waste_ratio": waste_length / (stock_count * stock_length) if stock_count else 0.0
+    }
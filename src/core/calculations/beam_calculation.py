@@ -1,32 +1,30 @@
 import numpy as np
-from .load_types import (
-    calculate_uniform_load, calculate_triangular_load, calculate_point_loads,
-    calculate_moment_distribution_uniform_load, calculate_shear_distribution_uniform_load,
-    calculate_deflection_distribution_uniform_load,
-    calculate_moment_distribution_triangular_load, calculate_shear_distribution_triangular_load,
-    calculate_deflection_distribution_triangular_load
-)
+from .formula_registry import get_beam_kernel
+from .reinforcement import TS500, calculate_required_steel_area
 from .reinforcement import calculate_reinforcement as calc_reinforcement
+from .shear_design import calculate_shear_reinforcement, stirrup_summary
+from .materials import calculate_elasticity_modulus
+from .cracked_section import calculate_cracked_deflection
 
-def calculate_moment(load: float, length: float, load_type="Tekil Yük") -> float:
-    """Basit kiriş için moment hesabı
+# Türevi alınan tasarım parametreleri
+GRADIENT_PARAMETERS = ("length", "load", "width", "height", "fck")
+
+def calculate_moment(load: float, length: float, load_type="Tekil Yük",
+                     support_condition="Basit Mesnetli") -> float:
+    """Kiriş için maksimum moment hesabı
     
     Args:
         load (float): Yük değeri (kN)
         length (float): Kiriş uzunluğu (m)
         load_type (str): Yük tipi
+        support_condition (str): Mesnet koşulu
     
     Returns:
-        float: Maksimum moment değeri (kNm)
+        float: Maksimum moment değeri (kNm, mutlak değer)
     """
     print(f"Moment hesaplanıyor: Yük={load}, Uzunluk={length}, Tip={load_type}")
     
-    if load_type == "Düzgün Yayılı Yük":
-        moment = (load * length**2) / 8
-    elif load_type == "Üçgen Yayılı Yük":
-        moment = (load * length**2) / 12
-    else:  # Tekil Yük
-        moment = (load * length) / 4
+    moment = float(get_beam_kernel(support_condition, load_type)["moment"](load, length))
     
     print(f"Hesaplanan moment: {moment} kNm")
     return moment
@@ -53,8 +51,10 @@ def calculate_deflection(load: float, length: float, E: float, I: float) -> floa
     return deflection  # m cinsinden
 
 def calculate_moment_diagram(load: float, length: float, x_values: np.ndarray) -> np.ndarray:
-    """Moment diyagramı hesabı."""
-    return (load * x_values/2) * (1 - x_values/length)
+    """Moment diyagramı hesabı (açıklık ortasında tekil yük)."""
+    # Mesnetten yüke olan mesafe (simetri)
+    a = np.minimum(x_values, length - x_values)
+    return load * a / 2
 
 def calculate_shear_diagram(load: float, length: float, x_values: np.ndarray) -> np.ndarray:
     """Kesme kuvveti diyagramı hesabı."""
@@ -65,18 +65,89 @@ def calculate_deflection_diagram(load: float, length: float, E: float, I: float,
     # Yük kN'dan N'a dönüştürülüyor (1 kN = 1000 N)
     load_N = load * 1000
     
+    # Mesnetten yüke olan mesafe (simetri)
+    a = np.minimum(x_values, length - x_values)
+    
     # Metre cinsinden hesaplama yapılıyor
-    deflection_m = (load_N * x_values * (length**2 - x_values**2)) / (16 * E * I)
+    deflection_m = (load_N * a * (3 * length**2 - 4 * a**2)) / (48 * E * I)
     # Milimetre cinsine dönüştürülüyor (1 m = 1000 mm)
     return deflection_m * 1000
 
-def calculate_beam_analysis(length, load, width, height, concrete_class, load_type="Tekil Yük", with_reinforcement=False):
+def calculate_design_gradients(kernel, load, length, width, height, concrete_class, with_reinforcement=False):
+    """
+    Maksimum moment, maksimum sehim ve gerekli donatı alanının analitik türevleri.
+    
+    Çekirdeklerde moment yük·L^(k+1), sehim yük·L^(k+3)/(E·I) ile ölçeklenir
+    (k: çekirdeğin "exponent" değeri); E = 22000·(fck/10)^0.3 olduğundan
+    dE/dfck = 0.3·E/fck'dır. Donatı alanının türevleri zincir kuralıyla
+    calculate_required_steel_area türevlerinden elde edilir. Argümanlar
+    numpy dizileri olabilir.
+    
+    Args:
+        kernel (dict): get_beam_kernel çekirdeği
+        load: Yük değeri (kN veya kN/m)
+        length: Kiriş uzunluğu (m)
+        width: Kesit genişliği (cm)
+        height: Kesit yüksekliği (cm)
+        concrete_class: Beton sınıfı veya sınıf dizisi
+        with_reinforcement (bool): Donatı alanı türevleri hesaplansın mı
+    
+    Returns:
+        dict: "moment", "max_deflection" ve istenirse "required_area" için
+            GRADIENT_PARAMETERS anahtarlı türev sözlükleri (genişlik ve
+            yükseklik türevleri cm başınadır)
+    """
+    k = kernel["exponent"]
+    load, length, width, height = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (load, length, width, height)))
+    fck = np.vectorize(TS500.get_fck, otypes=[float])(np.asarray(concrete_class))
+    E = 22000 * (fck/10)**0.3 * 1e6
+    I = (width/100) * (height/100)**3 / 12
+    
+    moment = kernel["moment"](load, length)
+    deflection = kernel["deflection"](load, length, E, I)
+    zeros = np.zeros_like(moment)
+    
+    gradients = {
+        "moment": {
+            "length": (k + 1) * moment / length,
+            "load": kernel["moment"](1.0, length) * np.ones_like(load),
+            "width": zeros,
+            "height": zeros,
+            "fck": zeros
+        },
+        "max_deflection": {
+            "length": (k + 3) * deflection / length,
+            "load": kernel["deflection"](1.0, length, E, I),
+            "width": -deflection / width,
+            "height": -3 * deflection / height,
+            "fck": -0.3 * deflection / fck
+        }
+    }
+    
+    if with_reinforcement:
+        _, steel = calculate_required_steel_area(moment, width/100, height/100, concrete_class,
+                                                 with_gradient=True)
+        dM = gradients["moment"]
+        gradients["required_area"] = {
+            "length": steel["moment"] * dM["length"],
+            "load": steel["moment"] * dM["load"],
+            "width": steel["width"] / 100,   # mm²/m -> mm²/cm
+            "height": steel["height"] / 100,  # mm²/m -> mm²/cm
+            "fck": steel["fck"]
+        }
+    
+    return gradients
+
+def calculate_beam_analysis(length, load, width, height, concrete_class, load_type="Tekil Yük",
+                            with_reinforcement=False, support_condition="Basit Mesnetli",
+                            with_gradients=False, with_cracked_section=False):
     """Kiriş analizi hesaplamalarını yapar"""
     try:
         print(f"Kiriş analizi başlatılıyor: Yük tipi={load_type}")
         
-        # Moment hesabı
-        moment = calculate_moment(load, length, load_type)
+        # Mesnet koşulu ve yük tipine ait çekirdek bir kez seçilir
+        kernel = get_beam_kernel(support_condition, load_type)
         
         # Elastisite modülü hesabı
         E = calculate_elasticity_modulus(concrete_class)
@@ -84,33 +155,16 @@ def calculate_beam_analysis(length, load, width, height, concrete_class, load_ty
         # Atalet momenti hesabı
         I = (width/100) * (height/100)**3 / 12  # cm -> m dönüşümü
         
-        # Kesme kuvveti ve sehim hesabı
-        if load_type == "Düzgün Yayılı Yük":
-            shear = load * length / 2
-            max_deflection = calculate_deflection_uniform_load(load, length, E, I)
-        elif load_type == "Üçgen Yayılı Yük":
-            shear = load * length / 2
-            max_deflection = calculate_deflection_triangular_load(load, length, E, I)
-        else:  # Tekil Yük
-            shear = load / 2
-            max_deflection = calculate_deflection(load, length, E, I)
+        # Moment, kesme kuvveti ve sehim hesabı
+        moment = float(kernel["moment"](load, length))
+        shear = float(kernel["shear"](load, length))
+        max_deflection = float(kernel["deflection"](load, length, E, I))
         
         # Dağılım verilerini hesapla
         x_values = np.linspace(0, length, 100)
-        
-        # Yük tipine göre dağılım hesapla
-        if load_type == "Düzgün Yayılı Yük":
-            moment_distribution = calculate_moment_distribution_uniform_load(load, length, x_values)
-            shear_distribution = calculate_shear_distribution_uniform_load(load, length, x_values)
-            deflection_distribution = calculate_deflection_distribution_uniform_load(load, length, E, I, x_values)
-        elif load_type == "Üçgen Yayılı Yük":
-            moment_distribution = calculate_moment_distribution_triangular_load(load, length, x_values)
-            shear_distribution = calculate_shear_distribution_triangular_load(load, length, x_values)
-            deflection_distribution = calculate_deflection_distribution_triangular_load(load, length, E, I, x_values)
-        else:  # Tekil Yük
-            moment_distribution = calculate_moment_diagram(load, length, x_values)
-            shear_distribution = calculate_shear_diagram(load, length, x_values)
-            deflection_distribution = calculate_deflection_diagram(load, length, E, I, x_values)
+        moment_distribution = kernel["moment_distribution"](load, length, x_values)
+        shear_distribution = kernel["shear_distribution"](load, length, x_values)
+        deflection_distribution = kernel["deflection_distribution"](load, length, E, I, x_values)
         
         # Sonuçları döndür
         results = {
@@ -122,20 +176,140 @@ def calculate_beam_analysis(length, load, width, height, concrete_class, load_ty
             "moment_distribution": moment_distribution,
             "shear_distribution": shear_distribution,
             "deflection_distribution": deflection_distribution,
-            "load_type": load_type
+            "load_type": load_type,
+            "support_condition": support_condition
         }
         
         # Donatı hesabı isteniyorsa ekle
         if with_reinforcement:
             reinforcement = calc_reinforcement(moment, concrete_class, width/100, height/100)
+            # Etriyeler kesme kuvveti dağılımından tasarlanır
+            stirrups = calculate_shear_reinforcement(shear_distribution, x_values, width/100, height/100,
+                                                     concrete_class, support_condition)
+            reinforcement["stirrups"] = stirrup_summary(stirrups, 0, length, support_condition)
             results["reinforcement"] = reinforcement
         
+        # Analitik türevler isteniyorsa ekle
+        if with_gradients:
+            gradients = calculate_design_gradients(kernel, load, length, width, height,
+                                                   concrete_class, with_reinforcement)
+            results["gradients"] = {quantity: {name: float(value) for name, value in values.items()}
+                                    for quantity, values in gradients.items()}
+        
+        # Çatlamış kesit (etkin atalet momenti) servis sehimi isteniyorsa ekle
+        if with_cracked_section:
+            cracked = calculate_cracked_deflection(length, load, width, height, concrete_class,
+                                                   load_type, support_condition)
+            results["cracked_section"] = {key: np.asarray(value).item() for key, value in cracked.items()}
+            results["service_deflection"] = results["cracked_section"]["max_deflection"]
+        
         return results
         
     except Exception as e:
         print(f"Kiriş analizi hatası: {str(e)}")
         raise
 
+def calculate_beam_batch(scenarios, n_points=100, with_gradients=False, with_cracked_section=False):
+    """
+    Birden fazla senaryoyu mesnet koşulu ve yük tipine göre gruplayarak hesaplar.
+    
+    Her grup için çekirdek bir kez seçilir ve gruptaki tüm senaryolar
+    (senaryo × nokta) dizileri üzerinde tek vektörel çağrıyla hesaplanır.
+    
+    Args:
+        scenarios (list): calculate_beam_analysis parametrelerini içeren sözlükler
+            ("length", "load", "width", "height", "concrete_class" ve isteğe bağlı
+            "load_type", "support_condition", "with_reinforcement")
+        n_points (int): Dağılım nokta sayısı
+        with_gradients (bool): Analitik türevler de hesaplansın mı
+        with_cracked_section (bool): Çatlamış kesit servis sehimi hesaplansın mı
+    
+    Returns:
+        list: Senaryo sırasıyla calculate_beam_analysis biçiminde sonuçlar
+    """
+    groups = {}
+    for index, scenario in enumerate(scenarios):
+        key = (scenario.get("support_condition", "Basit Mesnetli"), scenario.get("load_type", "Tekil Yük"))
+        groups.setdefault(key, []).append(index)
+    
+    # Elastisite modülü beton sınıfı başına bir kez hesaplanır
+    moduli = {concrete_class: calculate_elasticity_modulus(concrete_class)
+              for concrete_class in {scenario["concrete_class"] for scenario in scenarios}}
+    
+    results = [None] * len(scenarios)
+    for (support_condition, load_type), indices in groups.items():
+        kernel = get_beam_kernel(support_condition, load_type)
+        group = [scenarios[i] for i in indices]
+        
+        length = np.array([scenario["length"] for scenario in group], dtype=float)
+        load = np.array([scenario["load"] for scenario in group], dtype=float)
+        width = np.array([scenario["width"] for scenario in group], dtype=float) / 100  # cm -> m
+        height = np.array([scenario["height"] for scenario in group], dtype=float) / 100  # cm -> m
+        E = np.array([moduli[scenario["concrete_class"]] for scenario in group])
+        I = width * height**3 / 12
+        
+        moment = kernel["moment"](load, length)
+        shear = kernel["shear"](load, length)
+        max_deflection = kernel["deflection"](load, length, E, I)
+        
+        # Dağılımlar (senaryo × nokta)
+        x_values = np.linspace(0, 1, n_points)[None, :] * length[:, None]
+        load_col, length_col = load[:, None], length[:, None]
+        moment_distribution = kernel["moment_distribution"](load_col, length_col, x_values)
+        shear_distribution = kernel["shear_distribution"](load_col, length_col, x_values)
+        deflection_distribution = kernel["deflection_distribution"](
+            load_col, length_col, E[:, None], I[:, None], x_values)
+        
+        if with_gradients:
+            classes = [scenario["concrete_class"] for scenario in group]
+            reinforced = any(scenario.get("with_reinforcement", False) for scenario in group)
+            gradients = calculate_design_gradients(kernel, load, length, width * 100, height * 100,
+                                                   classes, reinforced)
+        
+        if with_cracked_section:
+            cracked = calculate_cracked_deflection(length, load, width * 100, height * 100,
+                                                   [scenario["concrete_class"] for scenario in group],
+                                                   load_type, support_condition)
+        
+        # Etriye tasarımı gruptaki tüm kirişler için tek çağrıda yapılır
+        if any(scenario.get("with_reinforcement", False) for scenario in group):
+            stirrups = calculate_shear_reinforcement(shear_distribution, x_values, width, height,
+                                                     [scenario["concrete_class"] for scenario in group],
+                                                     support_condition)
+        
+        for row, index in enumerate(indices):
+            scenario = scenarios[index]
+            result = {
+                "moment": float(moment[row]),
+                "shear": float(shear[row]),
+                "max_deflection": float(max_deflection[row]),
+                "elasticity_modulus": E[row]/1e9,  # GPa cinsinden
+                "x_values": x_values[row],
+                "moment_distribution": moment_distribution[row],
+                "shear_distribution": shear_distribution[row],
+                "deflection_distribution": deflection_distribution[row],
+                "load_type": load_type,
+                "support_condition": support_condition
+            }
+            if scenario.get("with_reinforcement", False):
+                result["reinforcement"] = calc_reinforcement(
+                    result["moment"], scenario["concrete_class"], width[row], height[row])
+                result["reinforcement"]["stirrups"] = stirrup_summary(stirrups, row, length[row],
+                                                                      support_condition)
+            if with_gradients:
+                result["gradients"] = {
+                    quantity: {name: float(value[row]) for name, value in values.items()}
+                    for quantity, values in gradients.items()
+                    if quantity != "required_area" or scenario.get("with_reinforcement", False)
+                }
+            if with_cracked_section:
+                result["cracked_section"] = {key: np.broadcast_to(value, length.shape)[row].item()
+                                             for key, value in cracked.items()}
+                result["service_deflection"] = result["cracked_section"]["max_deflection"]
+            results[index] = result
+    
+    return results
+
 def calculate_deflection_uniform_load(load, length, E, I):
     """
     Düzgün yayılı yük için maksimum sehim hesabı
@@ -173,31 +347,3 @@ def calculate_deflection_triangular_load(load, length, E, I):
     
     # Sehim hesabı - Düzeltilmiş formül
     return (load_N_per_m * length**4) / (120 * E * I)
-
-def calculate_elasticity_modulus(concrete_class):
-    """
-    Beton sınıfına göre elastisite modülünü hesaplar
-    
-    Args:
-        concrete_class (str): Beton sınıfı (örn. "C25", "C30", "C35", vb.)
-    
-    Returns:
-        float: Elastisite modülü (N/m²)
-    """
-    try:
-        # Beton sınıfından karakteristik basınç dayanımını çıkar (MPa)
-        if concrete_class.startswith("C"):
-            fck = float(concrete_class[1:])
-        else:
-            fck = 30.0
-        
-        # Eurocode 2'ye göre elastisite modülü hesabı
-        E = 22000 * (fck/10)**0.3 * 1e6  # N/m² cinsinden
-        
-        print(f"Elastisite modülü: {E/1e9:.2f} GPa")
-        return E
-    
-    except Exception as e:
-        print(f"Elastisite modülü hesaplama hatası: {str(e)}")
-        # Hata durumunda varsayılan değer döndür
-        return 30e9  # Varsayılan değer: 30 GPa
\ No newline at end of file
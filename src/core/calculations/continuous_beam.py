@@ -0,0 +1,160 @@
+import numpy as np
+from scipy.linalg import solve_banded
+from .materials import calculate_elasticity_modulus
+
+def solve_support_moments(span_lengths, inertias, span_loads):
+    """
+    Üç moment denklemlerini üç köşegenli sistem olarak çözer.
+
+    Uç mesnetler mafsallıdır (M = 0). Her iç mesnet i için
+        M_(i-1)·L_l/I_l + 2·M_i·(L_l/I_l + L_r/I_r) + M_(i+1)·L_r/I_r
+            = -(q_l·L_l³/(4·I_l) + q_r·L_r³/(4·I_r))
+    yazılır ve sistem bant çözücüyle O(açıklık sayısı) sürede çözülür.
+    Birden fazla yükleme durumu sütunlar halinde aynı anda çözülebilir.
+
+    Args:
+        span_lengths (array): Açıklık boyları (m)
+        inertias (array): Açıklıkların atalet momentleri (m⁴)
+        span_loads (array): Açıklık başına düzgün yayılı yük (kN/m),
+            (n_spans,) veya (n_spans, n_cases) boyutunda
+
+    Returns:
+        array: Mesnet momentleri (kNm), (n_spans + 1,) veya (n_spans + 1, n_cases)
+    """
+    L = np.asarray(span_lengths, dtype=float)
+    I = np.broadcast_to(np.asarray(inertias, dtype=float), L.shape)
+    q = np.asarray(span_loads, dtype=float)
+    single_case = q.ndim == 1
+    q = q.reshape(len(L), -1)
+
+    n_spans = len(L)
+    moments = np.zeros((n_spans + 1, q.shape[1]))
+
+    if n_spans > 1:
+        flexibility = L / I
+        # Üç köşegenli matris (bant formu: üst, ana, alt köşegen)
+        ab = np.zeros((3, n_spans - 1))
+        ab[0, 1:] = flexibility[1:-1]
+        ab[1, :] = 2 * (flexibility[:-1] + flexibility[1:])
+        ab[2, :-1] = flexibility[1:-1]
+
+        load_terms = q * (L**3 / (4 * I))[:, None]
+        rhs = -(load_terms[:-1] + load_terms[1:])
+        moments[1:-1] = solve_banded((1, 1), ab, rhs)
+
+    return moments[:, 0] if single_case else moments
+
+def _unit_load_responses(span_lengths, EI, unit_moments, xi):
+    """
+    Her açıklığa ayrı ayrı birim yük uygulandığında tüm açıklıklardaki
+    moment, kesme ve sehim dağılımlarını hesaplar.
+
+    Returns:
+        tuple: (n_cases, n_spans, n_points) boyutunda moment, kesme ve sehim
+    """
+    n_spans = len(span_lengths)
+    L = span_lengths[None, :, None]
+    EI = EI[None, :, None]
+    x = xi[None, None, :] * L
+    loaded = np.eye(n_spans)[:, :, None]  # Birim yükün bulunduğu açıklık
+
+    # Açıklık uç momentleri: (yükleme durumu, açıklık, 1)
+    M_a = unit_moments[:-1].T[:, :, None]
+    M_b = unit_moments[1:].T[:, :, None]
+
+    moment = loaded * x * (L - x) / 2 + M_a * (1 - xi) + M_b * xi
+    shear = loaded * (L / 2 - x) + (M_b - M_a) / L
+    # Sehim (m): yayılı yük (kN -> N) ve uç momentlerinin katkısı
+    deflection = (loaded * 1000 * x * (L**3 - 2 * L * x**2 + x**3) / (24 * EI)
+                  + 1000 * L**2 / (6 * EI) * xi * (1 - xi) * (M_a * (2 - xi) + M_b * (1 + xi)))
+    return moment, shear, deflection
+
+def calculate_continuous_beam(span_lengths, dead_load, live_load=0.0, width=30.0, height=50.0,
+                              concrete_class="C25", n_points=50):
+    """
+    Sürekli çok açıklıklı kirişin analizi ve hareketli yük düzenlemesi.
+
+    Mesnet momentleri her açıklıktaki birim yük için bir kez çözülür; tüm
+    diyagramlar bu birim tepkilerin doğrusal birleşimidir. Hareketli yük
+    zarfı, her noktada tepkiyi artıran açıklıklar yüklenerek bulunur; böylece
+    2^n yük düzenlemesi tek tek yeniden hesaplanmaz.
+
+    Args:
+        span_lengths (list): Açıklık boyları (m)
+        dead_load (float veya list): Tüm açıklıklardaki sabit yük (kN/m)
+        live_load (float veya list): Düzenlenecek hareketli yük (kN/m)
+        width (float veya list): Kesit genişliği (cm), açıklık başına olabilir
+        height (float veya list): Kesit yüksekliği (cm), açıklık başına olabilir
+        concrete_class (str): Beton sınıfı
+        n_points (int): Açıklık başına örnek nokta sayısı
+
+    Returns:
+        dict: Tam yükleme diyagramları, zarflar ve kritik yük düzenlemeleri
+    """
+    L = np.asarray(span_lengths, dtype=float)
+    if L.ndim != 1 or len(L) == 0 or np.any(L <= 0):
+        raise ValueError("Açıklık boyları pozitif olmalıdır!")
+    n_spans = len(L)
+
+    g = np.broadcast_to(np.asarray(dead_load, dtype=float), L.shape)
+    p = np.broadcast_to(np.asarray(live_load, dtype=float), L.shape)
+    b = np.broadcast_to(np.asarray(width, dtype=float), L.shape) / 100   # cm -> m
+    h = np.broadcast_to(np.asarray(height, dtype=float), L.shape) / 100  # cm -> m
+    I = b * h**3 / 12
+    E = calculate_elasticity_modulus(concrete_class)
+
+    # Birim yük durumları için mesnet momentleri: (n_spans + 1, n_spans)
+    unit_moments = solve_support_moments(L, I, np.eye(n_spans))
+
+    xi = np.linspace(0, 1, n_points)
+    unit_moment, unit_shear, unit_deflection = _unit_load_responses(L, E * I, unit_moments, xi)
+
+    def combine(loads, responses):
+        return np.tensordot(loads, responses, axes=1)
+
+    # Tam yükleme (tüm açıklıklarda sabit + hareketli yük)
+    total = g + p
+    moment = combine(total, unit_moment)
+    shear = combine(total, unit_shear)
+    deflection = combine(total, unit_deflection)
+
+    # Hareketli yük düzenlemesi: her nokta için tepkiyi artıran açıklıklar yüklenir
+    dead_moment = combine(g, unit_moment)
+    live_moment = p[:, None, None] * unit_moment
+    moment_max = dead_moment + np.clip(live_moment, 0, None).sum(axis=0)
+    moment_min = dead_moment + np.clip(live_moment, None, 0).sum(axis=0)
+
+    dead_shear = combine(g, unit_shear)
+    live_shear = p[:, None, None] * unit_shear
+    shear_max = dead_shear + np.clip(live_shear, 0, None).sum(axis=0)
+    shear_min = dead_shear + np.clip(live_shear, None, 0).sum(axis=0)
+
+    live_deflection = p[:, None, None] * unit_deflection
+    deflection_max = combine(g, unit_deflection) + np.clip(live_deflection, 0, None).sum(axis=0)
+
+    # Kritik düzenlemeler: açıklık momenti ve iç mesnet momenti için yüklenen açıklıklar
+    span_peak = np.argmax(moment_max, axis=1)
+    span_patterns = live_moment[:, np.arange(n_spans), span_peak].T > 0
+    support_patterns = live_moment[:, :-1, -1].T < 0
+
+    x_values = (np.concatenate([[0.0], np.cumsum(L)[:-1]])[:, None] + xi[None, :] * L[:, None])
+
+    return {
+        "x_values": x_values.ravel(),
+        "span_index": np.repeat(np.arange(n_spans), n_points),
+        "support_moments": unit_moments @ total,
+        "moment_distribution": moment.ravel(),
+        "shear_distribution": shear.ravel(),
+        "deflection_distribution": deflection.ravel(),
+        "moment_envelope_max": moment_max.ravel(),
+        "moment_envelope_min": moment_min.ravel(),
+        "shear_envelope_max": shear_max.ravel(),
+        "shear_envelope_min": shear_min.ravel(),
+        "deflection_envelope_max": deflection_max.ravel(),
+        "critical_span_patterns": span_patterns,
+        "critical_support_patterns": support_patterns,
+        "moment": max(np.max(moment_max), -np.min(moment_min)),
+        "shear": max(np.max(shear_max), -np.min(shear_min)),
+        "max_deflection": np.max(deflection_max),
+        "elasticity_modulus": E/1e9  # GPa cinsinden
+    }
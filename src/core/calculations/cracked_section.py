@@ -0,0 +1,124 @@
+import numpy as np
+from .materials import calculate_elasticity_modulus
+from .formula_registry import get_beam_kernel
+from .reinforcement import TS500, calculate_required_steel_area
+
+def elasticity_moduli(concrete_class):
+    """
+    Beton sınıfı veya sınıf dizisi için elastisite modüllerini (N/m²) döndürür.
+
+    calculate_elasticity_modulus her farklı sınıf için bir kez çağrılır.
+    """
+    classes = np.asarray(concrete_class)
+    moduli = {name: calculate_elasticity_modulus(str(name)) for name in np.unique(classes)}
+    return np.vectorize(moduli.get, otypes=[float])(classes)
+
+def calculate_cracked_section(width, height, steel_area, concrete_class, cover=0.05):
+    """
+    Tek donatılı dikdörtgen kesitin çatlamış kesit özellikleri (vektörel).
+
+    Çatlamış kesitte beton çekme almaz; tarafsız eksen derinliği
+        x = k·d,  k = √(2ρn + (ρn)²) - ρn,  ρ = As/(b·d),  n = Es/Ec
+    ve çatlamış atalet momenti I_cr = b·x³/3 + n·As·(d - x)² ile bulunur.
+    Çatlama momenti M_cr = fctk·I_g/(h/2), fctk = 0.35·√fck.
+    Tüm argümanlar numpy dizileri (veya beton sınıfı listesi) olabilir.
+
+    Args:
+        width: Kesit genişliği (m)
+        height: Kesit yüksekliği (m)
+        steel_area: Çekme donatısı alanı (mm²)
+        concrete_class: Beton sınıfı veya sınıf dizisi
+        cover (float): Paspayı (m)
+
+    Returns:
+        dict: "neutral_axis" (m), "gross_inertia", "cracked_inertia" (m⁴),
+            "cracking_moment" (kNm) ve "modular_ratio"
+    """
+    b, h, As = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (width, height, steel_area)))
+    fck = np.vectorize(TS500.get_fck, otypes=[float])(np.asarray(concrete_class))
+    Ec = elasticity_moduli(concrete_class) / 1e6  # N/m² -> MPa
+
+    d = h - cover
+    As_m2 = As / 1e6  # mm² -> m²
+    n = TS500.ES / Ec
+    rho_n = As_m2 / (b * d) * n
+
+    k = np.sqrt(2 * rho_n + rho_n**2) - rho_n
+    x = k * d
+    I_gross = b * h**3 / 12
+    I_cracked = b * x**3 / 3 + n * As_m2 * (d - x)**2
+
+    # MPa·m³ = MNm -> kNm
+    M_cr = TS500.calculate_fctk(fck) * I_gross / (h / 2) * 1000
+
+    return {
+        "neutral_axis": x,
+        "gross_inertia": I_gross,
+        "cracked_inertia": I_cracked,
+        "cracking_moment": M_cr,
+        "modular_ratio": n
+    }
+
+def calculate_effective_inertia(moment, cracking_moment, gross_inertia, cracked_inertia):
+    """
+    Branson etkin atalet momenti (vektörel).
+
+    I_e = (M_cr/M_a)³·I_g + [1 - (M_cr/M_a)³]·I_cr, I_e ≤ I_g;
+    servis momenti çatlama momentini aşmıyorsa I_e = I_g.
+    """
+    M_a = np.abs(np.asarray(moment, dtype=float))
+    cracked = M_a > cracking_moment
+    ratio = np.where(cracked, cracking_moment / np.where(cracked, M_a, 1.0), 1.0)**3
+    return np.minimum(ratio * gross_inertia + (1 - ratio) * cracked_inertia, gross_inertia)
+
+def calculate_cracked_deflection(length, load, width, height, concrete_class, load_type="Tekil Yük",
+                                 support_condition="Basit Mesnetli", steel_area=None, cover=0.05):
+    """
+    Çatlamış kesit ve etkin atalet momentine göre servis sehimi (vektörel).
+
+    Sayısal argümanlar ve beton sınıfı diziler olabilir; tüm kirişler aynı
+    çekirdekle tek çağrıda hesaplanır. Donatı alanı verilmezse servis
+    momenti için calculate_reinforcement ile aynı gerekli alan kullanılır.
+    Çekirdek sehimleri 1/I ile ölçeklendiğinden servis sehimi brüt kesit
+    sehiminin I_g/I_e katıdır.
+
+    Args:
+        length: Kiriş uzunluğu (m)
+        load: Servis yükü (kN veya kN/m)
+        width: Kesit genişliği (cm)
+        height: Kesit yüksekliği (cm)
+        concrete_class: Beton sınıfı veya sınıf dizisi
+        load_type (str): Yük tipi
+        support_condition (str): Mesnet koşulu
+        steel_area (optional): Çekme donatısı alanı (mm²)
+        cover (float): Paspayı (m)
+
+    Returns:
+        dict: Kesit özellikleri, "effective_inertia" (m⁴), "gross_deflection"
+            ve "max_deflection" (m), "steel_area" (mm²) ve "is_cracked"
+    """
+    kernel = get_beam_kernel(support_condition, load_type)
+    length, load, width, height = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (length, load, width, height)))
+    b, h = width / 100, height / 100  # cm -> m
+
+    moment = kernel["moment"](load, length)
+    if steel_area is None:
+        steel_area = calculate_required_steel_area(moment, b, h, concrete_class, cover)
+
+    section = calculate_cracked_section(b, h, steel_area, concrete_class, cover)
+    I_effective = calculate_effective_inertia(moment, section["cracking_moment"],
+                                              section["gross_inertia"], section["cracked_inertia"])
+
+    E = elasticity_moduli(concrete_class)
+    gross_deflection = kernel["deflection"](load, length, E, section["gross_inertia"])
+
+    section.update({
+        "moment": moment,
+        "steel_area": np.broadcast_to(steel_area, moment.shape),
+        "effective_inertia": I_effective,
+        "gross_deflection": gross_deflection,
+        "max_deflection": gross_deflection * section["gross_inertia"] / I_effective,
+        "is_cracked": moment > section["cracking_moment"]
+    })
+    return section
@@ -0,0 +1,175 @@
+import numpy as np
+from .reinforcement import TS500
+
+# Kontrol sütunları (kullanım matrisi sırası)
+DESIGN_CHECKS = ("flexure", "min_reinforcement", "max_k", "deflection", "spacing")
+
+# Sehim sınırı L/oran; konsolda eşdeğer açıklık 2L alınır
+DEFLECTION_LIMIT_RATIOS = {
+    "Basit Mesnetli": 250,
+    "Konsol": 125,
+    "İki Ucu Ankastre": 250,
+    "Ankastre-Mafsallı": 250,
+}
+
+# Donatılar arası en küçük aralık (mm): max(φ, 25 mm)
+MIN_BAR_SPACING = 25
+
+def calculate_flexural_capacity(steel_area, width, height, concrete_class, cover=0.05, steel_class="S420"):
+    """
+    calculate_reinforcement ile tutarlı eğilme kapasitesi (vektörel, kNm).
+
+    Tasarımdaki ξ = As·fyd/(0.85·fcd·b·d) ilişkisi tersine çevrilir ve
+    K = ξ·(1 - ξ/2) ile Mr = K·b·d²·fcd bulunur; böylece calculate_reinforcement
+    ile seçilen donatının kullanım oranı 1'i aşmaz. ξ > 1 için K = 0.5'tir.
+    """
+    fck = np.vectorize(TS500.get_fck, otypes=[float])(np.asarray(concrete_class))
+    fcd = TS500.calculate_fcd(fck)
+    fyd = TS500.calculate_fyd(TS500.STEEL_CLASSES[steel_class])
+    b = np.asarray(width, dtype=float)
+    d = np.asarray(height, dtype=float) - cover
+
+    ksi = np.minimum(np.asarray(steel_area, dtype=float) / 1e6 * fyd / (0.85 * fcd * b * d), 1.0)
+    return ksi * (1 - ksi / 2) * b * d * d * fcd * 1000
+
+def _min_reinforcement_area(width, height, classes):
+    """TS500.calculate_min_reinforcement_area değerlerini beton sınıfı başına bir kez çağırarak hesaplar"""
+    area = np.empty(classes.shape)
+    for name in np.unique(classes):
+        mask = classes == name
+        area[mask] = TS500.calculate_min_reinforcement_area(width[mask], height[mask], str(name))
+    return area
+
+def run_design_checks(moment, width, height, concrete_class, steel_area, length=None, deflection=None,
+                      support_condition="Basit Mesnetli", diameter=None, count=None, cover=0.05,
+                      steel_class="S420"):
+    """
+    Tüm tasarım kontrollerini maskelerle tek çağrıda çalıştırır (vektörel).
+
+    Kontroller istisna fırlatmaz; her kiriş ve kontrol için kullanım oranı
+    (talep/kapasite) hesaplanır ve (kiriş × kontrol) matrisinde toplanır:
+        flexure            M / Mr
+        min_reinforcement  As,min / As
+        max_k              K / K_MAX, K = M/(b·d²·fcd)
+        deflection         δ / (L/oran)
+        spacing            max(φ, 25 mm) / donatı aralığı
+    Verisi verilmeyen kontrollerin sütunu NaN'dır ve yönetici kontrol
+    seçiminde dikkate alınmaz.
+
+    Args:
+        moment: Tasarım momenti (kNm)
+        width: Kesit genişliği (m)
+        height: Kesit yüksekliği (m)
+        concrete_class: Beton sınıfı veya sınıf dizisi
+        steel_area: Mevcut çekme donatısı alanı (mm²)
+        length (optional): Kiriş uzunluğu (m)
+        deflection (optional): Maksimum sehim (m)
+        support_condition: Mesnet koşulu veya koşul dizisi
+        diameter (optional): Donatı çapı (mm)
+        count (optional): Donatı adedi
+        cover (float): Paspayı (m)
+        steel_class (str): Çelik sınıfı
+
+    Returns:
+        dict: "checks" (DESIGN_CHECKS), (kiriş, kontrol) boyutunda "utilization"
+            ve "failed"; kiriş başına "governing_index", "governing_check",
+            "governing_utilization" ve "passed"; kontrol başına "failure_counts"
+    """
+    if steel_class not in TS500.STEEL_CLASSES:
+        raise ValueError(f"Geçersiz çelik sınıfı: {steel_class}")
+
+    M, b, h, As = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float))
+                                        for v in (moment, width, height, steel_area)))
+    n_beams = M.shape[0]
+    classes = np.broadcast_to(np.asarray(concrete_class), (n_beams,))
+    missing = np.full(n_beams, np.nan)
+    optional = lambda value: missing if value is None else np.broadcast_to(np.asarray(value, dtype=float), (n_beams,))
+
+    fck = np.vectorize(TS500.get_fck, otypes=[float])(classes)
+    fcd = TS500.calculate_fcd(fck)
+    d = h - cover
+    M = np.abs(M)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        flexure = M / calculate_flexural_capacity(As, b, h, classes, cover, steel_class)
+        min_reinforcement = _min_reinforcement_area(b, h, classes) / As
+        max_k = M / (b * d * d * fcd * 1000) / TS500.K_MAX
+
+        supports = np.broadcast_to(np.asarray(support_condition), (n_beams,))
+        for name in np.unique(supports):
+            if name not in DEFLECTION_LIMIT_RATIOS:
+                raise ValueError(f"Geçersiz mesnet koşulu: {name}")
+        ratios = np.vectorize(DEFLECTION_LIMIT_RATIOS.get, otypes=[float])(supports)
+        deflection_check = np.abs(optional(deflection)) / (optional(length) / ratios)
+
+        phi, bars = optional(diameter), optional(count)
+        spacing = (b * 1000 - 2 * cover * 1000) / (bars - 1)
+        spacing_check = np.where(bars > 1, np.maximum(phi, MIN_BAR_SPACING) / spacing, 0.0)
+        spacing_check = np.where(np.isnan(phi) | np.isnan(bars), np.nan, spacing_check)
+
+    utilization = np.column_stack([flexure, min_reinforcement, max_k, deflection_check, spacing_check])
+    failed = utilization > 1.0
+
+    # Yönetici kontrol: en büyük kullanım oranı (NaN sütunlar atlanır)
+    governing = np.argmax(np.where(np.isnan(utilization), -np.inf, utilization), axis=1)
+    governing_utilization = utilization[np.arange(n_beams), governing]
+
+    return {
+        "checks": DESIGN_CHECKS,
+        "utilization": utilization,
+        "failed": failed,
+        "governing_index": governing,
+        "governing_check": np.asarray(DESIGN_CHECKS)[governing],
+        "governing_utilization": governing_utilization,
+        "passed": ~failed.any(axis=1),
+        "failure_counts": failed.sum(axis=0)
+    }
+
+def check_results_design(results, option_index=0, cover=0.05, **kwargs):
+    """
+    Hesap sonuçlarının tasarım kontrollerini tek vektörel çağrıda yapar.
+
+    Donatı hesabı içeren her sonuç için calculate_reinforcement
+    seçeneklerinden option_index sıradaki donatı kullanılır; seçenek sayısı
+    yetersizse son seçenek alınır. Kontrol başına kullanım oranları,
+    yönetici kontrol ve genel sonuç her sonuca "design_checks" anahtarıyla
+    eklenir.
+
+    Args:
+        results (list): "moment", "width", "height" (cm), "concrete_class",
+            "length", "max_deflection" ve "reinforcement" anahtarlarını içeren
+            sonuç sözlükleri
+        option_index (int): Kullanılacak donatı seçeneğinin sırası
+        cover (float): Paspayı (m)
+        **kwargs: run_design_checks'e aktarılan diğer parametreler
+
+    Returns:
+        dict: Donatılı sonuçların sırasıyla run_design_checks dizileri ve
+            sonuç listesindeki konumları ("indices")
+    """
+    indices = [i for i, result in enumerate(results)
+               if result.get("reinforcement") and result["reinforcement"].get("options")]
+    if not indices:
+        return {"indices": np.array([], dtype=int)}
+
+    chosen = [results[i]["reinforcement"]["options"][min(option_index, len(results[i]["reinforcement"]["options"]) - 1)]
+              for i in indices]
+    column = lambda key, scale=1.0: np.array([results[i][key] for i in indices], dtype=float) * scale
+    option_column = lambda key: np.array([option[key] for option in chosen], dtype=float)
+
+    checks = run_design_checks(
+        column("moment"), column("width", 0.01), column("height", 0.01),  # cm -> m
+        [results[i]["concrete_class"] for i in indices], option_column("area"),
+        length=column("length"), deflection=column("max_deflection"),
+        support_condition=[results[i].get("support_condition", "Basit Mesnetli") for i in indices],
+        diameter=option_column("diameter"), count=option_column("count"), cover=cover, **kwargs)
+
+    for row, index in enumerate(indices):
+        results[index]["design_checks"] = {
+            "utilization": {name: float(value) for name, value in zip(DESIGN_CHECKS, checks["utilization"][row])},
+            "governing_check": str(checks["governing_check"][row]),
+            "governing_utilization": float(checks["governing_utilization"][row]),
+            "passed": bool(checks["passed"][row])
+        }
+    checks["indices"] = np.array(indices)
+    return checks
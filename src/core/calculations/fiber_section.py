@@ -0,0 +1,286 @@
+import numpy as np
+from .cracked_section import elasticity_moduli
+from .reinforcement import TS500
+
+# Hognestad beton modeli: tepe gerilmesindeki ve nihai birim kısalma
+CONCRETE_PEAK_STRAIN = 0.002
+CONCRETE_ULTIMATE_STRAIN = 0.0035
+
+def _concrete_response(strain, fc, eps_c0, eps_cu, Ec=None, fct=None):
+    """Beton gerilmesi (MPa) ve teğet modülü dσ/dε (MPa), ortak ara değerlerle"""
+    strain = np.asarray(strain, dtype=float)
+    eta = np.minimum(strain, eps_c0) / eps_c0
+    slope = 0.15 / (eps_cu - eps_c0)
+    # Yükselen kol; εc0 ötesinde doğrusal iniş eklenir
+    ratio = eta * (2 - eta) - slope * np.maximum(strain - eps_c0, 0)
+    tangent_ratio = np.where(strain <= eps_c0, 2 * (1 - eta) / eps_c0, -slope)
+    outside = (strain <= 0) | (strain > eps_cu)
+    ratio = np.where(outside, 0.0, ratio)
+    tangent_ratio = np.where(outside, 0.0, tangent_ratio)
+    stress, tangent = fc * ratio, fc * tangent_ratio
+
+    if Ec is not None and fct is not None:
+        # Çatlamamış betonda çekme (negatif gerilme)
+        tension = strain * Ec
+        uncracked = (strain < 0) & (tension >= -fct)
+        stress = np.where(uncracked, tension, stress)
+        tangent = np.where(uncracked, Ec, tangent)
+    return stress, tangent
+
+def concrete_stress(strain, fc, eps_c0=CONCRETE_PEAK_STRAIN, eps_cu=CONCRETE_ULTIMATE_STRAIN,
+                    Ec=None, fct=None):
+    """
+    Hognestad beton gerilme-birim şekil değiştirme ilişkisi (vektörel).
+
+    Basınç pozitiftir. ε ≤ εc0 için σ = fc·[2ε/εc0 - (ε/εc0)²], εc0 ile εcu
+    arasında σ doğrusal olarak 0.85·fc'ye iner, εcu ötesinde beton ezilmiştir.
+    Ec ve fct verilirse beton çatlama birim uzamasına (fct/Ec) kadar doğrusal
+    elastik çekme taşır, sonrasında çekme gerilmesi sıfırdır.
+
+    Args:
+        strain (array): Birim şekil değiştirme (basınç pozitif)
+        fc (array): Beton basınç dayanımı (MPa)
+        eps_c0 (float): Tepe gerilmesindeki birim kısalma
+        eps_cu (float): Nihai birim kısalma
+        Ec (array, optional): Beton elastisite modülü (MPa)
+        fct (array, optional): Beton çekme dayanımı (MPa)
+
+    Returns:
+        array: Gerilme (MPa)
+    """
+    return _concrete_response(strain, fc, eps_c0, eps_cu, Ec, fct)[0]
+
+def steel_stress(strain, fy, Es=TS500.ES):
+    """
+    Elastik-tam plastik donatı çeliği gerilmesi (vektörel, basınç pozitif).
+
+    Args:
+        strain (array): Birim şekil değiştirme
+        fy (array): Akma dayanımı (MPa)
+        Es (float): Elastisite modülü (MPa)
+
+    Returns:
+        array: Gerilme (MPa)
+    """
+    return np.clip(Es * np.asarray(strain, dtype=float), -fy, fy)
+
+def _section_forces(kappa, eps_top, rows):
+    """
+    Verilen üst lif birim kısalması ve eğrilikte eksenel kuvvet (MN) ve
+    kesit ağırlık merkezine göre moment (MNm).
+
+    Her satır bir (kesit, eğri noktası) çiftidir; lifler ikinci eksendedir.
+    """
+    y = rows["h"][:, None] * rows["fiber_ratios"][None, :]
+    strain = eps_top[:, None] - kappa[:, None] * y
+    sigma_c = concrete_stress(strain, rows["fc"][:, None], eps_cu=rows["eps_cu"],
+                              Ec=rows["Ec"][:, None], fct=rows["fct"][:, None])
+    centroid = rows["h"] / 2
+    axial = sigma_c.sum(axis=1) * rows["fiber_area"]
+    moment = (sigma_c * (centroid[:, None] - y)).sum(axis=1) * rows["fiber_area"]
+
+    eps_s = None
+    for depth, area in ((rows["d"], rows["As"]), (rows["d2"], rows["As2"])):
+        strain_s = eps_top - kappa * depth
+        force = steel_stress(strain_s, rows["fy"]) * area
+        axial = axial + force
+        moment = moment + force * (centroid - depth)
+        eps_s = strain_s if eps_s is None else eps_s
+    return axial, moment, eps_s
+
+def _axial_force(depth, eps_top, rows):
+    """
+    Tarafsız eksen derinliği c için eksenel kuvvet N (MN) ve türevi dN/dc.
+
+    Lif birim şekil değiştirmesi ε = εüst·(1 - y/c) olduğundan
+    dε/dc = εüst·y/c² ve dN/dc = Σ Et·A·εüst·y/c² olur.
+    """
+    y = rows["h"][:, None] * rows["fiber_ratios"][None, :]
+    strain_rate = eps_top[:, None] * y / depth[:, None]**2
+    strain = eps_top[:, None] - strain_rate * depth[:, None]
+    fc, Ec, fct = rows["fc"][:, None], rows["Ec"][:, None], rows["fct"][:, None]
+
+    sigma_c, tangent_c = _concrete_response(strain, fc, CONCRETE_PEAK_STRAIN, rows["eps_cu"], Ec, fct)
+    axial = sigma_c.sum(axis=1) * rows["fiber_area"]
+    derivative = (tangent_c * strain_rate).sum(axis=1) * rows["fiber_area"]
+
+    for steel_depth, area in ((rows["d"], rows["As"]), (rows["d2"], rows["As2"])):
+        strain_s = eps_top * (1 - steel_depth / depth)
+        axial = axial + steel_stress(strain_s, rows["fy"]) * area
+        elastic = np.abs(strain_s) * TS500.ES < rows["fy"]
+        derivative = derivative + np.where(elastic, TS500.ES, 0.0) * area * eps_top * steel_depth / depth**2
+    return axial, derivative
+
+def _select_rows(rows, index):
+    """Satır verilerinden verilen satırları seçer; lif oranları ve εcu ortaktır"""
+    return {key: value if key in ("fiber_ratios", "eps_cu") else value[index]
+            for key, value in rows.items()}
+
+def _solve_curvature(eps_top, rows, tol, max_iter):
+    """
+    Eksenel denge N = 0 için tarafsız eksen derinliğini korumalı Newton
+    yöntemiyle tüm satırlarda aynı anda çözer.
+
+    Bilinmeyen tarafsız eksen derinliği c'dir, eğrilik κ = εüst/c. c = h'de
+    kesitin tamamı basınç altındadır (N > 0); c = h/1000'de çekme donatısı
+    aktığından N < 0 olur. Kök bu aralıkta kalır. Newton adımı aralık
+    dışına çıkarsa veya yeterince küçülmezse yerine ikiye bölme kullanılır
+    (rtsafe); aralık her adımda kökü içerecek şekilde daraltılır. Her
+    iterasyonda yalnızca yakınsamamış satırlar yeniden hesaplanır.
+
+    Returns:
+        tuple: (eğrilik, yakınsama maskesi)
+    """
+    h = rows["h"]
+    low, high = 1e-3 * h, h.copy()
+    # Başlangıç tahmini: elastik çatlamış kesit tarafsız ekseni
+    d = rows["d"]
+    rho_n = rows["As"] / (rows["b"] * d) * TS500.ES / rows["Ec"]
+    c = np.clip((np.sqrt(2 * rho_n + rho_n**2) - rho_n) * d, low, high)
+    previous_step = high - low
+
+    converged = np.zeros(eps_top.shape, dtype=bool)
+    active = np.arange(len(eps_top))
+    for _ in range(max_iter):
+        subset = _select_rows(rows, active)
+        ci, lo, hi = c[active], low[active], high[active]
+        f, df = _axial_force(ci, eps_top[active], subset)
+
+        # Kökü içeren aralığı daralt (N, c ile artar)
+        lo = np.where(f < 0, ci, lo)
+        hi = np.where(f > 0, ci, hi)
+
+        newton = ci - f / np.where(df > 0, df, np.inf)
+        use_newton = (df > 0) & (newton > lo) & (newton < hi) & \
+                     (np.abs(f / np.where(df > 0, df, np.inf)) < 0.5 * previous_step[active])
+        c_new = np.where(use_newton, newton, (lo + hi) / 2)
+        step = np.abs(c_new - ci)
+
+        low[active], high[active], c[active] = lo, hi, c_new
+        previous_step[active] = step
+
+        done = (f == 0) | (step <= tol * subset["h"])
+        converged[active[done]] = True
+        active = active[~done]
+        if len(active) == 0:
+            break
+    return eps_top / c, converged
+
+def calculate_moment_curvature(width, height, steel_area, concrete_class, cover=0.05,
+                               compression_area=0.0, steel_class="S420", design=False,
+                               n_points=200, n_fibers=50, eps_cu=CONCRETE_ULTIMATE_STRAIN,
+                               with_tension=True, tol=1e-10, max_iter=100, chunk_size=128):
+    """
+    Lifli kesit modeliyle moment-eğrilik eğrileri (vektörel).
+
+    Dikdörtgen kesit yükseklik boyunca n_fibers beton lifine bölünür; çekme
+    ve basınç donatısı ayrık liflerdir. Eğri, üst lif birim kısalması 0'dan
+    εcu'ya kadar n_points noktada artırılarak elde edilir; her noktada
+    eksenel denge, tarafsız eksen derinliği için parantezli (korumalı
+    Newton) kök bulucuyla çözülür. Tüm
+    kesitler ve noktalar birlikte çözülür, bellek için kesitler chunk_size
+    büyüklüğünde parçalara ayrılır.
+
+    Args:
+        width, height: Kesit genişliği ve yüksekliği (m); diziler olabilir
+        steel_area: Çekme donatısı alanı (mm²)
+        concrete_class: Beton sınıfı veya sınıf dizisi
+        cover (float): Paspayı (m)
+        compression_area: Basınç donatısı alanı (mm²)
+        steel_class (str): Çelik sınıfı
+        design (bool): Tasarım dayanımları (fcd, fyd) kullanılsın mı;
+            varsayılan karakteristik dayanımlardır
+        n_points (int): Eğri nokta sayısı
+        n_fibers (int): Beton lif sayısı
+        eps_cu (float): Betonun nihai birim kısalması
+        with_tension (bool): Betonun çatlamadan önceki çekme dayanımı dikkate alınsın mı
+        tol (float): Göreli denge toleransı
+        max_iter (int): Kök bulucu iterasyon sınırı
+        chunk_size (int): Parça başına kesit sayısı
+
+    Returns:
+        dict: "top_strain" (n_points,), (kesit, n_points) boyutunda "curvature"
+            (1/m), "moment" (kNm), "neutral_axis" (m), "steel_strain" ve
+            "converged"; kesit başına "yield_curvature", "yield_moment",
+            "ultimate_curvature", "ultimate_moment" ve "curvature_ductility"
+            (akma olmayan kesitlerde NaN)
+    """
+    if steel_class not in TS500.STEEL_CLASSES:
+        raise ValueError(f"Geçersiz çelik sınıfı: {steel_class}")
+    if n_points < 2 or n_fibers < 1:
+        raise ValueError("Nokta ve lif sayıları pozitif olmalıdır!")
+
+    b, h, As, As2, classes = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (width, height, steel_area, compression_area)),
+        np.asarray(concrete_class))
+    shape = b.shape
+    b, h, As, As2, classes = (v.ravel() for v in (b, h, As, As2, classes))
+    if np.any(As <= 0):
+        raise ValueError("Çekme donatısı alanı pozitif olmalıdır!")
+
+    fck = np.vectorize(TS500.get_fck, otypes=[float])(classes)
+    fyk = float(TS500.STEEL_CLASSES[steel_class])
+    fc = TS500.calculate_fcd(fck) if design else fck
+    fy = np.full(fck.shape, TS500.calculate_fyd(fyk) if design else fyk)
+    Ec = elasticity_moduli(classes) / 1e6  # MPa
+    fct = TS500.calculate_fctk(fck) if with_tension else np.zeros_like(fck)
+
+    eps_top = np.linspace(0, eps_cu, n_points)
+    t = (np.arange(n_fibers) + 0.5) / n_fibers
+
+    n_sections = b.size
+    kappa = np.zeros((n_sections, n_points))
+    moment = np.zeros((n_sections, n_points))
+    steel_strain = np.zeros((n_sections, n_points))
+    converged = np.ones((n_sections, n_points), dtype=bool)
+
+    # Satırlar (kesit, eğri noktası) çiftleridir; sıfır birim kısalmada eğrilik ve moment sıfırdır
+    n_rows = n_points - 1
+    for start in range(0, n_sections, chunk_size):
+        part = slice(start, start + chunk_size)
+        repeat = lambda value: np.repeat(value[part], n_rows)
+        rows = {
+            "h": repeat(h), "d": repeat(h) - cover, "d2": np.full(repeat(h).shape, cover),
+            "As": repeat(As) / 1e6, "As2": repeat(As2) / 1e6,  # mm² -> m²
+            "fc": repeat(fc), "fy": repeat(fy), "Ec": repeat(Ec), "fct": repeat(fct),
+            "b": repeat(b), "fiber_area": repeat(b * h / n_fibers),
+            "fiber_ratios": t, "eps_cu": eps_cu
+        }
+        top = np.tile(eps_top[1:], len(rows["h"]) // n_rows)
+        k, ok = _solve_curvature(top, rows, tol, max_iter)
+        _, m, eps_s = _section_forces(k, top, rows)
+
+        kappa[part, 1:] = k.reshape(-1, n_rows)
+        moment[part, 1:] = m.reshape(-1, n_rows) * 1000  # MNm -> kNm
+        steel_strain[part, 1:] = eps_s.reshape(-1, n_rows)
+        converged[part, 1:] = ok.reshape(-1, n_rows)
+
+    # Akma noktası: çekme donatısı birim uzamasının εy'yi ilk aştığı nokta (doğrusal enterpolasyon)
+    eps_y = fy[:, None] / TS500.ES
+    tension_strain = -steel_strain
+    yielded = tension_strain >= eps_y
+    has_yield = yielded.any(axis=1)
+    i = np.maximum(np.argmax(yielded, axis=1), 1)
+    n = np.arange(n_sections)
+    s0, s1 = tension_strain[n, i - 1], tension_strain[n, i]
+    ratio = np.clip((eps_y[:, 0] - s0) / np.where(s1 > s0, s1 - s0, 1.0), 0, 1)
+    interpolate = lambda values: values[n, i - 1] + ratio * (values[n, i] - values[n, i - 1])
+    yield_curvature = np.where(has_yield, interpolate(kappa), np.nan)
+    yield_moment = np.where(has_yield, interpolate(moment), np.nan)
+
+    ultimate_curvature = kappa[:, -1]
+    reshape = lambda value: value.reshape(shape + value.shape[1:])
+
+    return {
+        "top_strain": eps_top,
+        "curvature": reshape(kappa),
+        "moment": reshape(moment),
+        "neutral_axis": reshape(np.divide(eps_top, kappa, out=np.full_like(kappa, np.nan), where=kappa > 0)),
+        "steel_strain": reshape(steel_strain),
+        "converged": reshape(converged),
+        "yield_curvature": reshape(yield_curvature),
+        "yield_moment": reshape(yield_moment),
+        "ultimate_curvature": reshape(ultimate_curvature),
+        "ultimate_moment": reshape(moment.max(axis=1)),
+        "curvature_ductility": reshape(ultimate_curvature / yield_curvature)
+    }
@@ -0,0 +1,300 @@
+import numpy as np
+from scipy.linalg import solve_banded, LinAlgError
+from .materials import calculate_elasticity_modulus
+from .formula_registry import get_beam_kernel
+from .reinforcement import calculate_reinforcement as calc_reinforcement
+
+# Geçerli mesnet tipleri: "pinned" sehimi, "fixed" sehim ve dönmeyi tutar
+SUPPORT_TYPES = ("pinned", "fixed")
+
+# Bant genişliği: düğüm başına (w, M) serbestlikleri komşu düğümle bağlanır
+BANDWIDTH = 3
+
+# Kapalı form çözümü bulunan (basit mesnetli, prizmatik) yük tipleri
+FAST_PATH_LOAD_TYPES = ("Tekil Yük", "Düzgün Yayılı Yük")
+
+def assemble_mixed_band(lengths, EI):
+    """
+    Karma (sehim-moment) formülasyonun sistem matrisini bant formunda kurar.
+
+    Bilinmeyenler düğüm başına [w_i, M_i] sırasıyla dizilir. Her eleman
+    için doğrusal şekil fonksiyonlarıyla
+        ∫ M' v' dx = ∫ q v dx        (denge, w satırları)
+        ∫ w' ψ' dx - ∫ M ψ / EI dx = 0  (uygunluk, M satırları)
+    denklemleri yazılır. Dördüncü mertebe rijitlik matrisinin koşul sayısı
+    n⁴ ile büyürken bu sistem iki ikinci mertebe operatörden oluştuğu için
+    10⁵ eleman mertebesinde de çift hassasiyetle çözülebilir.
+
+    Depolama scipy.linalg.solve_banded biçimindedir:
+    ab[BANDWIDTH + i - j, j] = A[i, j].
+
+    Args:
+        lengths (array): Eleman boyları (m)
+        EI (array): Eleman eğilme rijitlikleri (N·m²)
+
+    Returns:
+        array: (2·BANDWIDTH + 1, n_dof) bant matrisi
+    """
+    n_elements = len(lengths)
+    ab = np.zeros((2 * BANDWIDTH + 1, 2 * (n_elements + 1)))
+
+    e = np.arange(n_elements)
+    w0, m0, w1, m1 = 2 * e, 2 * e + 1, 2 * e + 2, 2 * e + 3
+    b = 1 / lengths                  # ∫ N_i' N_j' dx katsayısı
+    a = lengths / (6 * EI)           # ∫ N_i N_j / EI dx katsayısı
+
+    entries = [
+        # Denge satırları
+        (w0, m0, b), (w0, m1, -b), (w1, m0, -b), (w1, m1, b),
+        # Uygunluk satırları
+        (m0, w0, b), (m0, w1, -b), (m1, w0, -b), (m1, w1, b),
+        (m0, m0, -2 * a), (m0, m1, -a), (m1, m0, -a), (m1, m1, -2 * a)
+    ]
+    # Her kalıpta hedef konumlar farklı olduğundan doğrudan toplanabilir
+    for rows, cols, values in entries:
+        ab[BANDWIDTH + rows - cols, cols] += values
+    return ab
+
+def constrain_rows(ab, f, dofs):
+    """
+    Verilen serbestliklerin denklemlerini u_d = 0 ile değiştirir.
+
+    Args:
+        ab (array): Bant matris (yerinde değiştirilir)
+        f (array): Yük vektörü (yerinde değiştirilir)
+        dofs (array): Sıfırlanacak serbestlik numaraları
+    """
+    n_dof = ab.shape[1]
+    for offset in range(-BANDWIDTH, BANDWIDTH + 1):
+        cols = dofs + offset
+        valid = (cols >= 0) & (cols < n_dof)
+        ab[BANDWIDTH - offset, cols[valid]] = 0.0
+    ab[BANDWIDTH, dofs] = 1.0
+    f[dofs] = 0.0
+
+def support_nodes(supports, node_x):
+    """
+    Mesnet tanımlarını düğüm numaralarına çevirir.
+
+    Args:
+        supports: [(konum, tip), ...] şeklinde mesnet listesi, tip "pinned" veya "fixed"
+        node_x (array): Düğüm konumları (m)
+
+    Returns:
+        tuple: (mesnetli düğümler, ankastre düğümler)
+    """
+    supported, fixed = [], []
+    last = len(node_x) - 1
+    for position, support_type in supports:
+        if support_type not in SUPPORT_TYPES:
+            raise ValueError(f"Geçersiz mesnet tipi: {support_type}")
+        node = int(np.argmin(np.abs(node_x - position)))
+        supported.append(node)
+        if support_type == "fixed":
+            if node not in (0, last):
+                raise ValueError("Ankastre mesnet yalnızca kiriş uçlarında tanımlanabilir!")
+            fixed.append(node)
+
+    supported = sorted(set(supported))
+    fixed = sorted(set(fixed))
+    # İki mesnet veya bir ankastre uç olmadan kiriş mekanizmadır
+    if len(supported) + len(fixed) < 2:
+        raise ValueError("Mesnet koşulları yetersiz, kiriş stabil değil!")
+    return np.array(supported, dtype=int), np.array(fixed, dtype=int)
+
+def _nodal_loads(node_x, q_nodes, point_loads):
+    """Yayılı ve tekil yüklerin doğrusal şekil fonksiyonlarıyla düğüm yükleri"""
+    lengths = np.diff(node_x)
+    q1, q2 = q_nodes[:-1], q_nodes[1:]
+    f = np.zeros(len(node_x))
+    f[:-1] += lengths * (2 * q1 + q2) / 6
+    f[1:] += lengths * (q1 + 2 * q2) / 6
+
+    n_elements = len(lengths)
+    for position, P in point_loads:
+        e = int(np.clip(np.searchsorted(node_x, position, side="right") - 1, 0, n_elements - 1))
+        xi = (position - node_x[e]) / lengths[e]
+        f[e] += P * (1 - xi)
+        f[e + 1] += P * xi
+    return f
+
+def solve_beam_fe(length, E, I, supports, distributed_load=0.0, point_loads=None, n_elements=200):
+    """
+    Genel mesnet koşullu ve değişken kesitli kirişi sonlu elemanlarla çözer.
+
+    Kiriş eşit boylu elemanlara bölünür, karma formülasyonun matrisi
+    vektörel olarak bant formunda kurulur ve bant çözücüyle O(n) sürede
+    çözülür. Sehim ve yükler aşağı yönde pozitiftir; moment alt lifi çeken
+    (açıklık) yönde pozitiftir. Ankastre mesnetler yalnızca uçlarda olabilir.
+
+    Args:
+        length (float): Kiriş uzunluğu (m)
+        E (float): Elastisite modülü (N/m²)
+        I (float veya array): Atalet momenti (m⁴), eleman başına dizi olabilir
+        supports: [(konum, tip), ...] mesnet listesi, tip "pinned" veya "fixed"
+        distributed_load (float veya array): Yayılı yük (kN/m), düğüm başına
+            dizi verilirse elemanlar boyunca doğrusal değişir
+        point_loads: [(konum, yük), ...] tekil yük listesi (m, kN)
+        n_elements (int): Eleman sayısı
+
+    Returns:
+        dict: Düğüm konumları, sehim (m), dönme, moment (kNm), kesme (kN)
+            dağılımları ve mesnet tepkileri (kN)
+    """
+    if length <= 0 or n_elements < 1:
+        raise ValueError("Kiriş uzunluğu ve eleman sayısı pozitif olmalıdır!")
+    point_loads = point_loads or []
+
+    node_x = np.linspace(0, length, n_elements + 1)
+    lengths = np.diff(node_x)
+    EI = E * np.broadcast_to(np.asarray(I, dtype=float), lengths.shape)
+
+    supported, fixed = support_nodes(supports, node_x)
+
+    # Yükler kN'dan N'a dönüştürülüyor
+    q_nodes = np.broadcast_to(np.asarray(distributed_load, dtype=float) * 1000, node_x.shape)
+    nodal_loads = _nodal_loads(node_x, q_nodes, [(pos, P * 1000) for pos, P in point_loads])
+
+    ab = assemble_mixed_band(lengths, EI)
+    f = np.zeros(ab.shape[1])
+    f[0::2] = nodal_loads
+
+    # Mesnetlerde sehim sıfır; mafsallı ve serbest uçlarda moment sıfır
+    ends = np.array([0, n_elements])
+    moment_free_ends = ends[~np.isin(ends, fixed)]
+    constrain_rows(ab, f, np.concatenate([2 * supported, 2 * moment_free_ends + 1]))
+
+    try:
+        solution = solve_banded((BANDWIDTH, BANDWIDTH), ab, f)
+    except LinAlgError:
+        raise ValueError("Mesnet koşulları yetersiz, kiriş stabil değil!")
+
+    deflection = solution[0::2]
+    moment = solution[1::2]
+
+    # Mesnet tepkileri: denge denklemlerinin kalanı (yukarı yönde pozitif)
+    slope = (moment[1:] - moment[:-1]) / lengths
+    internal = np.zeros(len(node_x))
+    internal[:-1] -= slope
+    internal[1:] += slope
+    reactions = (nodal_loads - internal)[supported] / 1000  # kN
+
+    # Kesme kuvveti dengeden: V(x⁺) = ΣR - ∫q - ΣP (son düğümde sol limit)
+    q_cumulative = np.concatenate([[0.0], np.cumsum(lengths * (q_nodes[:-1] + q_nodes[1:]) / 2)]) / 1000
+    point_x = np.array([pos for pos, _ in point_loads], dtype=float)
+    point_P = np.array([P for _, P in point_loads], dtype=float)
+    right_of = np.arange(len(node_x))[:, None] >= supported[None, :]
+    right_of[-1] = supported < n_elements
+    shear = right_of @ reactions - q_cumulative
+    if len(point_P):
+        passed = node_x[:, None] >= point_x[None, :]
+        passed[-1] = point_x < length
+        shear -= passed @ point_P
+
+    return {
+        "x_values": node_x,
+        "deflection_distribution": deflection,
+        "rotation_distribution": np.gradient(deflection, node_x),
+        "moment_distribution": moment / 1000,  # kNm
+        "shear_distribution": shear,
+        "reactions": list(zip(node_x[supported], reactions)),
+        "moment": np.max(np.abs(moment)) / 1000,
+        "shear": np.max(np.abs(shear)),
+        "max_deflection": np.max(np.abs(deflection))
+    }
+
+def _is_simply_supported(supports, length):
+    """Mesnet listesinin iki ucu mafsallı basit kiriş olup olmadığını kontrol eder"""
+    if len(supports) != 2:
+        return False
+    positions = sorted(pos for pos, _ in supports)
+    types = {support_type for _, support_type in supports}
+    return types == {"pinned"} and np.isclose(positions[0], 0) and np.isclose(positions[1], length)
+
+def _closed_form_analysis(load, length, E, I, load_type, x_values):
+    """Basit mesnetli prizmatik kiriş için kapalı form sonuçlar (sehim m cinsinden)"""
+    kernel = get_beam_kernel("Basit Mesnetli", load_type)
+    return {
+        "moment": float(kernel["moment"](load, length)),
+        "shear": float(kernel["shear"](load, length)),
+        "max_deflection": float(kernel["deflection"](load, length, E, I)),
+        "moment_distribution": kernel["moment_distribution"](load, length, x_values),
+        "shear_distribution": kernel["shear_distribution"](load, length, x_values),
+        "deflection_distribution": kernel["deflection_distribution"](load, length, E, I, x_values)
+    }
+
+def calculate_beam_analysis_fe(length, load, width, height, concrete_class, load_type="Tekil Yük",
+                               supports=None, width_end=None, height_end=None,
+                               n_elements=200, with_reinforcement=False):
+    """
+    Genel mesnetli ve/veya değişken kesitli kiriş analizi.
+
+    Basit mesnetli prizmatik kirişlerde tekil ve düzgün yayılı yük için
+    kapalı form formüller (hızlı yol) kullanılır; diğer tüm durumlar sonlu
+    eleman çözücüsüne gönderilir. Kesit boyutları başlangıç (width, height)
+    ile bitiş (width_end, height_end) değerleri arasında doğrusal değişir.
+
+    Args:
+        length (float): Kiriş uzunluğu (m)
+        load (float): Yük değeri (kN veya kN/m)
+        width (float): Başlangıç kesit genişliği (cm)
+        height (float): Başlangıç kesit yüksekliği (cm)
+        concrete_class (str): Beton sınıfı
+        load_type (str): Yük tipi
+        supports: [(konum, tip), ...] mesnet listesi, varsayılan basit mesnet
+        width_end (float, optional): Bitiş kesit genişliği (cm)
+        height_end (float, optional): Bitiş kesit yüksekliği (cm)
+        n_elements (int): Eleman sayısı (hızlı yolda örnek nokta sayısı da budur)
+        with_reinforcement (bool): Donatı hesabı yapılsın mı
+
+    Returns:
+        dict: calculate_beam_analysis ile aynı anahtarlar (sehim m cinsinden)
+            ve kullanılan yöntem ("closed_form" veya "fe")
+    """
+    if load_type not in ("Tekil Yük", "Düzgün Yayılı Yük", "Üçgen Yayılı Yük"):
+        raise ValueError(f"Geçersiz yük tipi: {load_type}")
+
+    if supports is None:
+        supports = [(0.0, "pinned"), (length, "pinned")]
+    width_end = width if width_end is None else width_end
+    height_end = height if height_end is None else height_end
+
+    E = calculate_elasticity_modulus(concrete_class)
+    prismatic = width_end == width and height_end == height
+
+    if prismatic and load_type in FAST_PATH_LOAD_TYPES and _is_simply_supported(supports, length):
+        # Hızlı yol: kapalı form çözüm
+        I = (width/100) * (height/100)**3 / 12  # cm -> m dönüşümü
+        x_values = np.linspace(0, length, n_elements + 1)
+        results = _closed_form_analysis(load, length, E, I, load_type, x_values)
+        results["x_values"] = x_values
+        results["method"] = "closed_form"
+    else:
+        # Eleman ortalarındaki kesit boyutları
+        t = (np.arange(n_elements) + 0.5) / n_elements
+        b = (width + (width_end - width) * t) / 100    # cm -> m
+        h = (height + (height_end - height) * t) / 100  # cm -> m
+        I = b * h**3 / 12
+
+        if load_type == "Düzgün Yayılı Yük":
+            results = solve_beam_fe(length, E, I, supports, distributed_load=load, n_elements=n_elements)
+        elif load_type == "Üçgen Yayılı Yük":
+            # Yük solda sıfırdan sağda maksimum değere doğrusal artar
+            q_nodes = load * np.linspace(0, 1, n_elements + 1)
+            results = solve_beam_fe(length, E, I, supports, distributed_load=q_nodes, n_elements=n_elements)
+        else:  # Tekil Yük - açıklık ortasında
+            results = solve_beam_fe(length, E, I, supports, point_loads=[(length / 2, load)],
+                                    n_elements=n_elements)
+        results["method"] = "fe"
+
+    results["elasticity_modulus"] = E/1e9  # GPa cinsinden
+    results["load_type"] = load_type
+
+    if with_reinforcement:
+        # Donatı, en büyük momentin oluştuğu kesitin boyutlarıyla hesaplanır
+        critical = np.argmax(np.abs(results["moment_distribution"])) / max(len(results["x_values"]) - 1, 1)
+        b_crit = width + (width_end - width) * critical
+        h_crit = height + (height_end - height) * critical
+        results["reinforcement"] = calc_reinforcement(results["moment"], concrete_class, b_crit/100, h_crit/100)
+
+    return results
@@ -0,0 +1,193 @@
+import numpy as np
+from .load_types import (
+    calculate_moment_distribution_uniform_load, calculate_shear_distribution_uniform_load,
+    calculate_deflection_distribution_uniform_load,
+    calculate_moment_distribution_triangular_load, calculate_shear_distribution_triangular_load,
+    calculate_deflection_distribution_triangular_load
+)
+
+SUPPORT_CONDITIONS = ("Basit Mesnetli", "Konsol", "İki Ucu Ankastre", "Ankastre-Mafsallı")
+LOAD_TYPES = ("Tekil Yük", "Düzgün Yayılı Yük", "Üçgen Yayılı Yük")
+
+# x = 0'da ankastre kirişler için mesnet tepkisi ve ankastre momenti katsayıları (r, m):
+# R_A = r·F, M_A = m·F·L; F tekil yükte P, yayılı yüklerde q·L
+# Üçgen yük x = 0'da sıfırdan x = L'de q değerine doğrusal artar.
+_FIXED_END_COEFFICIENTS = {
+    ("Konsol", "Tekil Yük"): (1.0, -1.0),
+    ("Konsol", "Düzgün Yayılı Yük"): (1.0, -1/2),
+    ("Konsol", "Üçgen Yayılı Yük"): (1/2, -1/3),
+    ("İki Ucu Ankastre", "Tekil Yük"): (1/2, -1/8),
+    ("İki Ucu Ankastre", "Düzgün Yayılı Yük"): (1/2, -1/12),
+    ("İki Ucu Ankastre", "Üçgen Yayılı Yük"): (3/20, -1/30),
+    ("Ankastre-Mafsallı", "Tekil Yük"): (11/16, -3/16),
+    ("Ankastre-Mafsallı", "Düzgün Yayılı Yük"): (5/8, -1/8),
+    ("Ankastre-Mafsallı", "Üçgen Yayılı Yük"): (9/40, -7/120),
+}
+
+# Tekil yükün konumu (L'ye oranla): konsolda serbest uçta, diğerlerinde açıklık ortasında
+_POINT_LOAD_POSITION = {"Konsol": 1.0, "İki Ucu Ankastre": 0.5, "Ankastre-Mafsallı": 0.5}
+
+# Maksimum değer katsayılarının hesaplandığı birim kiriş ızgarası
+_COEFFICIENT_GRID = 20001
+
+def _point_terms(load, length, x, a):
+    """Kesitin solundaki tekil yükün kesme, moment ve çift integral katkıları"""
+    s = np.maximum(x - a * length, 0)
+    return load * (x > a * length), load * s, load * s**3 / 6
+
+def _uniform_terms(load, length, x, a):
+    """Kesitin solundaki düzgün yayılı yükün katkıları"""
+    return load * x, load * x**2 / 2, load * x**4 / 24
+
+def _triangular_terms(load, length, x, a):
+    """Kesitin solundaki üçgen yayılı yükün katkıları"""
+    return load * x**2 / (2 * length), load * x**3 / (6 * length), load * x**5 / (120 * length)
+
+# Yük tipi -> (F = yük·L^k üssü k, katkı fonksiyonu)
+_LOAD_SHAPES = {
+    "Tekil Yük": (0, _point_terms),
+    "Düzgün Yayılı Yük": (1, _uniform_terms),
+    "Üçgen Yayılı Yük": (1, _triangular_terms),
+}
+
+def _with_max_values(kernel, k, moment, shear, deflection):
+    """Dağılım fonksiyonlarına maksimum değer fonksiyonlarını ekler"""
+    kernel["moment"] = moment
+    kernel["shear"] = shear
+    kernel["deflection"] = deflection
+    kernel["exponent"] = k
+    return kernel
+
+def _fixed_end_kernel(support_condition, load_type):
+    """
+    x = 0'da ankastre kiriş için çekirdeği oluşturur.
+
+    Ankastre uçtaki tepkiler bilindiğinde iç kuvvetler ve sehim
+        M(x) = M_A + R_A·x - Mp(x),  V(x) = R_A - Vp(x)
+        EI·w(x) = W(x) - M_A·x²/2 - R_A·x³/6
+    ile kapalı formda yazılır (Mp, Vp, W: kesitin solundaki yükün katkıları).
+    Maksimum değer katsayıları birim kiriş üzerinde bir kez hesaplanır.
+    """
+    r, m = _FIXED_END_COEFFICIENTS[(support_condition, load_type)]
+    k, terms = _LOAD_SHAPES[load_type]
+    a = _POINT_LOAD_POSITION[support_condition]
+
+    def moment_distribution(load, length, x):
+        _, Mp, _ = terms(load, length, x, a)
+        return m * load * length**(k + 1) + r * load * length**k * x - Mp
+
+    def shear_distribution(load, length, x):
+        Vp, _, _ = terms(load, length, x, a)
+        return r * load * length**k - Vp
+
+    def deflection_distribution(load, length, E, I, x):
+        _, _, W = terms(load, length, x, a)
+        M_A = m * load * length**(k + 1)
+        R_A = r * load * length**k
+        # Yük kN'dan N'a dönüştürülüyor, sonuç m cinsinden
+        return 1000 * (W - M_A * x**2 / 2 - R_A * x**3 / 6) / (E * I)
+
+    xi = np.linspace(0, 1, _COEFFICIENT_GRID)
+    c_moment = np.max(np.abs(moment_distribution(1.0, 1.0, xi)))
+    c_shear = np.max(np.abs(shear_distribution(1.0, 1.0, xi)))
+    c_deflection = np.max(np.abs(deflection_distribution(1.0, 1.0, 1.0, 1.0, xi)))
+
+    kernel = {
+        "moment_distribution": moment_distribution,
+        "shear_distribution": shear_distribution,
+        "deflection_distribution": deflection_distribution
+    }
+    return _with_max_values(
+        kernel, k,
+        lambda load, length: c_moment * load * length**(k + 1),
+        lambda load, length: c_shear * load * length**k,
+        lambda load, length, E, I: c_deflection * load * length**(k + 3) / (E * I)
+    )
+
+def _simply_supported_point_kernel():
+    """Basit mesnetli kiriş, açıklık ortasında tekil yük"""
+    def moment_distribution(load, length, x):
+        return load * np.minimum(x, length - x) / 2
+
+    def shear_distribution(load, length, x):
+        return np.where(x < length / 2, load / 2, -load / 2)
+
+    def deflection_distribution(load, length, E, I, x):
+        a = np.minimum(x, length - x)
+        return load * 1000 * a * (3 * length**2 - 4 * a**2) / (48 * E * I)
+
+    kernel = {
+        "moment_distribution": moment_distribution,
+        "shear_distribution": shear_distribution,
+        "deflection_distribution": deflection_distribution
+    }
+    return _with_max_values(
+        kernel, 0,
+        lambda load, length: load * length / 4,
+        lambda load, length: load / 2,
+        lambda load, length, E, I: load * 1000 * length**3 / (48 * E * I)
+    )
+
+def _simply_supported_uniform_kernel():
+    """Basit mesnetli kiriş, düzgün yayılı yük"""
+    kernel = {
+        "moment_distribution": calculate_moment_distribution_uniform_load,
+        "shear_distribution": calculate_shear_distribution_uniform_load,
+        "deflection_distribution": calculate_deflection_distribution_uniform_load
+    }
+    return _with_max_values(
+        kernel, 1,
+        lambda load, length: load * length**2 / 8,
+        lambda load, length: load * length / 2,
+        lambda load, length, E, I: 5 * load * 1000 * length**4 / (384 * E * I)
+    )
+
+def _simply_supported_triangular_kernel():
+    """Basit mesnetli kiriş, üçgen yayılı yük"""
+    kernel = {
+        "moment_distribution": calculate_moment_distribution_triangular_load,
+        "shear_distribution": calculate_shear_distribution_triangular_load,
+        "deflection_distribution": calculate_deflection_distribution_triangular_load
+    }
+    return _with_max_values(
+        kernel, 1,
+        lambda load, length: load * length**2 / 12,
+        lambda load, length: load * length / 2,
+        lambda load, length, E, I: load * 1000 * length**4 / (120 * E * I)
+    )
+
+def _build_registry():
+    """Tüm (mesnet koşulu, yük tipi) çekirdeklerini içe aktarma sırasında oluşturur"""
+    registry = {
+        ("Basit Mesnetli", "Tekil Yük"): _simply_supported_point_kernel(),
+        ("Basit Mesnetli", "Düzgün Yayılı Yük"): _simply_supported_uniform_kernel(),
+        ("Basit Mesnetli", "Üçgen Yayılı Yük"): _simply_supported_triangular_kernel(),
+    }
+    for support_condition, load_type in _FIXED_END_COEFFICIENTS:
+        registry[(support_condition, load_type)] = _fixed_end_kernel(support_condition, load_type)
+    return registry
+
+FORMULA_REGISTRY = _build_registry()
+
+def get_beam_kernel(support_condition, load_type):
+    """
+    Mesnet koşulu ve yük tipine ait hesap çekirdeğini döndürür.
+
+    Çekirdek; "moment", "shear", "deflection" maksimum değer fonksiyonları ile
+    "moment_distribution", "shear_distribution", "deflection_distribution"
+    dağılım fonksiyonlarını içeren bir sözlüktür; "exponent" maksimum
+    momentin yük·L^(exponent+1) ile ölçeklendiğini gösterir. Tüm fonksiyonlar
+    numpy yayınlamasıyla çalışır; senaryo dizileri tek çağrıda hesaplanabilir.
+    Sehimler m cinsindendir.
+
+    Args:
+        support_condition (str): Mesnet koşulu (SUPPORT_CONDITIONS)
+        load_type (str): Yük tipi (LOAD_TYPES)
+
+    Returns:
+        dict: Hesap çekirdeği
+    """
+    try:
+        return FORMULA_REGISTRY[(support_condition, load_type)]
+    except KeyError:
+        raise ValueError(f"Geçersiz mesnet koşulu veya yük tipi: {support_condition}, {load_type}")
@@ -0,0 +1,144 @@
+import numpy as np
+
+def calculate_influence_lines(length, n_points=100):
+    """
+    Basit mesnetli kiriş için moment ve kesme tesir çizgilerini hesaplar.
+
+    Kesitler ve birim yük konumları aynı örnekleme ızgarası üzerindedir;
+    matrisin i. satırı x_i kesitinin tesir çizgisidir. Kiriş başına bir kez
+    hesaplanıp tüm araç konumları için tekrar kullanılır.
+
+    Args:
+        length (float): Kiriş uzunluğu (m)
+        n_points (int): Izgara nokta sayısı
+
+    Returns:
+        dict: "x_values" (m), "moment" (n×n, kNm/kN) ve "shear" (n×n, kN/kN)
+    """
+    if length <= 0:
+        raise ValueError("Kiriş uzunluğu pozitif olmalıdır!")
+    if n_points < 2:
+        raise ValueError("Izgara en az 2 noktadan oluşmalıdır!")
+
+    x_values = np.linspace(0, length, n_points)
+    section = x_values[:, None]   # Kesit konumları (satırlar)
+    position = x_values[None, :]  # Birim yük konumları (sütunlar)
+
+    # Yük kesitin solundayken M = a(L-x)/L, sağındayken M = x(L-a)/L
+    moment = np.where(position <= section,
+                      position * (length - section),
+                      section * (length - position)) / length
+
+    # Yük kesitin solundayken V = -a/L, sağındayken V = 1 - a/L
+    shear = np.where(position < section,
+                     -position / length,
+                     1 - position / length)
+
+    return {
+        "x_values": x_values,
+        "moment": moment,
+        "shear": shear
+    }
+
+def _axle_kernel(axles, dx):
+    """Aks yüklerini ızgara adımına yerleştirerek kayan pencere çekirdeğini oluşturur"""
+    offsets = np.array([pos for pos, _ in axles], dtype=float)
+    loads = np.array([P for _, P in axles], dtype=float)
+
+    if np.any(offsets < 0):
+        raise ValueError("Aks konumları ilk aksa göre negatif olamaz!")
+
+    # Aks mesafeleri en yakın ızgara adımına yuvarlanır
+    indices = np.rint(offsets / dx).astype(int)
+    kernel = np.zeros(indices.max() + 1)
+    np.add.at(kernel, indices, loads)
+    return kernel
+
+def _slide_direct(lines, kernel):
+    """Her satır için kayan pencere skaler çarpımı (kısa araç dizileri)"""
+    m = len(kernel)
+    padded = np.pad(lines, ((0, 0), (m - 1, m - 1)))
+    windows = np.lib.stride_tricks.sliding_window_view(padded, m, axis=1)
+    return windows @ kernel[::-1]
+
+def _slide_fft(lines, kernel):
+    """Her satır için FFT konvolüsyonu (uzun araç dizileri)"""
+    n_out = lines.shape[1] + len(kernel) - 1
+    n_fft = 1 << (n_out - 1).bit_length()
+    spectrum = np.fft.rfft(lines, n_fft, axis=1) * np.fft.rfft(kernel, n_fft)
+    return np.fft.irfft(spectrum, n_fft, axis=1)[:, :n_out]
+
+def calculate_moving_load_envelope(axles, length, influence_lines=None, n_points=100, fft_threshold=32):
+    """
+    Kiriş üzerinden geçen aks yükü dizisi için moment ve kesme zarflarını hesaplar.
+
+    Araç, ön aksı kirişe girdiği andan son aksı kirişten çıktığı ana kadar
+    ızgara adımlarıyla ilerletilir. Her kesitin tepkisi, tesir çizgisinin aks
+    çekirdeğiyle konvolüsyonudur; çekirdek uzunluğu fft_threshold değerini
+    aşarsa FFT, aksi halde doğrudan kayan pencere çarpımı kullanılır.
+
+    Args:
+        axles: [(konum, yük), ...] şeklinde aks listesi; konum ön aksa göre
+            geriye doğru mesafedir (m), yük kN cinsindendir
+        length (float): Kiriş uzunluğu (m)
+        influence_lines (dict, optional): calculate_influence_lines sonucu,
+            verilmezse hesaplanır
+        n_points (int): Izgara nokta sayısı (influence_lines verilmemişse)
+        fft_threshold (int): FFT'ye geçilecek çekirdek uzunluğu (ızgara adımı)
+
+    Returns:
+        dict: Zarflar, kritik araç konumları ve maksimum değerler
+    """
+    if not axles:
+        raise ValueError("En az bir aks yükü tanımlanmalıdır!")
+
+    if influence_lines is None:
+        influence_lines = calculate_influence_lines(length, n_points)
+
+    x_values = influence_lines["x_values"]
+    dx = x_values[1] - x_values[0]
+    kernel = _axle_kernel(axles, dx)
+
+    use_fft = len(kernel) > fft_threshold
+    slide = _slide_fft if use_fft else _slide_direct
+
+    # Satırlar kesitler, sütunlar ön aksın konumlarıdır
+    moments = slide(influence_lines["moment"], kernel)
+    shears = slide(influence_lines["shear"], kernel)
+    positions = np.arange(moments.shape[1]) * dx
+
+    # Kesit bazında zarflar ve kritik konumlar
+    moment_max_idx = np.argmax(moments, axis=1)
+    moment_min_idx = np.argmin(moments, axis=1)
+    shear_max_idx = np.argmax(shears, axis=1)
+    shear_min_idx = np.argmin(shears, axis=1)
+    rows = np.arange(len(x_values))
+
+    moment_envelope_max = moments[rows, moment_max_idx]
+    moment_envelope_min = moments[rows, moment_min_idx]
+    shear_envelope_max = shears[rows, shear_max_idx]
+    shear_envelope_min = shears[rows, shear_min_idx]
+
+    # Kiriş genelinde en elverişsiz kesit
+    critical_moment_section = np.argmax(np.abs(moment_envelope_max))
+    shear_abs = np.maximum(np.abs(shear_envelope_max), np.abs(shear_envelope_min))
+    critical_shear_section = np.argmax(shear_abs)
+
+    return {
+        "x_values": x_values,
+        "positions": positions,
+        "moment_envelope_max": moment_envelope_max,
+        "moment_envelope_min": moment_envelope_min,
+        "shear_envelope_max": shear_envelope_max,
+        "shear_envelope_min": shear_envelope_min,
+        "critical_moment_positions": positions[moment_max_idx],
+        "critical_shear_positions": np.where(
+            np.abs(shear_envelope_max) >= np.abs(shear_envelope_min),
+            positions[shear_max_idx], positions[shear_min_idx]),
+        "moment": moment_envelope_max[critical_moment_section],
+        "moment_section": x_values[critical_moment_section],
+        "moment_position": positions[moment_max_idx[critical_moment_section]],
+        "shear": shear_abs[critical_shear_section],
+        "shear_section": x_values[critical_shear_section],
+        "method": "fft" if use_fft else "direct"
+    }
@@ -121,19 +121,13 @@ def calculate_point_loads(loads, length, E=None, I=None):
 
 def calculate_moment_distribution_uniform_load(load, length, x_points):
     """Düzgün yayılı yük için moment dağılımı"""
-    moment_distribution = []
-    for x in x_points:
-        moment = (load * x * (length - x)) / 2
-        moment_distribution.append(moment)
-    return moment_distribution
+    x = np.asarray(x_points, dtype=float)
+    return (load * x * (length - x)) / 2
 
 def calculate_shear_distribution_uniform_load(load, length, x_points):
     """Düzgün yayılı yük için kesme kuvveti dağılımı"""
-    shear_distribution = []
-    for x in x_points:
-        shear = load * (length/2 - x)
-        shear_distribution.append(shear)
-    return shear_distribution
+    x = np.asarray(x_points, dtype=float)
+    return load * (length/2 - x)
 
 def calculate_deflection_distribution_uniform_load(load, length, E, I, x_points):
     """
@@ -152,29 +146,20 @@ def calculate_deflection_distribution_uniform_load(load, length, E, I, x_points)
     # Yük kN/m'den N/m'ye dönüştürülüyor (1 kN/m = 1000 N/m)
     load_N_per_m = load * 1000
     
-    deflection_distribution = []
-    for x in x_points:
-        # Düzgün yayılı yük için sehim formülü
-        deflection = (load_N_per_m * x * (length**3 - 2*length*x**2 + x**3)) / (24 * E * I)
-        deflection_distribution.append(deflection)
+    x = np.asarray(x_points, dtype=float)
     
-    return deflection_distribution
+    # Düzgün yayılı yük için sehim formülü
+    return (load_N_per_m * x * (length**3 - 2*length*x**2 + x**3)) / (24 * E * I)
 
 def calculate_moment_distribution_triangular_load(load, length, x_points):
     """Üçgen yayılı yük için moment dağılımı"""
-    moment_distribution = []
-    for x in x_points:
-        moment = (load * x**2 * (3*length - 2*x)) / (6 * length)
-        moment_distribution.append(moment)
-    return moment_distribution
+    x = np.asarray(x_points, dtype=float)
+    return (load * x**2 * (3*length - 2*x)) / (6 * length)
 
 def calculate_shear_distribution_triangular_load(load, length, x_points):
     """Üçgen yayılı yük için kesme kuvveti dağılımı"""
-    shear_distribution = []
-    for x in x_points:
-        shear = (load * (length - x)**2) / (2 * length)
-        shear_distribution.append(shear)
-    return shear_distribution
+    x = np.asarray(x_points, dtype=float)
+    return (load * (length - x)**2) / (2 * length)
 
 def calculate_deflection_distribution_triangular_load(load, length, E, I, x_points):
     """
@@ -193,10 +178,7 @@ def calculate_deflection_distribution_triangular_load(load, length, E, I, x_poin
     # Yük kN/m'den N/m'ye dönüştürülüyor (1 kN/m = 1000 N/m)
     load_N_per_m = load * 1000
     
-    deflection_distribution = []
-    for x in x_points:
-        # Üçgen yayılı yük için sehim formülü - length terimi paydadan kaldırıldı
-        deflection = (load_N_per_m * x**2 * (10*length**3 - 10*length**2*x + 5*length*x**2 - x**3)) / (120 * E * I)
-        deflection_distribution.append(deflection)
+    x = np.asarray(x_points, dtype=float)
     
-    return deflection_distribution 
\ No newline at end of file
+    # Üçgen yayılı yük için sehim formülü - length terimi paydadan kaldırıldı
+    return (load_N_per_m * x**2 * (10*length**3 - 10*length**2*x + 5*length*x**2 - x**3)) / (120 * E * I) 
\ No newline at end of file
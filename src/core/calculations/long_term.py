@@ -0,0 +1,169 @@
+import numpy as np
+from .cracked_section import calculate_cracked_deflection, elasticity_moduli
+from .reinforcement import TS500
+
+# Rötre eğriliğinden sehime geçiş katsayıları (δ = c·κ·L²)
+SHRINKAGE_DEFLECTION_COEFFICIENTS = {
+    "Basit Mesnetli": 1/8,
+    "Konsol": 1/2,
+    "İki Ucu Ankastre": 0.0,
+    "Ankastre-Mafsallı": 1/27,
+}
+
+# Kuruma rötresi için h0 (mm) - kh tablosu (EC2 Tablo 3.3)
+_KH_TABLE = ([100, 200, 300, 500], [1.0, 0.85, 0.75, 0.70])
+
+def _mean_strength(fck):
+    """Ortalama basınç dayanımı fcm = fck + 8 (MPa)"""
+    return fck + 8
+
+def calculate_creep_coefficient(times, loading_age, notional_size, fck, relative_humidity=70):
+    """
+    Sünme katsayısı φ(t, t0) (EC2 Ek B), (kiriş × zaman) yayınlamasıyla.
+
+    Args:
+        times: Beton yaşı (gün), (1, m) veya yayınlanabilir dizi
+        loading_age (float): Yükleme anındaki beton yaşı t0 (gün)
+        notional_size: Etkin kalınlık h0 = 2Ac/u (mm), (n, 1)
+        fck: Karakteristik basınç dayanımı (MPa), (n, 1)
+        relative_humidity (float): Bağıl nem (%)
+
+    Returns:
+        array: Sünme katsayısı; t ≤ t0 için sıfır
+    """
+    fcm = _mean_strength(np.asarray(fck, dtype=float))
+    h0 = np.asarray(notional_size, dtype=float)
+    RH = relative_humidity
+
+    alpha1 = (35 / fcm)**0.7
+    alpha2 = (35 / fcm)**0.2
+    alpha3 = (35 / fcm)**0.5
+    high_strength = fcm > 35
+
+    humidity_term = (1 - RH / 100) / (0.1 * h0**(1/3))
+    phi_RH = np.where(high_strength, (1 + humidity_term * alpha1) * alpha2, 1 + humidity_term)
+    beta_fcm = 16.8 / np.sqrt(fcm)
+    beta_t0 = 1 / (0.1 + loading_age**0.2)
+    phi_0 = phi_RH * beta_fcm * beta_t0
+
+    beta_H_base = 1.5 * (1 + (0.012 * RH)**18) * h0
+    beta_H = np.where(high_strength,
+                      np.minimum(beta_H_base + 250 * alpha3, 1500 * alpha3),
+                      np.minimum(beta_H_base + 250, 1500))
+
+    duration = np.maximum(np.asarray(times, dtype=float) - loading_age, 0)
+    beta_c = (duration / (beta_H + duration))**0.3
+    return phi_0 * beta_c
+
+def calculate_shrinkage_strain(times, drying_age, notional_size, fck, relative_humidity=70):
+    """
+    Toplam rötre birim şekil değiştirmesi εcs = εcd + εca (EC2 3.1.4, N sınıfı çimento).
+
+    Args:
+        times: Beton yaşı (gün)
+        drying_age (float): Kurumanın başladığı beton yaşı ts (gün)
+        notional_size: Etkin kalınlık h0 (mm)
+        fck: Karakteristik basınç dayanımı (MPa)
+        relative_humidity (float): Bağıl nem (%)
+
+    Returns:
+        array: Rötre birim şekil değiştirmesi (pozitif kısalma)
+    """
+    fck = np.asarray(fck, dtype=float)
+    fcm = _mean_strength(fck)
+    h0 = np.asarray(notional_size, dtype=float)
+    t = np.asarray(times, dtype=float)
+
+    # Kuruma rötresi
+    beta_RH = 1.55 * (1 - (relative_humidity / 100)**3)
+    eps_cd0 = 0.85 * (220 + 110 * 4) * np.exp(-0.12 * fcm / 10) * 1e-6 * beta_RH
+    kh = np.interp(h0, *_KH_TABLE)
+    drying = np.maximum(t - drying_age, 0)
+    beta_ds = drying / (drying + 0.04 * np.sqrt(h0**3))
+    eps_cd = beta_ds * kh * eps_cd0
+
+    # Otojen rötre
+    eps_ca = (1 - np.exp(-0.2 * np.sqrt(t))) * 2.5 * (fck - 10) * 1e-6
+
+    return eps_cd + eps_ca
+
+def calculate_long_term_deflection(length, load, width, height, concrete_class, times,
+                                   load_type="Tekil Yük", support_condition="Basit Mesnetli",
+                                   loading_age=28, drying_age=7, relative_humidity=70,
+                                   sustained_ratio=1.0, steel_area=None, cover=0.05, cracked=True):
+    """
+    Sünme ve rötre etkisiyle zamana bağlı sehim matrisi (kiriş × zaman).
+
+    Ani sehim calculate_cracked_deflection ile (cracked=False ise brüt
+    kesitle) kiriş başına bir kez hesaplanır. Zamana bağlı kısım tüm
+    kirişler ve zamanlar için tek yayınlanmış hesapla bulunur:
+        δ(t) = δ0·(1 + ψ·φ(t, t0)) + c·κcs(t)·L²
+    ψ kalıcı yük oranı, κcs = εcs·αe·S/I rötre eğriliği (αe = Es/Ec,eff,
+    Ec,eff = Ec/(1 + φ)), c mesnet koşuluna bağlı katsayıdır.
+
+    Args:
+        length, load, width, height: Kiriş parametreleri (m, kN veya kN/m, cm, cm);
+            diziler olabilir
+        concrete_class: Beton sınıfı veya sınıf dizisi
+        times: Beton yaşı dizisi (gün), örn. [28, 365, 18250]
+        load_type (str): Yük tipi
+        support_condition (str): Mesnet koşulu
+        loading_age (float): Yükleme yaşı t0 (gün)
+        drying_age (float): Kuruma başlangıç yaşı ts (gün)
+        relative_humidity (float): Bağıl nem (%)
+        sustained_ratio (float): Yükün kalıcı kısmının oranı ψ
+        steel_area (optional): Çekme donatısı alanı (mm²)
+        cover (float): Paspayı (m)
+        cracked (bool): Ani sehim çatlamış kesitle mi hesaplansın
+
+    Returns:
+        dict: "times", "immediate_deflection" (n,), ve (n, m) boyutunda
+            "creep_coefficient", "shrinkage_strain", "creep_deflection",
+            "shrinkage_deflection", "deflection" (m) ile "long_term_multiplier"
+    """
+    if support_condition not in SHRINKAGE_DEFLECTION_COEFFICIENTS:
+        raise ValueError(f"Geçersiz mesnet koşulu: {support_condition}")
+
+    section = calculate_cracked_deflection(length, load, width, height, concrete_class,
+                                           load_type, support_condition, steel_area, cover)
+    immediate = section["max_deflection"] if cracked else section["gross_deflection"]
+
+    # Kiriş parametreleri sütun, zamanlar satır olacak şekilde yayınlanır
+    shape = immediate.shape
+    column = lambda value: np.broadcast_to(value, shape).reshape(-1, 1)
+    t = np.atleast_1d(np.asarray(times, dtype=float)).reshape(1, -1)
+
+    b = column(np.asarray(width, dtype=float) / 100)   # cm -> m
+    h = column(np.asarray(height, dtype=float) / 100)  # cm -> m
+    L = column(np.asarray(length, dtype=float))
+    fck = column(np.vectorize(TS500.get_fck, otypes=[float])(np.asarray(concrete_class)))
+    Ec = column(elasticity_moduli(concrete_class)) / 1e6  # MPa
+    notional_size = 2 * b * h / (2 * (b + h)) * 1000  # mm
+
+    phi = calculate_creep_coefficient(t, loading_age, notional_size, fck, relative_humidity)
+    eps_cs = calculate_shrinkage_strain(t, drying_age, notional_size, fck, relative_humidity)
+
+    # Rötre eğriliği: çatlamış kesitte donatının tarafsız eksene, çatlamamışta ağırlık merkezine göre momenti
+    is_cracked = column(section["is_cracked"]) & cracked
+    d = h - cover
+    As = column(section["steel_area"]) / 1e6  # m²
+    S = np.where(is_cracked, As * (d - column(section["neutral_axis"])), As * (d - h / 2))
+    I = np.where(is_cracked, column(section["cracked_inertia"]), column(section["gross_inertia"]))
+    alpha_e = TS500.ES / (Ec / (1 + phi))
+    curvature = eps_cs * alpha_e * S / I
+
+    delta_0 = immediate.reshape(-1, 1)
+    creep_deflection = delta_0 * (1 + sustained_ratio * phi)
+    shrinkage_deflection = SHRINKAGE_DEFLECTION_COEFFICIENTS[support_condition] * curvature * L**2
+    deflection = creep_deflection + shrinkage_deflection
+
+    return {
+        "times": t.ravel(),
+        "immediate_deflection": immediate.ravel(),
+        "creep_coefficient": phi * np.ones_like(deflection),
+        "shrinkage_strain": eps_cs * np.ones_like(deflection),
+        "creep_deflection": creep_deflection,
+        "shrinkage_deflection": shrinkage_deflection,
+        "deflection": deflection,
+        "long_term_multiplier": deflection / delta_0
+    }
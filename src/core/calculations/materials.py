@@ -0,0 +1,27 @@
+def calculate_elasticity_modulus(concrete_class):
+    """
+    Beton sınıfına göre elastisite modülünü hesaplar
+    
+    Args:
+        concrete_class (str): Beton sınıfı (örn. "C25", "C30", "C35", vb.)
+    
+    Returns:
+        float: Elastisite modülü (N/m²)
+    """
+    try:
+        # Beton sınıfından karakteristik basınç dayanımını çıkar (MPa)
+        if concrete_class.startswith("C"):
+            fck = float(concrete_class[1:])
+        else:
+            fck = 30.0
+        
+        # Eurocode 2'ye göre elastisite modülü hesabı
+        E = 22000 * (fck/10)**0.3 * 1e6  # N/m² cinsinden
+        
+        print(f"Elastisite modülü: {E/1e9:.2f} GPa")
+        return E
+    
+    except Exception as e:
+        print(f"Elastisite modülü hesaplama hatası: {str(e)}")
+        # Hata durumunda varsayılan değer döndür
+        return 30e9  # Varsayılan değer: 30 GPa
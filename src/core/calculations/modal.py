@@ -0,0 +1,281 @@
+import numpy as np
+from functools import lru_cache
+from scipy.linalg import eig_banded
+from scipy.optimize import brentq
+from .materials import calculate_elasticity_modulus
+from .finite_element import support_nodes
+from .formula_registry import SUPPORT_CONDITIONS
+
+# Betonarme birim hacim kütlesi (kg/m³)
+CONCRETE_DENSITY = 2500
+
+# Mesnet koşullarının birim kiriş (L = 1) üzerindeki sonlu eleman karşılıkları
+_MODAL_SUPPORTS = {
+    "Basit Mesnetli": [(0.0, "pinned"), (1.0, "pinned")],
+    "Konsol": [(0.0, "fixed")],
+    "İki Ucu Ankastre": [(0.0, "fixed"), (1.0, "fixed")],
+    "Ankastre-Mafsallı": [(0.0, "fixed"), (1.0, "pinned")],
+}
+
+# Karakteristik denklemler f(βL) = 0 ve n. kök için asimptotik başlangıç değerleri
+_CHARACTERISTIC_EQUATIONS = {
+    "Konsol": (lambda x: np.cos(x) + 1 / np.cosh(x), lambda n: (2 * n - 1) * np.pi / 2),
+    "İki Ucu Ankastre": (lambda x: np.cos(x) - 1 / np.cosh(x), lambda n: (2 * n + 1) * np.pi / 2),
+    "Ankastre-Mafsallı": (lambda x: np.sin(x) - np.tanh(x) * np.cos(x), lambda n: (4 * n + 1) * np.pi / 4),
+}
+
+# Karma (w, θ) serbestlikli Hermite rijitlik matrisinin üst bant genişliği
+_HERMITE_BANDWIDTH = 3
+
+def _check_support(support_condition):
+    """Mesnet koşulunu doğrular"""
+    if support_condition not in SUPPORT_CONDITIONS:
+        raise ValueError(f"Geçersiz mesnet koşulu: {support_condition}")
+
+@lru_cache(maxsize=None)
+def _frequency_parameters(support_condition, n_modes):
+    """
+    Kapalı form boyutsuz özdeğerler λ_n = (β_n·L)².
+
+    Basit mesnetli kirişte β_n·L = nπ; diğer mesnet koşullarında
+    karakteristik denklemin kökleri asimptotik değerlerin ±0.5 komşuluğunda
+    aranır (örn. konsol 1.8751, iki ucu ankastre 4.7300).
+    """
+    _check_support(support_condition)
+    modes = np.arange(1, n_modes + 1)
+    if support_condition == "Basit Mesnetli":
+        roots = modes * np.pi
+    else:
+        equation, guess = _CHARACTERISTIC_EQUATIONS[support_condition]
+        roots = np.array([brentq(equation, guess(n) - 0.5, guess(n) + 0.5, xtol=1e-14) for n in modes])
+    # Önbellekteki dizi paylaşılır; yerinde değiştirilmesin
+    parameters = roots**2
+    parameters.setflags(write=False)
+    return parameters
+
+def _closed_form_shapes(support_condition, n_modes, xi):
+    """Birim kiriş üzerinde kapalı form mod şekilleri (satırlar modlar)"""
+    beta = np.sqrt(_frequency_parameters(support_condition, n_modes))[:, None]
+    bx = beta * xi[None, :]
+    if support_condition == "Basit Mesnetli":
+        return np.sin(bx)
+    if support_condition == "Konsol":
+        sigma = (np.cosh(beta) + np.cos(beta)) / (np.sinh(beta) + np.sin(beta))
+    else:
+        sigma = (np.cosh(beta) - np.cos(beta)) / (np.sinh(beta) - np.sin(beta))
+    return np.cosh(bx) - np.cos(bx) - sigma * (np.sinh(bx) - np.sin(bx))
+
+def _normalize_shapes(shapes):
+    """
+    Mod şekillerini en büyük mutlak değeri 1 olacak şekilde ölçekler.
+
+    Antisimetrik modlarda eşit tepe değerleri bulunduğundan işaret, sol
+    uçtan itibaren ihmal edilemeyen ilk ordinat pozitif olacak şekilde seçilir.
+    """
+    peak = np.max(np.abs(shapes), axis=1, keepdims=True)
+    first = np.argmax(np.abs(shapes) > 1e-3 * peak, axis=1)[:, None]
+    return shapes / (peak * np.sign(np.take_along_axis(shapes, first, axis=1)))
+
+def assemble_hermite_band(lengths, EI):
+    """
+    Hermite kiriş elemanlarının rijitlik matrisini üst bant formunda kurar.
+
+    Bilinmeyenler düğüm başına [w_i, θ_i] sırasıyla dizilir. Depolama
+    scipy.linalg.eig_banded biçimindedir: a_band[u + i - j, j] = K[i, j], i ≤ j.
+
+    Args:
+        lengths (array): Eleman boyları (m)
+        EI (array): Eleman eğilme rijitlikleri (N·m²)
+
+    Returns:
+        array: (_HERMITE_BANDWIDTH + 1, n_dof) bant matrisi
+    """
+    n_elements = len(lengths)
+    u = _HERMITE_BANDWIDTH
+    band = np.zeros((u + 1, 2 * (n_elements + 1)))
+
+    e = np.arange(n_elements)
+    w0, t0, w1, t1 = 2 * e, 2 * e + 1, 2 * e + 2, 2 * e + 3
+    L = lengths
+    k = EI / L**3
+
+    entries = [
+        (w0, w0, 12 * k), (w0, t0, 6 * L * k), (w0, w1, -12 * k), (w0, t1, 6 * L * k),
+        (t0, t0, 4 * L**2 * k), (t0, w1, -6 * L * k), (t0, t1, 2 * L**2 * k),
+        (w1, w1, 12 * k), (w1, t1, -6 * L * k),
+        (t1, t1, 4 * L**2 * k)
+    ]
+    # Köşegen terimleri komşu elemanlarla çakıştığından np.add.at kullanılır
+    for rows, cols, values in entries:
+        np.add.at(band, (u + rows - cols, cols), values)
+    return band
+
+def lumped_mass(lengths, mass):
+    """
+    HRZ yöntemiyle köşegen (toplanmış) kütle matrisi.
+
+    Tutarlı kütle matrisinin köşegeni, öteleme kütleleri toplam eleman
+    kütlesini verecek şekilde ölçeklenir: düğüm başına m·L/2 öteleme ve
+    m·L³/78 dönme ataleti.
+
+    Args:
+        lengths (array): Eleman boyları (m)
+        mass (array): Eleman birim boy kütleleri (kg/m)
+
+    Returns:
+        array: Serbestlik başına köşegen kütle değerleri
+    """
+    element_mass = mass * lengths
+    diagonal = np.zeros(2 * (len(lengths) + 1))
+    for node_offset in (0, 1):
+        diagonal[2 * (np.arange(len(lengths)) + node_offset)] += element_mass / 2
+        diagonal[2 * (np.arange(len(lengths)) + node_offset) + 1] += element_mass * lengths**2 / 78
+    return diagonal
+
+def solve_modal_fe(length, E, I, mass, supports, n_modes=3, n_elements=100):
+    """
+    Kirişin en düşük n_modes titreşim modunu sonlu elemanlarla hesaplar.
+
+    Hermite rijitlik matrisi ve toplanmış kütle matrisiyle K·φ = ω²·M·φ
+    problemi M^(-1/2)·K·M^(-1/2) simetrik bant matrisine dönüştürülür ve
+    eig_banded ile yalnızca istenen en düşük modlar hesaplanır. Mesnetli
+    serbestliklerin satır ve sütunları sıfırlanıp köşegene büyük bir değer
+    yazılır; bu serbestlikler spektrumun üst ucuna ayrışır.
+
+    Args:
+        length (float): Kiriş uzunluğu (m)
+        E (float): Elastisite modülü (N/m²)
+        I (float veya array): Atalet momenti (m⁴), eleman başına dizi olabilir
+        mass (float veya array): Birim boy kütlesi (kg/m), eleman başına dizi olabilir
+        supports: [(konum, tip), ...] mesnet listesi, tip "pinned" veya "fixed"
+        n_modes (int): Hesaplanacak mod sayısı
+        n_elements (int): Eleman sayısı
+
+    Returns:
+        dict: "x_values", "angular_frequencies" (rad/s), "frequencies" (Hz)
+            ve (n_modes, düğüm) boyutunda "mode_shapes" (en büyük değer +1)
+    """
+    if length <= 0 or n_elements < 1:
+        raise ValueError("Kiriş uzunluğu ve eleman sayısı pozitif olmalıdır!")
+
+    node_x = np.linspace(0, length, n_elements + 1)
+    lengths = np.diff(node_x)
+    EI = E * np.broadcast_to(np.asarray(I, dtype=float), lengths.shape)
+    m = np.broadcast_to(np.asarray(mass, dtype=float), lengths.shape)
+
+    supported, fixed = support_nodes(supports, node_x)
+    constrained = np.concatenate([2 * supported, 2 * fixed + 1])
+    n_dof = 2 * (n_elements + 1)
+    if not 1 <= n_modes <= n_dof - len(constrained):
+        raise ValueError("Mod sayısı serbestlik sayısını aşamaz!")
+
+    band = assemble_hermite_band(lengths, EI)
+    M = lumped_mass(lengths, m)
+
+    # Standart özdeğer problemine dönüşüm: a_ij = K_ij / √(M_i·M_j)
+    u = _HERMITE_BANDWIDTH
+    scale = 1 / np.sqrt(M)
+    for offset in range(u + 1):
+        band[u - offset, offset:] *= scale[:n_dof - offset] * scale[offset:]
+
+    # Mesnetli serbestlikleri ayır
+    penalty = 1e6 * np.max(band[u])
+    for offset in range(1, u + 1):
+        rows = constrained - offset
+        valid = rows >= 0
+        band[u - offset, constrained[valid]] = 0.0
+        cols = constrained + offset
+        valid = cols < n_dof
+        band[u - offset, cols[valid]] = 0.0
+    band[u, constrained] = penalty
+
+    eigenvalues, vectors = eig_banded(band, select="i", select_range=(0, n_modes - 1))
+    shapes = (vectors * scale[:, None])[0::2].T
+
+    omega = np.sqrt(np.maximum(eigenvalues, 0))
+    return {
+        "x_values": node_x,
+        "angular_frequencies": omega,
+        "frequencies": omega / (2 * np.pi),
+        "mode_shapes": _normalize_shapes(shapes)
+    }
+
+@lru_cache(maxsize=None)
+def _fe_frequency_parameters(support_condition, n_modes, n_elements):
+    """Birim kiriş (L = EI = m = 1) için sonlu eleman boyutsuz özdeğerleri ve mod şekilleri"""
+    _check_support(support_condition)
+    modal = solve_modal_fe(1.0, 1.0, 1.0, 1.0, _MODAL_SUPPORTS[support_condition], n_modes, n_elements)
+    cached = (modal["angular_frequencies"], modal["x_values"], modal["mode_shapes"])
+    # Önbellekteki diziler paylaşılır; yerinde değiştirilmesin
+    for array in cached:
+        array.setflags(write=False)
+    return cached
+
+def calculate_modal_analysis(length, width, height, concrete_class, support_condition="Basit Mesnetli",
+                             n_modes=3, method="closed_form", density=CONCRETE_DENSITY,
+                             additional_mass=0.0, inertia=None, n_elements=100, n_points=50):
+    """
+    Prizmatik kirişlerin doğal frekansları ve mod şekilleri (vektörel).
+
+    Prizmatik kirişte ω_n = λ_n/L²·√(EI/m) olduğundan boyutsuz özdeğerler
+    λ_n mesnet koşulu başına bir kez hesaplanır (kapalı form veya birim
+    kiriş sonlu eleman çözümü) ve tüm kirişler tek yayınlanmış işlemle
+    ölçeklenir. Mod şekilleri birim kiriş üzerinde tanımlıdır ve tüm
+    kirişler için ortaktır.
+
+    Args:
+        length, width, height: Kiriş uzunluğu (m), kesit genişliği ve
+            yüksekliği (cm); diziler olabilir
+        concrete_class: Beton sınıfı veya sınıf dizisi
+        support_condition (str): Mesnet koşulu
+        n_modes (int): Mod sayısı
+        method (str): "closed_form" veya "fe"
+        density (float): Beton birim hacim kütlesi (kg/m³)
+        additional_mass (float veya array): Ek birim boy kütlesi (kg/m)
+        inertia (optional): Atalet momenti (m⁴); verilmezse brüt kesit,
+            örn. çatlamış kesit için etkin atalet momenti verilebilir
+        n_elements (int): "fe" yönteminde eleman sayısı
+        n_points (int): Kapalı form mod şekillerinin nokta sayısı
+
+    Returns:
+        dict: (n, n_modes) boyutunda "frequencies" (Hz), "angular_frequencies"
+            (rad/s), "periods" (s); "frequency_parameters" λ_n, birim kiriş
+            konumları "x_ratios", "mode_shapes", "mass" (kg/m), "EI" (N·m²)
+    """
+    if method not in ("closed_form", "fe"):
+        raise ValueError(f"Geçersiz yöntem: {method}")
+    _check_support(support_condition)
+
+    length, width, height = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (length, width, height)))
+    b, h = width / 100, height / 100  # cm -> m
+
+    classes = np.asarray(concrete_class)
+    moduli = {name: calculate_elasticity_modulus(str(name)) for name in np.unique(classes)}
+    E = np.vectorize(moduli.get, otypes=[float])(classes)
+
+    I = b * h**3 / 12 if inertia is None else np.asarray(inertia, dtype=float)
+    EI = E * I
+    mass = density * b * h + np.asarray(additional_mass, dtype=float)
+
+    if method == "closed_form":
+        parameters = _frequency_parameters(support_condition, n_modes)
+        x_ratios = np.linspace(0, 1, n_points)
+        shapes = _normalize_shapes(_closed_form_shapes(support_condition, n_modes, x_ratios))
+    else:
+        parameters, x_ratios, shapes = _fe_frequency_parameters(support_condition, n_modes, n_elements)
+
+    # Kirişler satır, modlar sütun
+    omega = parameters[None, :] / length.reshape(-1, 1)**2 * np.sqrt(EI / mass).reshape(-1, 1)
+
+    return {
+        "frequencies": omega / (2 * np.pi),
+        "angular_frequencies": omega,
+        "periods": 2 * np.pi / omega,
+        # Önbellekten gelen diziler kopyalanır; sonuçlar çağırana aittir
+        "frequency_parameters": np.array(parameters),
+        "x_ratios": np.array(x_ratios),
+        "mode_shapes": np.array(shapes),
+        "mass": mass,
+        "EI": EI
+    }
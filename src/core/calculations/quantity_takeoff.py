@@ -0,0 +1,165 @@
+from itertools import islice
+import numpy as np
+from .bar_schedule import HOOK_LENGTH_FACTOR, STEEL_DENSITY, calculate_bar_length
+from .beam_calculation import calculate_beam_batch
+from .reinforcement import TS500
+from .shear_design import SUPPORT_POSITIONS
+
+def _encode(labels, table):
+    """
+    Etiketleri kategorik kodlara çevirir (np.unique ile parça başına bir sözlük araması).
+
+    Yeni etiketler karşılaşıldıkları sırayla table sözlüğüne eklenir.
+    """
+    unique, inverse = np.unique(np.asarray(labels, dtype=object).astype(str), return_inverse=True)
+    codes = np.array([table.setdefault(label, len(table)) for label in unique.tolist()], dtype=np.int64)
+    return codes[inverse.ravel()]
+
+def _add_grouped(total, rows, cols, weights, shape):
+    """(satır, sütun) kodlarına göre ağırlıkları toplar; toplam matrisi gerekirse büyütür"""
+    grouped = np.bincount(rows * shape[1] + cols, weights, minlength=shape[0] * shape[1]).reshape(shape)
+    grown = np.zeros(shape)
+    grown[:total.shape[0], :total.shape[1]] = total
+    return grown + grouped
+
+def _stirrup_rows(stirrups, length, width, height, cover, support_condition):
+    """
+    Bir kirişin etriyelerini (çap, toplam boy) satırlarına ayırır.
+
+    Etriye boyu kesit çevresinden paspayları düşülüp iki kanca eklenerek
+    bulunur; sıklaştırma bölgesindeki etriyeler konumlarından sayılır.
+    Sınıflama calculate_stirrup_positions ile aynıdır: sıklaştırma aralığı
+    mesnetten dense_length'e kadar (hariç) uygulanır, tam sınırdaki etriye
+    orta bölgenindir.
+    """
+    perimeter = 2 * (width + height) - 8 * cover
+    positions = np.asarray(stirrups["positions"])
+    supports = np.asarray(SUPPORT_POSITIONS.get(support_condition, (0.0, 1.0))) * length
+    dense_length = min(stirrups["dense_length"], length / len(supports))
+    dense = np.any(np.abs(positions[:, None] - supports) < dense_length - 1e-9, axis=1)
+    n_dense = int(dense.sum())
+    return [
+        (stirrups["dense_diameter"], n_dense * (perimeter + 2 * HOOK_LENGTH_FACTOR * stirrups["dense_diameter"] / 1000)),
+        (stirrups["normal_diameter"],
+         (len(positions) - n_dense) * (perimeter + 2 * HOOK_LENGTH_FACTOR * stirrups["normal_diameter"] / 1000))
+    ]
+
+def _chunk_results(chunk):
+    """Sonucu olmayan donatılı senaryoları toplu hesapla, diğerlerini olduğu gibi döndür"""
+    pending = [i for i, item in enumerate(chunk)
+               if item.get("with_reinforcement") and "reinforcement" not in item]
+    if not pending:
+        return chunk
+    computed = calculate_beam_batch([chunk[i] for i in pending])
+    chunk = list(chunk)
+    for i, result in zip(pending, computed):
+        chunk[i] = {**chunk[i], **result}
+    return chunk
+
+def calculate_quantity_takeoff(items, option_index=0, cover=0.05, chunk_size=10000, floor_key="floor"):
+    """
+    Proje geneli metraj: beton hacmi, kalıp alanı ve çapa göre donatı ağırlığı.
+
+    Senaryo veya saklanmış sonuç sözlükleri bir akış (herhangi bir
+    yineleyici) olarak chunk_size'lık parçalar halinde okunur; her parçadan
+    yalnızca skaler sütunlar çıkarılır, kat, beton sınıfı ve çap etiketleri
+    kategorik kodlara çevrilir ve np.bincount ile gruplanarak birikimli
+    toplamlara eklenir. Böylece kiriş sözlükleri bellekte tutulmaz.
+
+    Beton hacmi b·h·L, kalıp alanı kiriş tabanı ve iki yan yüz (b + 2h)·L
+    alınır. Donatı ağırlığı calculate_reinforcement seçeneklerinden
+    option_index sıradaki (yetersizse sonuncu) seçeneğin boyuna çubukları ile
+    varsa etriyelerden hesaplanır. Donatı hesabı istenen ("with_reinforcement")
+    fakat sonucu bulunmayan senaryolar parça parça calculate_beam_batch ile
+    hesaplanır.
+
+    Args:
+        items: "length" (m), "width", "height" (cm), "concrete_class" ve
+            isteğe bağlı floor_key, "reinforcement", "support_condition"
+            anahtarlarını içeren sözlükler üreten yineleyici
+        option_index (int): Kullanılacak donatı seçeneğinin sırası
+        cover (float): Paspayı (m)
+        chunk_size (int): Bir seferde işlenen kiriş sayısı
+        floor_key (str): Kat etiketinin anahtarı (yoksa "0")
+
+    Returns:
+        dict: "floors", "concrete_classes", "diameters" etiketleri;
+            (kat, beton sınıfı) boyutunda "beam_count", "concrete_volume" (m³),
+            "formwork_area" (m²); (kat, çap) boyutunda "steel_weight" (kg) ve
+            "totals" özet sözlüğü
+    """
+    floors, classes, diameters = {}, {}, {}
+    beam_count = np.zeros((0, 0))
+    volume = np.zeros((0, 0))
+    formwork = np.zeros((0, 0))
+    steel = np.zeros((0, 0))
+
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        chunk = _chunk_results(chunk)
+
+        length = np.array([item["length"] for item in chunk], dtype=float)
+        width = np.array([item["width"] for item in chunk], dtype=float) / 100  # cm -> m
+        height = np.array([item["height"] for item in chunk], dtype=float) / 100
+        floor_codes = _encode([item.get(floor_key, 0) for item in chunk], floors)
+        class_codes = _encode([item["concrete_class"] for item in chunk], classes)
+        for name in classes:
+            if name not in TS500.CONCRETE_CLASSES:
+                raise ValueError(f"Geçersiz beton sınıfı: {name}")
+
+        shape = (len(floors), len(classes))
+        beam_count = _add_grouped(beam_count, floor_codes, class_codes, None, shape)
+        volume = _add_grouped(volume, floor_codes, class_codes, width * height * length, shape)
+        formwork = _add_grouped(formwork, floor_codes, class_codes, (width + 2 * height) * length, shape)
+
+        # Donatı satırları: (kat kodu, çap, toplam çubuk boyu)
+        steel_floor, steel_diameter, steel_length = [], [], []
+        for row, item in enumerate(chunk):
+            reinforcement = item.get("reinforcement") or {}
+            options = reinforcement.get("options")
+            if options:
+                option = options[min(option_index, len(options) - 1)]
+                steel_floor.append(floor_codes[row])
+                steel_diameter.append(option["diameter"])
+                steel_length.append(option["count"] * calculate_bar_length(length[row], option["diameter"], cover))
+            if reinforcement.get("stirrups"):
+                for diameter, total_length in _stirrup_rows(reinforcement["stirrups"], length[row], width[row],
+                                                            height[row], cover,
+                                                            item.get("support_condition", "Basit Mesnetli")):
+                    steel_floor.append(floor_codes[row])
+                    steel_diameter.append(diameter)
+                    steel_length.append(total_length)
+
+        if steel_floor:
+            bar_diameter = np.array(steel_diameter, dtype=float)
+            weight = np.array(steel_length, dtype=float) * np.pi * (bar_diameter / 1000)**2 / 4 * STEEL_DENSITY
+            diameter_codes = _encode(bar_diameter.astype(int), diameters)
+            steel = _add_grouped(steel, np.array(steel_floor), diameter_codes, weight,
+                                 (len(floors), len(diameters)))
+
+    # Çap sütunlarını artan sırada düzenle
+    steel = np.pad(steel, ((0, len(floors) - steel.shape[0]), (0, 0)))
+    diameter_labels = sorted(diameters, key=int)
+    steel = steel[:, [diameters[label] for label in diameter_labels]]
+    diameter_values = [int(label) for label in diameter_labels]
+
+    return {
+        "floors": list(floors),
+        "concrete_classes": list(classes),
+        "diameters": diameter_values,
+        "beam_count": beam_count.astype(np.int64),
+        "concrete_volume": volume,
+        "formwork_area": formwork,
+        "steel_weight": steel,
+        "totals": {
+            "beam_count": int(beam_count.sum()),
+            "concrete_volume": float(volume.sum()),
+            "formwork_area": float(formwork.sum()),
+            "steel_weight": float(steel.sum()),
+            "concrete_volume_by_class": dict(zip(classes, volume.sum(axis=0).tolist())),
+            "steel_weight_by_diameter": dict(zip(diameter_values, steel.sum(axis=0).tolist()))
+        }
+    }
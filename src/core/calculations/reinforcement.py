@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 class TS500:
     """TS500 standardına göre sabitler ve hesaplamalar"""
@@ -7,6 +8,9 @@ class TS500:
     GAMMA_C = 1.5  # Beton
     GAMMA_S = 1.15  # Çelik
     
+    # Donatı çeliği elastisite modülü (MPa)
+    ES = 200000
+    
     # Beton sınıfları ve karakteristik dayanımları (MPa)
     CONCRETE_CLASSES = {
         "C20": 20, "C25": 25, "C30": 30, "C35": 35,
@@ -20,6 +24,21 @@ class TS500:
         "S500": 500
     }
     
+    # Boyutsuz moment K = Md/(b·d²·fcd) sınırları: basınç donatısı ve kesit yeterliliği
+    K_COMPRESSION_LIMIT = 0.38
+    K_MAX = 0.85
+    
+    # Beton sınıfına göre minimum donatı oranları
+    MIN_REINFORCEMENT_RATIOS = {
+        "C20": 0.0018,
+        "C25": 0.0030,
+        "C30": 0.0032,
+        "C35": 0.0034,
+        "C40": 0.0036,
+        "C45": 0.0038,
+        "C50": 0.0040
+    }
+    
     @staticmethod
     def calculate_fcd(fck):
         """Beton tasarım dayanımı"""
@@ -30,6 +49,16 @@ class TS500:
         """Çelik tasarım dayanımı"""
         return fyk / TS500.GAMMA_S
     
+    @staticmethod
+    def calculate_fctk(fck):
+        """Beton karakteristik eksenel çekme dayanımı (MPa), dizi kabul eder"""
+        return 0.35 * np.sqrt(fck)
+    
+    @staticmethod
+    def calculate_fctd(fck):
+        """Beton tasarım eksenel çekme dayanımı (MPa), dizi kabul eder"""
+        return TS500.calculate_fctk(fck) / TS500.GAMMA_C
+    
     @staticmethod
     def calculate_min_reinforcement_ratio(fck):
         """Minimum donatı oranı"""
@@ -53,25 +82,14 @@ class TS500:
         Returns:
             float: Minimum donatı alanı (mm²)
         """
-        # Beton sınıfına göre minimum donatı oranı
-        min_reinforcement_ratio = {
-            "C20": 0.0018,
-            "C25": 0.0030,
-            "C30": 0.0032,
-            "C35": 0.0034,
-            "C40": 0.0036,
-            "C45": 0.0038,
-            "C50": 0.0040
-        }
-        
-        if concrete_class not in min_reinforcement_ratio:
+        if concrete_class not in TS500.MIN_REINFORCEMENT_RATIOS:
             raise ValueError(f"Geçersiz beton sınıfı: {concrete_class}")
         
         # Kesit alanı (mm²)
         section_area = width * height * 1000000  # m² -> mm²
         
         # Minimum donatı alanı (mm²)
-        min_area = section_area * min_reinforcement_ratio[concrete_class]
+        min_area = section_area * TS500.MIN_REINFORCEMENT_RATIOS[concrete_class]
         
         return min_area
 
@@ -104,7 +122,7 @@ def calculate_reinforcement(moment, concrete_class, width, height, cover=0.05):
         K = Md / (width * d * d * fcd * 1000)  # kNm -> Nm için 1000 ile çarp
         
         # Donatı oranı hesabı
-        if K > 0.85:  # Maksimum K değeri kontrolü
+        if K > TS500.K_MAX:  # Maksimum K değeri kontrolü
             raise ValueError("Moment değeri çok yüksek, kesit boyutlarını artırın!")
         
         # Donatı oranı hesabı
@@ -116,17 +134,17 @@ def calculate_reinforcement(moment, concrete_class, width, height, cover=0.05):
         
         # Basınç donatısı hesabı
         As2_mm2 = 0
-        if K > 0.38:  # Basınç donatısı gerekiyor
+        if K > TS500.K_COMPRESSION_LIMIT:  # Basınç donatısı gerekiyor
             # Basınç bölgesi sınır değeri
             ksi_limit = 0.85 * 0.85 / (0.85 + fyd/700)
             
             # Basınç donatısı hesabı
-            delta_M = Md - 0.38 * width * d * d * fcd * 1000 / 1000  # kNm
+            delta_M = Md - TS500.K_COMPRESSION_LIMIT * width * d * d * fcd * 1000 / 1000  # kNm
             z = d - 0.4 * ksi_limit * d  # Kuvvet kolu
             As2_mm2 = (delta_M * 1000000) / (fyd * z)  # mm²
             
             # Çekme donatısı güncelleme
-            As_mm2 = (0.38 * width * d * d * fcd * 1000 / fyd) * 1000000 + As2_mm2
+            As_mm2 = (TS500.K_COMPRESSION_LIMIT * width * d * d * fcd * 1000 / fyd) * 1000000 + As2_mm2
         
         # Minimum donatı kontrolü - beton sınıfına göre hesaplanıyor
         min_As = TS500.calculate_min_reinforcement_area(width, height, concrete_class)
@@ -199,6 +217,117 @@ def calculate_reinforcement(moment, concrete_class, width, height, cover=0.05):
     except Exception as e:
         raise Exception(f"Donatı hesabı hatası: {str(e)}")
 
+def calculate_moment_capacity(steel_area, width, effective_depth, fc, fy):
+    """
+    Tek donatılı dikdörtgen kesitin moment taşıma kapasitesi (vektörel).
+    
+    Eşdeğer dikdörtgen gerilme bloğu ile Mr = As·fy·(d - a/2),
+    a = As·fy / (0.85·fc·b). Tüm argümanlar numpy dizileri olabilir.
+    
+    Args:
+        steel_area: Çekme donatısı alanı (mm²)
+        width: Kesit genişliği (m)
+        effective_depth: Etkin yükseklik (m)
+        fc: Beton basınç dayanımı (MPa)
+        fy: Donatı akma dayanımı (MPa)
+    
+    Returns:
+        Moment kapasitesi (kNm)
+    """
+    force = np.asarray(steel_area) * fy  # N (mm² · MPa)
+    a = force / (0.85 * fc * np.asarray(width) * 1000) / 1000  # m
+    return force * (effective_depth - a / 2) / 1000  # Nm -> kNm
+
+def calculate_required_steel_area(moment, width, height, concrete_class, cover=0.05, with_gradient=False):
+    """
+    calculate_reinforcement ile aynı gerekli çekme donatısı alanının vektörel hesabı.
+    
+    Tüm argümanlar numpy dizileri (veya beton sınıfı listesi) olabilir.
+    calculate_reinforcement'ın hata verdiği kesitlerde (1 - 2K < 0) sonuç NaN olur. with_gradient=True ise alanın
+    moment, genişlik, yükseklik ve fck'ya göre analitik kısmi türevleri de
+    döndürülür; minimum donatı oranı beton sınıfı tablosundan alındığı için
+    fck türevi tablodaki sıçramaları içermez.
+    
+    Args:
+        moment: Moment değeri (kNm)
+        width: Kesit genişliği (m)
+        height: Kesit yüksekliği (m)
+        concrete_class: Beton sınıfı veya sınıf dizisi
+        cover (float): Paspayı (m)
+        with_gradient (bool): Türevler hesaplansın mı
+    
+    Returns:
+        Gerekli donatı alanı (mm²); with_gradient=True ise (alan, türevler)
+        ikilisi. Türevler sözlüğü "moment" (mm²/kNm), "width", "height"
+        (mm²/m) ve "fck" (mm²/MPa) anahtarlarını içerir.
+    """
+    classes = np.asarray(concrete_class)
+    for name in np.unique(classes):
+        if name not in TS500.MIN_REINFORCEMENT_RATIOS:
+            raise ValueError(f"Geçersiz beton sınıfı: {name}")
+    fck = np.vectorize(TS500.get_fck, otypes=[float])(classes)
+    min_ratio = np.vectorize(TS500.MIN_REINFORCEMENT_RATIOS.get, otypes=[float])(classes)
+    
+    M, b, h = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (moment, width, height)))
+    fcd = TS500.calculate_fcd(fck)
+    fyd = TS500.calculate_fyd(420)  # S420 çeliği
+    d = h - cover
+    
+    # Boyutsuz moment ve donatı oranı (1 - 2K < 0 için NaN)
+    S = b * d * d * fcd * 1000
+    K = M / S
+    valid = (K <= TS500.K_MAX) & (1 - 2*K >= 0)
+    root = np.sqrt(np.where(valid, 1 - 2*K, np.nan))
+    ksi = 1 - root
+    
+    # Tek donatılı kesit
+    A0 = 0.85 * fcd * b * d / fyd * 1e6
+    As_single = A0 * ksi
+    
+    # Basınç donatılı kesit (K > K_COMPRESSION_LIMIT)
+    k_limit = TS500.K_COMPRESSION_LIMIT
+    ksi_limit = 0.85 * 0.85 / (0.85 + fyd/700)
+    lever = 1 - 0.4 * ksi_limit  # z = lever·d
+    A1 = k_limit * b * d * d * fcd * 1000 / fyd * 1e6
+    As2 = (M - k_limit * b * d * d * fcd) * 1e6 / (fyd * lever * d)
+    compression = K > k_limit
+    As = np.where(valid, np.where(compression, A1 + As2, As_single), np.nan)
+    
+    min_As = b * h * 1e6 * min_ratio
+    governs_min = min_As > As
+    required = np.where(governs_min, min_As, As)
+    
+    if not with_gradient:
+        return required
+    
+    # Tek donatılı kesitin türevleri (dξ/dK = 1/√(1-2K))
+    dksi = A0 / root
+    single = {
+        "moment": dksi / S,
+        "width": As_single / b - dksi * K / b,
+        "depth": As_single / d - dksi * 2 * K / d,
+        "fcd": As_single / fcd - dksi * K / fcd
+    }
+    
+    # Basınç donatılı kesitin türevleri
+    c = 1e6 / (fyd * lever)
+    double = {
+        "moment": c / d,
+        "width": A1 / b - c * k_limit * d * fcd,
+        "depth": 2 * A1 / d + c * (-k_limit * b * fcd - M / d**2),
+        "fcd": A1 / fcd - c * k_limit * b * d
+    }
+    
+    steel = {key: np.where(valid, np.where(compression, double[key], single[key]), np.nan)
+             for key in single}
+    gradient = {
+        "moment": np.where(governs_min, 0.0, steel["moment"]),
+        "width": np.where(governs_min, h * 1e6 * min_ratio, steel["width"]),
+        "height": np.where(governs_min, b * 1e6 * min_ratio, steel["depth"]),
+        "fck": np.where(governs_min, 0.0, steel["fcd"] / TS500.GAMMA_C)
+    }
+    return required, gradient
+
 def get_reinforcement_options(required_area, width, effective_height, cover=0.05, stirrup_diameter=8):
     """
     Gerekli donatı alanına göre donatı seçeneklerini hesaplar.
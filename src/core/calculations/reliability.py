@@ -0,0 +1,148 @@
+import numpy as np
+from statistics import NormalDist
+from .formula_registry import get_beam_kernel
+from .reinforcement import TS500, calculate_reinforcement, calculate_moment_capacity
+
+# 5% alt sınır (karakteristik değer) için standart normal değişken
+_CHARACTERISTIC_FRACTILE = 1.645
+
+def _lognormal(rng, mean, cov, size):
+    """Ortalama ve değişim katsayısı verilen lognormal örnekler"""
+    sigma = np.sqrt(np.log(1 + cov**2))
+    return rng.lognormal(np.log(mean) - sigma**2 / 2, sigma, size)
+
+def _mean_from_characteristic(characteristic, cov):
+    """Karakteristik (5%) değerden ortalama değeri hesaplar"""
+    return characteristic / (1 - _CHARACTERISTIC_FRACTILE * cov)
+
+def _estimate(n_failures, n_samples, z):
+    """Göçme olasılığı tahmini, standart hatası ve güven aralığı"""
+    p = n_failures / n_samples
+    std_error = np.sqrt(p * (1 - p) / n_samples)
+
+    # Güvenilirlik indeksi β = -Φ⁻¹(p)
+    if p == 0:
+        beta = np.inf
+    elif p == 1:
+        beta = -np.inf
+    else:
+        beta = -NormalDist().inv_cdf(p)
+    return {
+        "samples": n_samples,
+        "failures": n_failures,
+        "probability": p,
+        "std_error": std_error,
+        "cov": std_error / p if n_failures > 0 else np.inf,
+        "ci_lower": max(p - z * std_error, 0.0),
+        "ci_upper": min(p + z * std_error, 1.0),
+        "reliability_index": beta
+    }
+
+def iterate_failure_probability(length, load, width, height, concrete_class, load_type="Tekil Yük",
+                                support_condition="Basit Mesnetli", steel_area=None, load_factor=1.5,
+                                cover=0.05, load_cov=0.20, concrete_cov=0.15, steel_cov=0.05,
+                                dimension_std=0.5, cover_std=0.005, chunk_size=100000,
+                                max_samples=10**7, target_cov=0.05, confidence=0.95, seed=None):
+    """
+    Monte Carlo göçme olasılığı tahminini parça parça üretir.
+
+    Her parçada yük, beton ve çelik dayanımı, kesit boyutları ve paspayı
+    örneklenir; moment talebi çekirdekle, taşıma kapasitesi
+    calculate_moment_capacity ile vektörel olarak hesaplanır. Her parçadan
+    sonra güncel tahmin döndürülür; tahminin değişim katsayısı target_cov
+    değerine indiğinde veya max_samples örneğe ulaşıldığında durulur.
+
+    Yük, beton ve çelik dayanımı lognormal; boyutlar ve paspayı normal
+    dağılımlıdır. Beton ve çelik için verilen değerler karakteristik (5%)
+    değerlerdir, ortalamalar bunlardan türetilir.
+
+    Args:
+        length (float): Kiriş uzunluğu (m)
+        load (float): Ortalama yük (kN veya kN/m)
+        width (float): Kesit genişliği (cm)
+        height (float): Kesit yüksekliği (cm)
+        concrete_class (str): Beton sınıfı
+        load_type (str): Yük tipi
+        support_condition (str): Mesnet koşulu
+        steel_area (float, optional): Çekme donatısı alanı (mm²); verilmezse
+            load_factor·load tasarım yükü için gerekli donatı alanı kullanılır
+        load_factor (float): Varsayılan donatı tasarımında yük katsayısı
+        cover (float): Ortalama paspayı (m)
+        load_cov, concrete_cov, steel_cov (float): Değişim katsayıları
+        dimension_std (float): Kesit boyutlarının standart sapması (cm)
+        cover_std (float): Paspayının standart sapması (m)
+        chunk_size (int): Parça başına örnek sayısı
+        max_samples (int): Toplam örnek sınırı
+        target_cov (float): Durma için hedef değişim katsayısı
+        confidence (float): Güven aralığı düzeyi
+        seed (int, optional): Rastgele sayı üreteci tohumu
+
+    Yields:
+        dict: Birikimli örnek ve göçme sayısı, olasılık, güven aralığı ve
+            güvenilirlik indeksi
+    """
+    if concrete_class not in TS500.CONCRETE_CLASSES:
+        raise ValueError(f"Geçersiz beton sınıfı: {concrete_class}")
+    if chunk_size <= 0 or max_samples <= 0:
+        raise ValueError("Örnek sayıları pozitif olmalıdır!")
+
+    kernel = get_beam_kernel(support_condition, load_type)
+    fck = TS500.CONCRETE_CLASSES[concrete_class]
+    fyk = TS500.STEEL_CLASSES["S420"]
+
+    if steel_area is None:
+        design_moment = kernel["moment"](load_factor * load, length)
+        steel_area = calculate_reinforcement(design_moment, concrete_class,
+                                             width/100, height/100, cover)["required_area"]
+
+    fc_mean = _mean_from_characteristic(fck, concrete_cov)
+    fy_mean = _mean_from_characteristic(fyk, steel_cov)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    rng = np.random.default_rng(seed)
+
+    n_samples = 0
+    n_failures = 0
+    while n_samples < max_samples:
+        n = min(chunk_size, max_samples - n_samples)
+
+        loads = _lognormal(rng, load, load_cov, n)
+        fc = _lognormal(rng, fc_mean, concrete_cov, n)
+        fy = _lognormal(rng, fy_mean, steel_cov, n)
+        b = rng.normal(width, dimension_std, n) / 100   # cm -> m
+        h = rng.normal(height, dimension_std, n) / 100  # cm -> m
+        c = np.maximum(rng.normal(cover, cover_std, n), 0)
+
+        demand = kernel["moment"](loads, length)
+        capacity = calculate_moment_capacity(steel_area, b, h - c, fc, fy)
+
+        n_failures += int(np.count_nonzero(capacity < demand))
+        n_samples += n
+
+        estimate = _estimate(n_failures, n_samples, z)
+        estimate["steel_area"] = steel_area
+        yield estimate
+
+        if estimate["cov"] <= target_cov:
+            return
+
+def calculate_failure_probability(length, load, width, height, concrete_class, **kwargs):
+    """
+    Monte Carlo göçme olasılığını hesaplar.
+
+    Parametreler iterate_failure_probability ile aynıdır. Son tahmine ek
+    olarak parça bazlı tahmin geçmişi ve hedef değişim katsayısına
+    ulaşılıp ulaşılmadığı döndürülür.
+
+    Returns:
+        dict: Göçme olasılığı, güven aralığı, güvenilirlik indeksi (β),
+            "history" ve "converged"
+    """
+    target_cov = kwargs.get("target_cov", 0.05)
+    history = []
+    for estimate in iterate_failure_probability(length, load, width, height, concrete_class, **kwargs):
+        history.append((estimate["samples"], estimate["probability"]))
+
+    result = dict(estimate)
+    result["history"] = history
+    result["converged"] = estimate["cov"] <= target_cov
+    return result
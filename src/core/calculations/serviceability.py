@@ -0,0 +1,147 @@
+import numpy as np
+from .cracked_section import calculate_cracked_section
+from .reinforcement import TS500
+
+# Çevre koşuluna göre izin verilen en büyük çatlak genişlikleri (mm)
+CRACK_WIDTH_LIMITS = {
+    "Kuru": 0.4,
+    "Nemli": 0.3,
+    "Agresif": 0.2,
+}
+
+# Yarı kalıcı yük oranı: M_qp = ψ·M (kalıcı yük + ψ2·hareketli yük)
+QUASI_PERMANENT_RATIO = 0.6
+
+# Servis yükü altında donatı gerilmesi sınırı: σs ≤ 0.8·fyk
+STEEL_STRESS_LIMIT_RATIO = 0.8
+
+# Çatlak aralığı katsayıları (nervürlü donatı k1, eğilme k2, uzun süreli yük kt)
+_K1, _K2, _KT = 0.8, 0.5, 0.4
+
+def calculate_crack_width(moment, width, height, concrete_class, diameter, count, cover=0.05,
+                          quasi_permanent_ratio=QUASI_PERMANENT_RATIO, exposure="Kuru",
+                          steel_class="S420"):
+    """
+    Yarı kalıcı yükler altında donatı gerilmesi ve çatlak genişliği (vektörel).
+
+    Donatı gerilmesi çatlamış kesitte σs = n·M·(d - x)/I_cr ile bulunur.
+    Çatlak aralığı ve genişliği EC2 7.3.4 yöntemiyle hesaplanır:
+        sr,max = 3.4·c + 0.425·k1·k2·φ/ρp,eff
+        εsm - εcm = max([σs - kt·fct·(1 + αe·ρp,eff)/ρp,eff]/Es, 0.6·σs/Es)
+        wk = sr,max·(εsm - εcm)
+    Yarı kalıcı moment çatlama momentini aşmıyorsa kesit çatlamamıştır ve
+    wk = 0 alınır. Tüm sayısal argümanlar senaryo dizileri olabilir.
+
+    Args:
+        moment: Servis momenti (kNm)
+        width: Kesit genişliği (m)
+        height: Kesit yüksekliği (m)
+        concrete_class: Beton sınıfı veya sınıf dizisi
+        diameter: Seçilen donatı çapı (mm)
+        count: Donatı adedi
+        cover (float): Paspayı, donatı eksenine (m)
+        quasi_permanent_ratio: Yarı kalıcı yük oranı ψ
+        exposure (str): Çevre koşulu (CRACK_WIDTH_LIMITS)
+        steel_class (str): Çelik sınıfı
+
+    Returns:
+        dict: "quasi_permanent_moment" (kNm), "steel_stress" (MPa),
+            "crack_spacing" (mm), "crack_width" (mm), "is_cracked",
+            "crack_width_limit" (mm), "steel_stress_limit" (MPa),
+            "crack_width_utilization", "steel_stress_utilization",
+            "crack_width_ok", "steel_stress_ok" ve "passed" maskeleri
+    """
+    if exposure not in CRACK_WIDTH_LIMITS:
+        raise ValueError(f"Geçersiz çevre koşulu: {exposure}")
+    if steel_class not in TS500.STEEL_CLASSES:
+        raise ValueError(f"Geçersiz çelik sınıfı: {steel_class}")
+
+    M, b, h, phi, n_bars, psi = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (moment, width, height, diameter, count, quasi_permanent_ratio)))
+    As = n_bars * np.pi * phi**2 / 4  # mm²
+
+    section = calculate_cracked_section(b, h, As, concrete_class, cover)
+    x, I_cr, n = section["neutral_axis"], section["cracked_inertia"], section["modular_ratio"]
+    d = h - cover
+
+    M_qp = np.abs(psi * M)
+    is_cracked = M_qp > section["cracking_moment"]
+    # kNm -> MNm için 1000'e bölünür, gerilme MPa
+    sigma_s = n * M_qp / 1000 * (d - x) / I_cr
+
+    # Etkin çekme alanı ve donatı oranı
+    h_eff = np.minimum.reduce([2.5 * (h - d), (h - x) / 3, h / 2])
+    rho_eff = As / 1e6 / (b * h_eff)
+
+    fck = np.vectorize(TS500.get_fck, otypes=[float])(np.asarray(concrete_class))
+    fct = TS500.calculate_fctk(fck)
+    clear_cover = cover * 1000 - phi / 2  # mm
+    crack_spacing = 3.4 * clear_cover + 0.425 * _K1 * _K2 * phi / rho_eff
+
+    strain = np.maximum((sigma_s - _KT * fct * (1 + n * rho_eff) / rho_eff) / TS500.ES,
+                        0.6 * sigma_s / TS500.ES)
+    crack_width = np.where(is_cracked, crack_spacing * strain, 0.0)
+
+    crack_limit = CRACK_WIDTH_LIMITS[exposure]
+    stress_limit = STEEL_STRESS_LIMIT_RATIO * TS500.STEEL_CLASSES[steel_class]
+    crack_utilization = crack_width / crack_limit
+    stress_utilization = sigma_s / stress_limit
+
+    return {
+        "quasi_permanent_moment": M_qp,
+        "steel_stress": sigma_s,
+        "crack_spacing": crack_spacing,
+        "crack_width": crack_width,
+        "is_cracked": is_cracked,
+        "crack_width_limit": crack_limit,
+        "steel_stress_limit": stress_limit,
+        "crack_width_utilization": crack_utilization,
+        "steel_stress_utilization": stress_utilization,
+        "crack_width_ok": crack_utilization <= 1.0,
+        "steel_stress_ok": stress_utilization <= 1.0,
+        "passed": (crack_utilization <= 1.0) & (stress_utilization <= 1.0)
+    }
+
+def check_results_serviceability(results, option_index=0, cover=0.05, **kwargs):
+    """
+    Hesap sonuçlarının servis durumu kontrollerini tek vektörel çağrıda yapar.
+
+    Donatı hesabı içeren her sonuç için calculate_reinforcement
+    seçeneklerinden option_index sıradaki donatı kullanılır; seçenek sayısı
+    yetersizse son seçenek alınır. Skaler kontrol sonuçları her sonuca
+    "serviceability" anahtarıyla eklenir.
+
+    Args:
+        results (list): "moment", "width", "height" (cm), "concrete_class" ve
+            "reinforcement" anahtarlarını içeren sonuç sözlükleri
+        option_index (int): Kullanılacak donatı seçeneğinin sırası
+        cover (float): Paspayı (m)
+        **kwargs: calculate_crack_width'e aktarılan diğer parametreler
+
+    Returns:
+        dict: Donatılı sonuçların sırasıyla calculate_crack_width dizileri ve
+            sonuç listesindeki konumları ("indices")
+    """
+    indices = [i for i, result in enumerate(results)
+               if result.get("reinforcement") and result["reinforcement"].get("options")]
+    if not indices:
+        return {"indices": np.array([], dtype=int)}
+
+    chosen = [results[i]["reinforcement"]["options"][min(option_index, len(results[i]["reinforcement"]["options"]) - 1)]
+              for i in indices]
+    column = lambda key, scale=1.0: np.array([results[i][key] for i in indices], dtype=float) * scale
+
+    checks = calculate_crack_width(
+        column("moment"), column("width", 0.01), column("height", 0.01),  # cm -> m
+        [results[i]["concrete_class"] for i in indices],
+        np.array([option["diameter"] for option in chosen], dtype=float),
+        np.array([option["count"] for option in chosen], dtype=float),
+        cover, **kwargs)
+
+    for row, index in enumerate(indices):
+        results[index]["serviceability"] = {
+            key: np.asarray(value)[row].item() if np.ndim(value) else value
+            for key, value in checks.items()
+        }
+    checks["indices"] = np.array(indices)
+    return checks
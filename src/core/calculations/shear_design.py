@@ -0,0 +1,206 @@
+import numpy as np
+from .formula_registry import SUPPORT_CONDITIONS
+from .reinforcement import TS500
+
+# Etriye çapları (mm) ve uygulanabilir en küçük etriye aralığı (mm)
+STIRRUP_DIAMETERS = (8, 10, 12, 14)
+MIN_STIRRUP_SPACING = 50
+
+# Sıklaştırma bölgesi: mesnetten itibaren 2h boyunca, aralık ≤ min(h/4, 150 mm)
+DENSE_ZONE_FACTOR = 2.0
+DENSE_ZONE_MAX_SPACING = 150
+
+# Mesnetlerin kiriş boyuna oranla konumları (konsol x = 0'da ankastredir)
+SUPPORT_POSITIONS = {
+    "Basit Mesnetli": (0.0, 1.0),
+    "Konsol": (0.0,),
+    "İki Ucu Ankastre": (0.0, 1.0),
+    "Ankastre-Mafsallı": (0.0, 1.0),
+}
+
+def calculate_shear_capacity(width, height, concrete_class, cover=0.05):
+    """
+    TS500'e göre kesme dayanımları (vektörel, eksenel kuvvetsiz).
+
+    Vcr = 0.65·fctd·bw·d eğik çatlama dayanımı, Vc = 0.8·Vcr betonun
+    katkısı ve Vmax = 0.22·fcd·bw·d kesitin ezilme sınırıdır.
+
+    Args:
+        width: Kesit genişliği (m)
+        height: Kesit yüksekliği (m)
+        concrete_class: Beton sınıfı veya sınıf dizisi
+        cover (float): Paspayı (m)
+
+    Returns:
+        dict: "cracking_shear", "concrete_shear", "max_shear" (kN) ve
+            "effective_depth" (m)
+    """
+    fck = np.vectorize(TS500.get_fck, otypes=[float])(np.asarray(concrete_class))
+    b = np.asarray(width, dtype=float)
+    d = np.asarray(height, dtype=float) - cover
+
+    # MPa·m² = MN -> kN
+    V_cr = 0.65 * TS500.calculate_fctd(fck) * b * d * 1000
+    return {
+        "cracking_shear": V_cr,
+        "concrete_shear": 0.8 * V_cr,
+        "max_shear": 0.22 * TS500.calculate_fcd(fck) * b * d * 1000,
+        "effective_depth": d
+    }
+
+def _zone_stirrups(ratio, s_max, legs, diameters):
+    """
+    Bölgedeki en büyük Asw/s gereksinimi için etriye çapı ve aralığı seçer.
+
+    Aralık 10 mm'ye aşağı yuvarlanır; en az MIN_STIRRUP_SPACING aralık
+    veren en küçük çap seçilir, hiçbiri yetmiyorsa en büyük çap kullanılır.
+
+    Returns:
+        tuple: (çap (mm), aralık (mm), gereksinim karşılanıyor mu)
+    """
+    areas = legs * np.pi * np.asarray(diameters, dtype=float)**2 / 4  # mm²
+    spacing = np.minimum(areas[None, :] / ratio[:, None], s_max[:, None])
+    spacing = np.floor(spacing / 10) * 10
+    feasible = spacing >= MIN_STIRRUP_SPACING
+    choice = np.where(feasible.any(axis=1), np.argmax(feasible, axis=1), len(areas) - 1)
+    rows = np.arange(len(ratio))
+    chosen = np.maximum(spacing[rows, choice], MIN_STIRRUP_SPACING)
+    return np.asarray(diameters)[choice], chosen, feasible[rows, choice]
+
+def calculate_stirrup_positions(length, dense_length, dense_spacing, normal_spacing,
+                                support_condition="Basit Mesnetli"):
+    """
+    Tek bir kiriş için etriye konumlarını (m) hesaplar.
+
+    Mesnetlerden itibaren sıklaştırma bölgelerinde dense_spacing, kalan
+    orta bölgede normal_spacing aralığı kullanılır. Aralıklar mm cinsindendir.
+    """
+    ends = [position * length for position in SUPPORT_POSITIONS[support_condition]]
+    dense_length = min(dense_length, length / len(ends))
+    dense, normal = dense_spacing / 1000, normal_spacing / 1000  # mm -> m
+
+    start = dense_length if 0.0 in ends else 0.0
+    stop = length - dense_length if length in ends else length
+    positions = [np.arange(start, stop + 1e-9, normal)]
+    if 0.0 in ends:
+        positions.append(np.arange(0.0, dense_length, dense))
+    if length in ends:
+        positions.append(length - np.arange(0.0, dense_length, dense))
+    return np.unique(np.round(np.concatenate(positions), 6))
+
+def calculate_shear_reinforcement(shear_distribution, x_values, width, height, concrete_class,
+                                  support_condition="Basit Mesnetli", cover=0.05, steel_class="S420",
+                                  legs=2, diameters=STIRRUP_DIAMETERS):
+    """
+    Kesme kuvveti dağılımından etriye tasarımı (TS500, vektörel).
+
+    Her örnek noktada gerekli Asw/s hesaplanır: Vd ≤ Vcr ise minimum
+    etriye 0.3·fctd/fywd·bw, aksi halde (Vd - Vc)/(fywd·d) ve minimumun
+    büyüğü. Mesnetlerden 2h uzunluğundaki sıklaştırma bölgeleri ile orta
+    bölge için ayrı etriye çapı ve aralığı seçilir. En büyük aralık d/2
+    (Vd > 3·Vcr ise d/4), sıklaştırma bölgesinde ayrıca min(h/4, 150 mm)
+    ile sınırlıdır. Tüm işlemler (kiriş × nokta) dizileri üzerinde yapılır.
+
+    Args:
+        shear_distribution: Kesme kuvveti dağılımı (kN), (nokta,) veya (kiriş, nokta)
+        x_values: Kesit konumları (m), dağılımla aynı veya (nokta,) boyutunda
+        width: Kesit genişliği (m)
+        height: Kesit yüksekliği (m)
+        concrete_class: Beton sınıfı veya sınıf dizisi
+        support_condition (str): Mesnet koşulu
+        cover (float): Paspayı (m)
+        steel_class (str): Etriye çeliği sınıfı
+        legs (int): Etriye kol sayısı
+        diameters: Denenecek etriye çapları (mm)
+
+    Returns:
+        dict: Kiriş başına dayanımlar ("cracking_shear", "concrete_shear",
+            "max_shear" kN), "section_adequate"; (kiriş, nokta) boyutunda
+            "required_ratio" (Asw/s, mm²/mm) ve "dense_zone" maskesi;
+            "dense_length" (m), bölge başına "dense_diameter",
+            "dense_spacing", "normal_diameter", "normal_spacing" (mm),
+            "provided_ratio" (mm²/mm), "adequate" ve "count"
+    """
+    if support_condition not in SUPPORT_CONDITIONS:
+        raise ValueError(f"Geçersiz mesnet koşulu: {support_condition}")
+    if steel_class not in TS500.STEEL_CLASSES:
+        raise ValueError(f"Geçersiz çelik sınıfı: {steel_class}")
+
+    V = np.abs(np.atleast_2d(np.asarray(shear_distribution, dtype=float)))
+    x = np.broadcast_to(np.asarray(x_values, dtype=float), V.shape)
+    n_beams = V.shape[0]
+    column = lambda value: np.broadcast_to(np.asarray(value, dtype=float), (n_beams,)).reshape(-1, 1)
+
+    b, h = column(width), column(height)
+    classes = np.broadcast_to(np.asarray(concrete_class), (n_beams,))
+    capacity = calculate_shear_capacity(b, h, classes.reshape(-1, 1), cover)
+    V_cr, V_c, V_max, d = (capacity[key] for key in
+                           ("cracking_shear", "concrete_shear", "max_shear", "effective_depth"))
+
+    fck = np.vectorize(TS500.get_fck, otypes=[float])(classes).reshape(-1, 1)
+    fywd = TS500.calculate_fyd(TS500.STEEL_CLASSES[steel_class])
+    b_mm, d_mm, h_mm = b * 1000, d * 1000, h * 1000
+
+    # Gerekli Asw/s (mm²/mm): kN -> N için 1000
+    minimum = 0.3 * TS500.calculate_fctd(fck) / fywd * b_mm
+    demand = (V - V_c) * 1000 / (fywd * d_mm)
+    required = np.where(V <= V_cr, minimum, np.maximum(demand, minimum))
+
+    # Sıklaştırma bölgeleri: mesnetlerden 2h uzunluğunda
+    length = x[:, -1:]
+    dense_length = np.minimum(DENSE_ZONE_FACTOR * h, length / len(SUPPORT_POSITIONS[support_condition]))
+    distance = np.min([np.abs(x - position * length) for position in SUPPORT_POSITIONS[support_condition]], axis=0)
+    dense_zone = distance <= dense_length
+
+    high_shear = lambda mask: np.any(mask & (V > 3 * V_cr), axis=1)
+    zone_max = lambda mask: np.max(np.where(mask, required, 0.0), axis=1)
+    d_flat, h_flat = d_mm.ravel(), h_mm.ravel()
+    s_normal_max = np.where(high_shear(~dense_zone), d_flat / 4, d_flat / 2)
+    s_dense_max = np.minimum.reduce([np.where(high_shear(dense_zone), d_flat / 4, d_flat / 2),
+                                     h_flat / 4, np.full(n_beams, DENSE_ZONE_MAX_SPACING)])
+
+    # Orta bölge boşsa (kısa kiriş) minimum gereksinim kullanılır
+    normal_ratio = np.maximum(zone_max(~dense_zone), minimum.ravel())
+    dense_ratio = np.maximum(zone_max(dense_zone), minimum.ravel())
+    dense_diameter, dense_spacing, dense_ok = _zone_stirrups(dense_ratio, s_dense_max, legs, diameters)
+    normal_diameter, normal_spacing, normal_ok = _zone_stirrups(normal_ratio, s_normal_max, legs, diameters)
+
+    area = lambda diameter: legs * np.pi * diameter**2 / 4
+    provided = np.where(dense_zone, (area(dense_diameter) / dense_spacing)[:, None],
+                        (area(normal_diameter) / normal_spacing)[:, None])
+
+    # calculate_stirrup_positions ile aynı sayım
+    n_ends = len(SUPPORT_POSITIONS[support_condition])
+    middle = length.ravel() - n_ends * dense_length.ravel()
+    count = n_ends * np.ceil(dense_length.ravel() / (dense_spacing / 1000)) + \
+        np.ceil((middle + 1e-9) / (normal_spacing / 1000))
+
+    section_adequate = np.max(V, axis=1) <= V_max.ravel()
+    return {
+        "cracking_shear": V_cr.ravel(),
+        "concrete_shear": V_c.ravel(),
+        "max_shear": V_max.ravel(),
+        "section_adequate": section_adequate,
+        "required_ratio": required,
+        "provided_ratio": provided,
+        "dense_zone": dense_zone,
+        "dense_length": dense_length.ravel(),
+        "dense_diameter": dense_diameter,
+        "dense_spacing": dense_spacing,
+        "normal_diameter": normal_diameter,
+        "normal_spacing": normal_spacing,
+        "adequate": section_adequate & dense_ok & normal_ok & np.all(provided >= required - 1e-12, axis=1),
+        "count": count.astype(int)
+    }
+
+def stirrup_summary(design, row, length, support_condition="Basit Mesnetli"):
+    """
+    Vektörel etriye tasarımının bir kirişe ait sonucunu donatı sonuç
+    sözlüğüne eklenecek biçimde (skaler değerler ve etriye konumları) döndürür.
+    """
+    summary = {key: np.asarray(design[key])[row].item() for key in (
+        "cracking_shear", "concrete_shear", "max_shear", "section_adequate", "dense_length",
+        "dense_diameter", "dense_spacing", "normal_diameter", "normal_spacing", "adequate", "count")}
+    summary["positions"] = calculate_stirrup_positions(length, summary["dense_length"], summary["dense_spacing"],
+                                                       summary["normal_spacing"], support_condition)
+    return summary
@@ -0,0 +1,89 @@
+import numpy as np
+
+def minmax_decimate(x_values, y_values, n_bins, x_range=None):
+    """
+    Yoğun bir seriyi piksel başına min/max zarfına indirger.
+
+    x ekseni (x_range içinde) n_bins eşit aralığa bölünür ve her dolu
+    aralıktan en küçük ve en büyük y değerli noktalar x sırasıyla alınır.
+    Böylece tepe değerler korunur ve çizilen nokta sayısı veri boyundan
+    bağımsız olarak en fazla 2·n_bins + 2 olur. Aralığın hemen dışındaki
+    birer komşu nokta da eklenir ki çizgi eksen kenarına kadar uzansın.
+
+    Args:
+        x_values (array): Artan sıralı x değerleri
+        y_values (array): y değerleri
+        n_bins (int): Aralık sayısı (genellikle eksenin piksel genişliği)
+        x_range (tuple): Görünen (x_min, x_max) aralığı; None ise tüm seri
+
+    Returns:
+        tuple: İndirgenmiş (x, y) dizileri
+    """
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+    n_bins = max(int(n_bins), 1)
+    if len(x_values) == 0:
+        return x_values, y_values
+
+    # Görünen aralık ve kenar komşuları
+    if x_range is None:
+        start, stop = 0, len(x_values)
+    else:
+        start = max(int(np.searchsorted(x_values, x_range[0], side="left")) - 1, 0)
+        stop = min(int(np.searchsorted(x_values, x_range[1], side="right")) + 1, len(x_values))
+    if stop - start <= 2 * n_bins + 2:
+        return x_values[start:stop], y_values[start:stop]
+
+    x = x_values[start:stop]
+    y = y_values[start:stop]
+    low, high = (x[0], x[-1]) if x_range is None else (max(x_range[0], x[0]), min(x_range[1], x[-1]))
+    span = high - low if high > low else 1.0
+
+    # Her noktanın aralığı; sıralı x için aralık başlangıçları searchsorted ile bulunur
+    edges = low + span * np.arange(n_bins + 1) / n_bins
+    bins = np.clip(np.searchsorted(edges, x, side="right") - 1, 0, n_bins - 1)
+    starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+    segment = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(x)]))
+
+    # Aralık başına min/max değeri ve ilk konumu
+    index = np.arange(len(x))
+    minima = np.minimum.reduceat(y, starts)
+    maxima = np.maximum.reduceat(y, starts)
+    first_min = np.minimum.reduceat(np.where(y == minima[segment], index, len(x)), starts)
+    first_max = np.minimum.reduceat(np.where(y == maxima[segment], index, len(x)), starts)
+
+    selected = np.unique(np.concatenate(([0, len(x) - 1], first_min, first_max)))
+    selected = selected[selected < len(x)]
+    return x[selected], y[selected]
+
+class DecimatedLine:
+    """
+    Bir çizgi nesnesini (matplotlib Line2D) tam veriyle eşleştirir.
+
+    Çizgiye yalnızca görünen aralığın min/max zarfı verilir; eksenin x
+    sınırları değiştiğinde (araç çubuğuyla yakınlaştırma/kaydırma) zarf
+    yeniden hesaplanır. Aralık sayısı eksenin piksel genişliğidir.
+    """
+
+    def __init__(self, line):
+        self.line = line
+        self.x_values = np.empty(0)
+        self.y_values = np.empty(0)
+        line.axes.callbacks.connect('xlim_changed', self.on_xlim_changed)
+
+    def set_data(self, x_values, y_values):
+        """Tam veriyi saklar ve görünen aralığa göre çizgiyi günceller"""
+        order = np.argsort(x_values, kind="stable")
+        self.x_values = np.asarray(x_values, dtype=float)[order]
+        self.y_values = np.asarray(y_values, dtype=float)[order]
+        self.update()
+
+    def update(self):
+        """Çizgi verisini eksenin güncel x aralığı ve genişliğine göre indirger"""
+        ax = self.line.axes
+        n_bins = max(int(ax.bbox.width), 1)
+        self.line.set_data(*minmax_decimate(self.x_values, self.y_values, n_bins, ax.get_xlim()))
+
+    def on_xlim_changed(self, ax):
+        """Eksen sınırları değişince zarfı yeniden hesaplar"""
+        self.update()
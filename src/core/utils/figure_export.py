@@ -0,0 +1,169 @@
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# 2D grafik panelleri: (başlık, eksen etiketi, renk, birim çarpanı)
+GRAPH_PANELS = (
+    ("Moment Diyagramı", "Moment (kNm)", "b", 1.0),
+    ("Kesme Kuvveti Diyagramı", "Kesme Kuvveti (kN)", "r", 1.0),
+    ("Sehim Diyagramı", "Sehim (mm)", "g", 1000.0),  # m -> mm
+)
+
+EXPORT_FORMATS = ("png", "svg")
+PNG_COMPRESS_LEVEL = 1
+
+# İşçiye tek seferde gönderilen en fazla grafik (iptalin gecikmesini sınırlar)
+EXPORT_CHUNK_SIZE = 8
+
+# İşçi süreç başına bir kez kurulan şekil (eksenler ve çizgiler yeniden kullanılır)
+_FIGURE = None
+_FIGURE_LOCK = threading.Lock()
+
+def figure_payload(results):
+    """
+    Sonuç sözlüğünden çizim için gereken en küçük veriyi çıkarır.
+
+    İşçi süreçlere yalnızca dağılım dizileri ve başlık gönderilir; donatı
+    seçenekleri gibi büyük alt sözlükler kopyalanmaz.
+    """
+    title = (f"L = {results.get('length', 0):.2f} m, q = {results.get('load', 0):.2f} kN, "
+             f"{results.get('width', 0):.0f}x{results.get('height', 0):.0f} cm, "
+             f"{results.get('concrete_class', '')}")
+    return {
+        "title": title,
+        "x_values": np.asarray(results["x_values"], dtype=float),
+        "distributions": tuple(np.asarray(results[key], dtype=float) for key in
+                               ("moment_distribution", "shear_distribution", "deflection_distribution"))
+    }
+
+def _result_figure():
+    """Süreçteki kalıcı şekli döndürür; ilk çağrıda Agg tuvaliyle kurar"""
+    global _FIGURE
+    if _FIGURE is None:
+        figure = Figure(figsize=(8, 6), dpi=100)
+        FigureCanvasAgg(figure)
+        lines = []
+        for index, (title, ylabel, color, _) in enumerate(GRAPH_PANELS):
+            ax = figure.add_subplot(len(GRAPH_PANELS), 1, index + 1)
+            line, = ax.plot([], [], color=color, linewidth=2)
+            ax.set_ylabel(ylabel, fontsize=10)
+            ax.set_title(title, fontsize=12)
+            ax.grid(True)
+            lines.append(line)
+        lines[-1].axes.set_xlabel("Konum (m)", fontsize=10)
+        suptitle = figure.suptitle("", fontsize=10)
+        figure.tight_layout(rect=(0, 0, 1, 0.96))
+        _FIGURE = (figure, lines, suptitle)
+    return _FIGURE
+
+def render_result_figure(payload, filepaths, dpi=300):
+    """
+    Tek sonucun moment, kesme ve sehim grafiklerini dosyalara yazar.
+
+    Arayüzden bağımsızdır: Agg tuvali kullanılır, böylece işçi süreçlerde
+    veya iş parçacıklarında çalışabilir. Şekil süreç başına bir kez kurulur
+    (bir kilitle korunur), her çağrıda yalnızca çizgi verileri ve eksen
+    sınırları güncellenir.
+
+    Args:
+        payload (dict): figure_payload çıktısı
+        filepaths (list): Yazılacak dosya yolları (uzantı biçimi belirler)
+        dpi (int): Çözünürlük
+
+    Returns:
+        list: Yazılan dosya yolları
+    """
+    with _FIGURE_LOCK:
+        figure, lines, suptitle = _result_figure()
+        x_values = payload["x_values"]
+        for line, (_, _, _, scale), values in zip(lines, GRAPH_PANELS, payload["distributions"]):
+            line.set_data(x_values, values * scale)
+            line.axes.relim()
+            line.axes.autoscale_view()
+        suptitle.set_text(payload["title"])
+        for filepath in filepaths:
+            # Düşük zlib düzeyi PNG kodlamasını belirgin hızlandırır (dosya biraz büyür)
+            options = {"pil_kwargs": {"compress_level": PNG_COMPRESS_LEVEL}} if filepath.endswith(".png") else {}
+            figure.savefig(filepath, dpi=dpi, **options)
+    return list(filepaths)
+
+def _render_job(job):
+    """İşçi süreç giriş noktası (pickle edilebilir olması için modül düzeyinde)"""
+    payload, filepaths, dpi = job
+    return render_result_figure(payload, filepaths, dpi)
+
+def _render_chunk(chunk):
+    """İşçi süreçte bir grup grafiği sırayla çizer"""
+    return [_render_job(job) for job in chunk]
+
+def export_result_figures(results, directory, prefix="beam_graphs", formats=("png",), dpi=300,
+                          max_workers=None, progress=None, cancel_event=None):
+    """
+    Sonuçların grafiklerini paralel olarak PNG/SVG dosyalarına yazar.
+
+    Her sonuç için figure_payload ile küçük bir veri paketi hazırlanır ve
+    Agg ile çizim ProcessPoolExecutor işçilerine parçalar halinde dağıtılır;
+    her işçi kendi şeklini yeniden kullanır. İşçiler "spawn" ile başlatılır;
+    Qt iş parçacıkları olan bir süreçten fork güvenli değildir. Tek sonuç ya
+    da max_workers=1 için süreç havuzu kurulmadan çağıran iş parçacığında
+    çizilir.
+
+    cancel_event (threading.Event) ayarlandığında yeni grafik başlatılmaz:
+    işler en fazla EXPORT_CHUNK_SIZE grafiklik parçalar halinde gönderilir,
+    bekleyen parçalar iptal edilir ve o ana kadar yazılanlar döndürülür.
+
+    Args:
+        results (list): "x_values" ve dağılımları içeren sonuç sözlükleri
+        directory (str): Çıktı dizini
+        prefix (str): Dosya adı öneki (birden çok sonuçta sıra numarası eklenir)
+        formats (tuple): EXPORT_FORMATS içinden dosya biçimleri
+        dpi (int): Çözünürlük
+        max_workers (int): İşçi süreç sayısı (None: işlemci sayısı)
+        progress (callable): Her tamamlanan grafikte (tamamlanan, toplam) ile çağrılır
+        cancel_event (threading.Event): Ayarlanınca dışa aktarma durdurulur
+
+    Returns:
+        list: Yazılan her sonuç için dosya yollarının listesi (iptalde kısmi)
+    """
+    for file_format in formats:
+        if file_format not in EXPORT_FORMATS:
+            raise ValueError(f"Geçersiz dosya biçimi: {file_format}")
+    os.makedirs(directory, exist_ok=True)
+
+    jobs = []
+    for index, result in enumerate(results):
+        name = prefix if len(results) == 1 else f"{prefix}_{index + 1:05d}"
+        filepaths = [os.path.join(directory, f"{name}.{file_format}") for file_format in formats]
+        jobs.append((figure_payload(result), filepaths, dpi))
+
+    progress = progress or (lambda done, total: None)
+    cancelled = (lambda: False) if cancel_event is None else cancel_event.is_set
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    written = []
+    if cancelled():
+        return written
+    if workers <= 1:
+        for job in jobs:
+            if cancelled():
+                break
+            written.append(_render_job(job))
+            progress(len(written), len(jobs))
+        return written
+
+    chunksize = min(max(1, len(jobs) // (workers * 8)), EXPORT_CHUNK_SIZE)
+    chunks = [jobs[start:start + chunksize] for start in range(0, len(jobs), chunksize)]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [executor.submit(_render_chunk, chunk) for chunk in chunks]
+        for future in futures:
+            if cancelled():
+                # Başlamamış parçalar iptal edilir; çalışanlar en fazla bir parça sürer
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+            written.extend(future.result())
+            progress(len(written), len(jobs))
+    return written
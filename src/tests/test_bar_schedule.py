@@ -0,0 +1,93 @@
+import unittest
+import numpy as np
+from src.core.calculations.bar_schedule import (
+    calculate_bar_length, optimize_cutting_stock, collect_bar_pieces, calculate_bar_schedule
+)
+from src.core.calculations.beam_calculation import calculate_beam_batch
+
+class TestBarSchedule(unittest.TestCase):
+    """Donatı kesim planı optimizasyonunu test eden sınıf"""
+
+    def assertPlanValid(self, plan, lengths, counts, stock_length=12.0):
+        """Kesim planının tüm parçaları içerdiğini ve stok boyunu aşmadığını doğrula"""
+        planned = {}
+        for pattern in plan["patterns"]:
+            self.assertLessEqual(sum(length * count for length, count in pattern["cuts"]), stock_length + 1e-9)
+            self.assertGreaterEqual(pattern["waste"], -1e-9)
+            for length, count in pattern["cuts"]:
+                planned[round(length, 3)] = planned.get(round(length, 3), 0) + count * pattern["repeat"]
+
+        expected = {}
+        for length, count in zip(lengths, counts):
+            expected[round(length, 3)] = expected.get(round(length, 3), 0) + count
+        self.assertEqual(planned, expected)
+        self.assertEqual(sum(pattern["repeat"] for pattern in plan["patterns"]), plan["stock_count"])
+        self.assertGreaterEqual(plan["stock_count"], plan["lower_bound"])
+
+    def test_small_instance(self):
+        """Elle çözülebilen küçük örnekte optimum çubuk sayısını test et"""
+        lengths = [5.0, 4.0, 3.0, 2.0]
+        counts = [2, 2, 2, 2]
+        plan = optimize_cutting_stock(lengths, counts)
+
+        self.assertPlanValid(plan, lengths, counts)
+        self.assertEqual(plan["stock_count"], 3)
+        self.assertAlmostEqual(plan["used_length"], 28.0)
+        self.assertAlmostEqual(plan["waste_length"], 8.0)
+        self.assertAlmostEqual(plan["waste_ratio"], 8.0 / 36.0)
+
+    def test_identical_pieces_and_kerf(self):
+        """Aynı boydaki parçaların toplu yerleşimini ve testere payını test et"""
+        plan = optimize_cutting_stock([4.0], [10])
+        self.assertEqual(plan["stock_count"], 4)
+        self.assertEqual(plan["patterns"][0], {"cuts": [(4.0, 3)], "repeat": 3, "waste": 0.0})
+
+        # 5 mm testere payıyla 12 m'den üç adet 4 m kesilemez
+        plan = optimize_cutting_stock([4.0], [10], kerf=0.005)
+        self.assertEqual(plan["stock_count"], 5)
+
+        with self.assertRaises(ValueError):
+            optimize_cutting_stock([13.0])
+
+    def test_random_instance(self):
+        """Rastgele örnekte planın geçerliliğini ve iyileştirmenin etkisini test et"""
+        rng = np.random.default_rng(0)
+        lengths = np.round(rng.uniform(2.0, 8.0, 300), 1)
+        counts = rng.integers(1, 5, 300)
+
+        plan = optimize_cutting_stock(lengths, counts)
+        self.assertPlanValid(plan, lengths, counts)
+        greedy = optimize_cutting_stock(lengths, counts, improvement_passes=0)
+        self.assertLessEqual(plan["stock_count"], greedy["stock_count"])
+        self.assertLessEqual(plan["stock_count"], 1.1 * plan["lower_bound"] + 1)
+
+    def test_schedule_from_results(self):
+        """Hesap sonuçlarından çapa göre parçaların toplanmasını test et"""
+        scenarios = [
+            {"length": 5.0, "load": 20.0, "width": 30, "height": 50, "concrete_class": "C25",
+             "load_type": "Düzgün Yayılı Yük", "with_reinforcement": True},
+            {"length": 5.0, "load": 20.0, "width": 30, "height": 50, "concrete_class": "C25",
+             "load_type": "Düzgün Yayılı Yük", "with_reinforcement": True},
+            {"length": 14.0, "load": 10.0, "width": 30, "height": 80, "concrete_class": "C30",
+             "load_type": "Düzgün Yayılı Yük", "with_reinforcement": True},
+        ]
+        results = calculate_beam_batch(scenarios)
+        for scenario, result in zip(scenarios, results):
+            result["length"] = scenario["length"]
+
+        pieces = collect_bar_pieces(results)
+        option = results[0]["reinforcement"]["options"][0]
+        short = pieces[option["diameter"]]
+        index = np.flatnonzero(np.isclose(short["lengths"], calculate_bar_length(5.0, option["diameter"])))
+        self.assertEqual(len(index), 1)
+        self.assertGreaterEqual(short["counts"][index[0]], 2 * option["count"])
+        self.assertTrue(all(np.all(group["lengths"] <= 12.0) for group in pieces.values()))
+
+        schedule = calculate_bar_schedule(results)
+        self.assertEqual(set(schedule["diameters"]), set(pieces))
+        self.assertEqual(schedule["total_stock_count"],
+                         sum(plan["stock_count"] for plan in schedule["diameters"].values()))
+        self.assertGreater(schedule["total_waste_weight"], 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
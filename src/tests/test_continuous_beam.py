@@ -0,0 +1,69 @@
+import unittest
+import itertools
+import numpy as np
+from src.core.calculations.continuous_beam import solve_support_moments, calculate_continuous_beam
+from src.core.calculations.finite_element import solve_beam_fe
+from src.core.calculations.beam_calculation import calculate_elasticity_modulus
+
+class TestContinuousBeam(unittest.TestCase):
+    """Sürekli kiriş analizini test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.spans = [4.0, 6.0, 5.0]  # m
+        self.dead_load = 10.0  # kN/m
+        self.live_load = 15.0  # kN/m
+        self.I = 0.30 * 0.50**3 / 12  # m⁴
+
+    def test_two_equal_spans(self):
+        """Eşit iki açıklıkta orta mesnet momentinin -qL²/8 olmasını test et"""
+        moments = solve_support_moments([5.0, 5.0], self.I, [self.dead_load, self.dead_load])
+        self.assertAlmostEqual(moments[1], -self.dead_load * 5.0**2 / 8, places=9)
+        self.assertEqual(moments[0], 0)
+        self.assertEqual(moments[-1], 0)
+
+    def test_matches_finite_element(self):
+        """Mesnet momentleri ve sehimin sonlu eleman çözümüyle uyumunu test et"""
+        results = calculate_continuous_beam(self.spans, self.dead_load, width=30, height=50)
+        E = calculate_elasticity_modulus("C25")
+        supports = [(x, "pinned") for x in np.concatenate([[0.0], np.cumsum(self.spans)])]
+        fe = solve_beam_fe(sum(self.spans), E, self.I, supports,
+                           distributed_load=self.dead_load, n_elements=1500)
+
+        # 4 m ve 10 m'deki iç mesnetler (eleman boyu 1 cm)
+        fe_moments = fe["moment_distribution"][[400, 1000]]
+        self.assertTrue(np.allclose(results["support_moments"][1:-1], fe_moments, rtol=1e-4))
+        self.assertAlmostEqual(results["max_deflection"] / fe["max_deflection"], 1.0, places=3)
+
+    def test_pattern_envelope_matches_brute_force(self):
+        """Yük düzenlemesi zarfının tüm düzenlemelerin taranmasıyla aynı olmasını test et"""
+        spans = [5.0, 4.0, 6.0, 5.5]
+        results = calculate_continuous_beam(spans, self.dead_load, self.live_load)
+
+        moments = []
+        for pattern in itertools.product([0, 1], repeat=len(spans)):
+            loads = self.dead_load + self.live_load * np.array(pattern)
+            moments.append(calculate_continuous_beam(spans, loads)["moment_distribution"])
+        moments = np.array(moments)
+
+        self.assertTrue(np.allclose(results["moment_envelope_max"], moments.max(axis=0)))
+        self.assertTrue(np.allclose(results["moment_envelope_min"], moments.min(axis=0)))
+
+    def test_critical_patterns(self):
+        """Kritik düzenlemelerin dama ve komşu açıklık düzenlemeleri olmasını test et"""
+        results = calculate_continuous_beam([5.0] * 4, self.dead_load, self.live_load)
+
+        # Açıklık momenti için açıklıklar birer atlanarak yüklenir
+        self.assertEqual(results["critical_span_patterns"][0].tolist(), [True, False, True, False])
+        # İç mesnet momenti için mesnede komşu iki açıklık ve bir sonraki yüklenir
+        self.assertEqual(results["critical_support_patterns"][0].tolist(), [True, True, False, True])
+
+    def test_invalid_spans(self):
+        """Geçersiz açıklık boyları için hata kontrolü"""
+        with self.assertRaises(ValueError):
+            calculate_continuous_beam([], self.dead_load)
+        with self.assertRaises(ValueError):
+            calculate_continuous_beam([5.0, -2.0], self.dead_load)
+
+if __name__ == '__main__':
+    unittest.main()
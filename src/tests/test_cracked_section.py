@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+from src.core.calculations.cracked_section import (
+    calculate_cracked_section, calculate_effective_inertia, calculate_cracked_deflection
+)
+from src.core.calculations.beam_calculation import calculate_beam_analysis
+
+class TestCrackedSection(unittest.TestCase):
+    """Çatlamış kesit ve etkin atalet momenti hesaplarını test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.width = 0.30  # m
+        self.height = 0.50  # m
+        self.cover = 0.05  # m
+        self.steel_area = 1000.0  # mm²
+
+    def test_neutral_axis_equilibrium(self):
+        """Tarafsız eksende beton ve donatı alan momentlerinin eşitliğini test et"""
+        section = calculate_cracked_section(self.width, self.height, self.steel_area, "C25", self.cover)
+        x = section["neutral_axis"]
+        n = section["modular_ratio"]
+        d = self.height - self.cover
+
+        self.assertAlmostEqual(self.width * x**2 / 2, n * self.steel_area / 1e6 * (d - x), places=12)
+        self.assertLess(section["cracked_inertia"], section["gross_inertia"])
+        # fctk = 0.35·√25 = 1.75 MPa, M_cr = fctk·b·h²/6
+        self.assertAlmostEqual(section["cracking_moment"], 1.75 * self.width * self.height**2 / 6 * 1000, places=9)
+
+    def test_effective_inertia_limits(self):
+        """Etkin atalet momentinin brüt ve çatlamış değerler arasında kalmasını test et"""
+        I_g, I_cr, M_cr = 3e-3, 6e-4, 20.0
+        moments = np.array([0.0, 10.0, 20.0, 40.0, 1e6])
+        I_e = calculate_effective_inertia(moments, M_cr, I_g, I_cr)
+
+        self.assertTrue(np.allclose(I_e[:3], I_g))
+        self.assertAlmostEqual(I_e[3], I_cr + (I_g - I_cr) / 8)
+        self.assertAlmostEqual(I_e[4], I_cr, places=12)
+
+    def test_batch_matches_scalar(self):
+        """Dizi hesabının tek tek hesaplarla aynı olmasını test et"""
+        lengths = np.array([4.0, 5.0, 6.0, 8.0])
+        loads = np.array([5.0, 20.0, 30.0, 40.0])
+        classes = ["C20", "C25", "C30", "C35"]
+        batch = calculate_cracked_deflection(lengths, loads, 30, 50, classes, "Düzgün Yayılı Yük")
+
+        for i in range(len(lengths)):
+            single = calculate_cracked_deflection(lengths[i], loads[i], 30, 50, classes[i], "Düzgün Yayılı Yük")
+            self.assertAlmostEqual(batch["max_deflection"][i], single["max_deflection"], places=12)
+            self.assertEqual(batch["is_cracked"][i], single["is_cracked"])
+
+    def test_analysis_service_deflection(self):
+        """Çatlamış kesit sehiminin brüt kesit sehiminden büyük olmasını test et"""
+        uncracked = calculate_beam_analysis(5.0, 5.0, 30, 50, "C25", "Düzgün Yayılı Yük",
+                                            with_cracked_section=True)
+        cracked = calculate_beam_analysis(5.0, 30.0, 30, 50, "C25", "Düzgün Yayılı Yük",
+                                          with_cracked_section=True)
+
+        self.assertFalse(uncracked["cracked_section"]["is_cracked"])
+        self.assertAlmostEqual(uncracked["service_deflection"], uncracked["max_deflection"], places=12)
+        self.assertTrue(cracked["cracked_section"]["is_cracked"])
+        self.assertGreater(cracked["service_deflection"], 2 * cracked["max_deflection"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from src.core.utils.decimation import minmax_decimate, DecimatedLine
+
+class TestDecimation(unittest.TestCase):
+    """Çizim için min/max indirgemesini test eden sınıf"""
+
+    def setUp(self):
+        self.x = np.linspace(0, 10, 100001)
+        self.y = np.sin(self.x) + 0.01 * np.cos(500 * self.x)
+        self.y[31234] = 5.0   # tek noktalık tepe
+        self.y[70001] = -4.0
+
+    def test_envelope_preserves_peaks(self):
+        """İndirgenmiş serinin nokta sınırını ve tepe değerleri koruduğunu test et"""
+        x, y = minmax_decimate(self.x, self.y, 800)
+
+        self.assertLessEqual(len(x), 2 * 800 + 2)
+        self.assertTrue(np.all(np.diff(x) > 0))
+        self.assertEqual(y.max(), 5.0)
+        self.assertEqual(y.min(), -4.0)
+        self.assertEqual((x[0], x[-1]), (0.0, 10.0))
+
+        # Her aralığın min/max değeri zarfta bulunur
+        bins = np.minimum((self.x / 10 * 800).astype(int), 799)
+        for b in (0, 250, 799):
+            segment = self.y[bins == b]
+            self.assertIn(segment.max(), y)
+            self.assertIn(segment.min(), y)
+
+    def test_visible_range(self):
+        """Görünen aralığın kenar komşularıyla birlikte indirgendiğini test et"""
+        x, y = minmax_decimate(self.x, self.y, 100, (2.0, 3.0))
+        self.assertLessEqual(len(x), 2 * 100 + 2)
+        self.assertLess(x[0], 2.0)
+        self.assertGreater(x[-1], 3.0)
+        self.assertTrue(np.all((x >= 2.0 - 1e-3) & (x <= 3.0 + 1e-3)))
+
+        # Az noktalı seriler olduğu gibi döner
+        x, y = minmax_decimate([0.0, 1.0, 2.0], [1.0, 3.0, 2.0], 100)
+        self.assertEqual(y.tolist(), [1.0, 3.0, 2.0])
+        x, y = minmax_decimate(self.x, self.y, 100000, (2.0, 2.001))
+        start = int(np.flatnonzero(self.x == x[0])[0])
+        self.assertTrue(np.array_equal(y, self.y[start:start + len(y)]))
+        self.assertTrue(x[0] < 2.0 and x[-1] > 2.001)
+
+    def test_line_follows_zoom(self):
+        """Eksen sınırları değişince çizgi verisinin yeniden indirgendiğini test et"""
+        fig = Figure(figsize=(4, 3), dpi=100)
+        ax = fig.add_subplot(111)
+        line, = ax.plot([], [])
+        ax.set_xlim(0, 10)
+        series = DecimatedLine(line)
+        series.set_data(self.x[::-1], self.y[::-1])
+
+        width = int(ax.bbox.width)
+        self.assertLessEqual(len(line.get_xdata()), 2 * width + 2)
+        self.assertEqual(np.max(line.get_ydata()), 5.0)
+
+        ax.set_xlim(3.1, 3.2)
+        xdata = line.get_xdata()
+        self.assertLessEqual(len(xdata), 2 * width + 2)
+        self.assertGreater(np.count_nonzero((xdata >= 3.1) & (xdata <= 3.2)), width)
+        self.assertEqual(np.max(line.get_ydata()), 5.0)
+
+if __name__ == '__main__':
+    unittest.main()
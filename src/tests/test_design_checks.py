@@ -0,0 +1,96 @@
+import unittest
+import numpy as np
+from src.core.calculations.design_checks import (
+    DESIGN_CHECKS, calculate_flexural_capacity, run_design_checks, check_results_design
+)
+from src.core.calculations.reinforcement import TS500, calculate_reinforcement
+from src.core.calculations.beam_calculation import calculate_beam_batch
+
+class TestDesignChecks(unittest.TestCase):
+    """Vektörel tasarım kontrollerini test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.width = 0.30  # m
+        self.height = 0.50  # m
+        self.concrete_class = "C25"
+
+    def test_capacity_matches_design(self):
+        """Gerekli donatı alanıyla eğilme kullanım oranının 1 olduğunu test et"""
+        for moment in (50.0, 150.0, 250.0):
+            with self.subTest(moment=moment):
+                design = calculate_reinforcement(moment, self.concrete_class, self.width, self.height)
+                capacity = calculate_flexural_capacity(design["required_area"], self.width, self.height,
+                                                       self.concrete_class)
+                if design["required_area"] > design["min_area"]:
+                    self.assertAlmostEqual(float(capacity), moment)
+                else:
+                    self.assertGreater(float(capacity), moment)
+
+    def test_utilization_matrix(self):
+        """Kullanım matrisini el hesabıyla karşılaştır"""
+        moments = np.array([50.0, 150.0, 300.0])
+        result = run_design_checks(moments, self.width, self.height, self.concrete_class, 1000.0,
+                                   length=6.0, deflection=np.array([0.01, 0.02, 0.03]),
+                                   diameter=16, count=5)
+        utilization = result["utilization"]
+        self.assertEqual(utilization.shape, (3, len(DESIGN_CHECKS)))
+
+        fcd = TS500.calculate_fcd(25)
+        column = DESIGN_CHECKS.index
+        self.assertTrue(np.allclose(utilization[:, column("max_k")],
+                                    moments / (0.30 * 0.45**2 * fcd * 1000) / TS500.K_MAX))
+        self.assertTrue(np.allclose(utilization[:, column("min_reinforcement")], 0.30 * 0.50 * 1e6 * 0.0030 / 1000))
+        self.assertTrue(np.allclose(utilization[:, column("deflection")], np.array([0.01, 0.02, 0.03]) / (6.0 / 250)))
+        self.assertTrue(np.allclose(utilization[:, column("spacing")], 25 / (200 / 4)))
+
+        # Yönetici kontrol ve maskeler
+        self.assertTrue(np.array_equal(result["governing_index"], np.argmax(utilization, axis=1)))
+        self.assertTrue(np.array_equal(result["failed"], utilization > 1))
+        self.assertTrue(np.array_equal(result["passed"], ~result["failed"].any(axis=1)))
+        self.assertFalse(result["passed"][-1])
+        self.assertEqual(result["governing_check"][0], "spacing")
+        self.assertEqual(result["governing_check"][-1], "flexure")
+
+    def test_missing_data_and_validation(self):
+        """Eksik veride NaN sütunları ve geçersiz girdileri test et"""
+        result = run_design_checks([50.0, 80.0], self.width, self.height, ["C25", "C30"], 600.0,
+                                   support_condition=["Basit Mesnetli", "Konsol"])
+        self.assertTrue(np.all(np.isnan(result["utilization"][:, DESIGN_CHECKS.index("deflection")])))
+        self.assertTrue(np.all(np.isnan(result["utilization"][:, DESIGN_CHECKS.index("spacing")])))
+        self.assertFalse(np.isnan(result["governing_utilization"]).any())
+
+        # Konsolda sehim sınırı L/125
+        result = run_design_checks(50.0, self.width, self.height, self.concrete_class, 600.0,
+                                   length=2.0, deflection=0.008, support_condition="Konsol")
+        self.assertAlmostEqual(result["utilization"][0, DESIGN_CHECKS.index("deflection")], 0.5)
+
+        with self.assertRaises(ValueError):
+            run_design_checks(50.0, self.width, self.height, self.concrete_class, 600.0, support_condition="Geçersiz")
+
+    def test_results_are_annotated(self):
+        """Toplu hesap sonuçlarına tasarım kontrollerinin eklendiğini test et"""
+        scenarios = [
+            {"length": 5.0, "load": 20.0, "width": 30, "height": 50, "concrete_class": "C25",
+             "load_type": "Düzgün Yayılı Yük", "with_reinforcement": True},
+            {"length": 5.0, "load": 20.0, "width": 30, "height": 50, "concrete_class": "C25",
+             "load_type": "Düzgün Yayılı Yük"},
+            {"length": 7.0, "load": 30.0, "width": 30, "height": 60, "concrete_class": "C30",
+             "load_type": "Düzgün Yayılı Yük", "with_reinforcement": True},
+        ]
+        results = calculate_beam_batch(scenarios)
+        for scenario, result in zip(scenarios, results):
+            result.update({key: scenario[key] for key in ("length", "width", "height", "concrete_class")})
+
+        checks = check_results_design(results)
+        self.assertTrue(np.array_equal(checks["indices"], [0, 2]))
+        self.assertNotIn("design_checks", results[1])
+
+        annotated = results[2]["design_checks"]
+        self.assertEqual(set(annotated["utilization"]), set(DESIGN_CHECKS))
+        self.assertLessEqual(annotated["utilization"]["flexure"], 1.0)
+        self.assertIn(annotated["governing_check"], DESIGN_CHECKS)
+        self.assertIsInstance(annotated["passed"], bool)
+
+if __name__ == '__main__':
+    unittest.main()
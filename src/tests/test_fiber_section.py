@@ -0,0 +1,98 @@
+import unittest
+import numpy as np
+from src.core.calculations.fiber_section import (
+    concrete_stress, steel_stress, calculate_moment_curvature
+)
+from src.core.calculations.beam_calculation import calculate_elasticity_modulus
+
+class TestFiberSection(unittest.TestCase):
+    """Lifli kesit moment-eğrilik hesaplarını test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.width = 0.30  # m
+        self.height = 0.50  # m
+        self.cover = 0.05  # m
+        self.steel_area = 1200.0  # mm²
+        self.concrete_class = "C25"
+
+    def test_material_laws(self):
+        """Beton ve çelik gerilme-birim şekil değiştirme ilişkilerini test et"""
+        strain = np.array([-1e-3, 0.0, 0.001, 0.002, 0.0035, 0.004])
+        self.assertTrue(np.allclose(concrete_stress(strain, 25.0), [0, 0, 18.75, 25.0, 21.25, 0]))
+
+        # Çatlamadan önce beton çekme taşır
+        stress = concrete_stress(np.array([-5e-5, -1e-4]), 25.0, Ec=30000.0, fct=1.75)
+        self.assertTrue(np.allclose(stress, [-1.5, 0.0]))
+
+        self.assertTrue(np.allclose(steel_stress([-0.01, -1e-3, 1e-3, 0.01], 420.0), [-420, -200, 200, 420]))
+
+        # Skaler birim şekil değiştirme de kabul edilir
+        self.assertAlmostEqual(float(concrete_stress(0.001, 25.0)), 18.75)
+        self.assertAlmostEqual(float(concrete_stress(np.float64(0.004), 25.0)), 0.0)
+        self.assertAlmostEqual(float(concrete_stress(-5e-5, 25.0, Ec=30000.0, fct=1.75)), -1.5)
+
+    def test_curve_and_equilibrium(self):
+        """Eğrinin boyutunu, başlangıç rijitliğini ve eksenel dengeyi test et"""
+        result = calculate_moment_curvature(self.width, self.height, self.steel_area,
+                                            self.concrete_class, self.cover)
+        self.assertEqual(result["moment"].shape, (200,))
+        self.assertTrue(result["converged"].all())
+        self.assertEqual(result["moment"][0], 0.0)
+
+        # Çatlamadan önce rijitlik yaklaşık olarak brüt kesitin EI değeridir
+        E = calculate_elasticity_modulus(self.concrete_class) / 1000  # kN/m²
+        EI = E * self.width * self.height**3 / 12
+        self.assertAlmostEqual(result["moment"][1] / result["curvature"][1] / EI, 1.0, delta=0.1)
+
+        # Bir noktada lif kuvvetlerinin toplamı sıfır olmalı
+        k, top = result["curvature"][120], result["top_strain"][120]
+        t = (np.arange(50) + 0.5) / 50 * self.height
+        Ec = calculate_elasticity_modulus(self.concrete_class) / 1e6
+        concrete = concrete_stress(top - k * t, 25.0, Ec=Ec, fct=0.35 * np.sqrt(25.0))
+        steel = steel_stress(top - k * (self.height - self.cover), 420.0)
+        axial = concrete.sum() * self.width * self.height / 50 + steel * self.steel_area / 1e6
+        self.assertAlmostEqual(axial, 0.0, places=8)
+
+    def test_ultimate_moment_matches_stress_block(self):
+        """Taşıma momentini dikdörtgen gerilme bloğuyla karşılaştır"""
+        result = calculate_moment_curvature(self.width, self.height, self.steel_area,
+                                            self.concrete_class, self.cover)
+        d = self.height - self.cover
+        As = self.steel_area / 1e6
+        a = As * 420 / (0.85 * 25 * self.width)
+        expected = As * 420 * (d - a / 2) * 1000
+
+        self.assertAlmostEqual(result["ultimate_moment"] / expected, 1.0, delta=0.02)
+        self.assertLess(result["yield_moment"], result["ultimate_moment"])
+        self.assertGreater(result["curvature_ductility"], 1.0)
+
+    def test_ductility_decreases_with_steel(self):
+        """Donatı oranı arttıkça eğrilik sünekliğinin azaldığını test et"""
+        areas = np.array([600.0, 1200.0, 2400.0, 4800.0])
+        result = calculate_moment_curvature(self.width, self.height, areas, self.concrete_class, self.cover)
+        ductility = result["curvature_ductility"]
+
+        self.assertEqual(result["moment"].shape, (4, 200))
+        self.assertTrue(np.all(np.diff(ductility[np.isfinite(ductility)]) < 0))
+
+        # Aşırı donatılı kesitte çelik akmaz
+        over = calculate_moment_curvature(self.width, self.height, 12000.0, self.concrete_class, self.cover)
+        self.assertTrue(np.isnan(over["curvature_ductility"]))
+
+    def test_batch_matches_scalar(self):
+        """Vektörel hesabın tekil hesaplarla aynı sonucu verdiğini test et"""
+        heights = np.array([0.40, 0.50, 0.60])
+        classes = ["C20", "C25", "C30"]
+        batch = calculate_moment_curvature(self.width, heights, self.steel_area, classes, chunk_size=2)
+
+        for i in range(3):
+            single = calculate_moment_curvature(self.width, heights[i], self.steel_area, classes[i])
+            self.assertTrue(np.allclose(batch["moment"][i], single["moment"]))
+            self.assertTrue(np.allclose(batch["curvature"][i], single["curvature"]))
+
+        with self.assertRaises(ValueError):
+            calculate_moment_curvature(self.width, self.height, 0.0, self.concrete_class)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import os
+import tempfile
+import threading
+from src.core.calculations.beam_calculation import calculate_beam_batch
+from src.core.utils.figure_export import export_result_figures, figure_payload, render_result_figure
+
+class TestFigureExport(unittest.TestCase):
+    """Sonuç verisinden grafik dosyası üretimini test eden sınıf"""
+
+    def setUp(self):
+        self.scenarios = [{"length": 4.0 + index, "load": 20.0, "width": 30, "height": 50,
+                           "concrete_class": "C25", "load_type": "Düzgün Yayılı Yük"} for index in range(3)]
+        self.results = calculate_beam_batch(self.scenarios)
+        for scenario, result in zip(self.scenarios, self.results):
+            result.update(scenario)
+        self.directory = tempfile.mkdtemp()
+
+    def test_serial_export(self):
+        """Sıralı dışa aktarmada dosya adlarını, biçimleri ve ilerlemeyi test et"""
+        progress = []
+        written = export_result_figures(self.results, self.directory, prefix="rapor", formats=("png", "svg"),
+                                        dpi=50, max_workers=1, progress=lambda done, total: progress.append((done, total)))
+
+        self.assertEqual(progress, [(1, 3), (2, 3), (3, 3)])
+        self.assertEqual(len(written), 3)
+        self.assertEqual(os.path.basename(written[0][0]), "rapor_00001.png")
+        for png, svg in written:
+            with open(png, "rb") as file:
+                self.assertEqual(file.read(8), b"\x89PNG\r\n\x1a\n")
+            with open(svg) as file:
+                self.assertIn("<svg", file.read())
+
+        # Tek sonuçta sıra numarası eklenmez
+        single = export_result_figures(self.results[:1], self.directory, prefix="tek", dpi=50)
+        self.assertEqual(single, [[os.path.join(self.directory, "tek.png")]])
+
+        with self.assertRaises(ValueError):
+            export_result_figures(self.results, self.directory, formats=("jpg",))
+
+    def test_figure_reuse(self):
+        """Kalıcı şeklin her çizimde yeni veriyle ölçeklendiğini test et"""
+        from src.core.utils import figure_export
+        render_result_figure(figure_payload(self.results[0]), [os.path.join(self.directory, "a.png")], dpi=50)
+        figure, lines, suptitle = figure_export._FIGURE
+        render_result_figure(figure_payload(self.results[2]), [os.path.join(self.directory, "b.png")], dpi=50)
+
+        self.assertIs(figure_export._FIGURE[0], figure)
+        self.assertAlmostEqual(lines[0].axes.get_xlim()[1], 6.0, delta=0.5)
+        self.assertIn("L = 6.00 m", suptitle.get_text())
+
+    def test_parallel_export(self):
+        """İşçi süreçlerle üretilen dosyaların sıralı sonuçla aynı yollarda olduğunu test et"""
+        written = export_result_figures(self.results, self.directory, dpi=50, max_workers=2)
+        self.assertEqual([os.path.basename(paths[0]) for paths in written],
+                         ["beam_graphs_00001.png", "beam_graphs_00002.png", "beam_graphs_00003.png"])
+        self.assertTrue(all(os.path.getsize(paths[0]) > 0 for paths in written))
+
+    def test_cancel_export(self):
+        """İptal edilen dışa aktarmada yeni grafik başlatılmadığını test et"""
+        cancel_event = threading.Event()
+        progress = []
+
+        def stop_after_first(done, total):
+            progress.append(done)
+            cancel_event.set()
+
+        written = export_result_figures(self.results, self.directory, dpi=50, max_workers=1,
+                                        progress=stop_after_first, cancel_event=cancel_event)
+        self.assertEqual(len(written), 1)
+        self.assertEqual(progress, [1])
+        self.assertEqual(sorted(os.listdir(self.directory)), ["beam_graphs_00001.png"])
+
+        # Süreç havuzunda da bekleyen parçalar iptal edilir
+        many = self.results * 12
+        directory = tempfile.mkdtemp()
+        cancel_event = threading.Event()
+        written = export_result_figures(many, directory, dpi=30, max_workers=2,
+                                        progress=lambda done, total: cancel_event.set(),
+                                        cancel_event=cancel_event)
+        self.assertLess(len(written), len(many))
+        self.assertLess(len(os.listdir(directory)), len(many))
+
+        # Baştan iptal edilmişse hiçbir şey yazılmaz
+        self.assertEqual(export_result_figures(many, directory, max_workers=2, cancel_event=cancel_event), [])
+
+if __name__ == '__main__':
+    unittest.main()
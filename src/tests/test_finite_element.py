@@ -0,0 +1,98 @@
+import unittest
+import time
+import numpy as np
+from src.core.calculations.finite_element import solve_beam_fe, calculate_beam_analysis_fe
+
+class TestFiniteElement(unittest.TestCase):
+    """Sonlu eleman kiriş çözücüsünü test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.length = 6.0  # m
+        self.load = 10.0  # kN veya kN/m
+        self.E = 30e9  # N/m²
+        self.I = 0.30 * 0.50**3 / 12  # m⁴
+        self.simple = [(0.0, "pinned"), (self.length, "pinned")]
+
+    def test_cantilever_point_load(self):
+        """Ucunda tekil yük bulunan konsol kirişi test et"""
+        results = solve_beam_fe(self.length, self.E, self.I, [(0.0, "fixed")],
+                                point_loads=[(self.length, self.load)], n_elements=100)
+
+        expected_deflection = self.load * 1000 * self.length**3 / (3 * self.E * self.I)
+        self.assertAlmostEqual(results["moment_distribution"][0], -self.load * self.length, places=6)
+        self.assertAlmostEqual(results["max_deflection"], expected_deflection, places=9)
+        self.assertTrue(np.allclose(results["shear_distribution"], self.load))
+
+    def test_fixed_fixed_uniform_load(self):
+        """İki ucu ankastre kirişte mesnet ve açıklık momentlerini test et"""
+        results = solve_beam_fe(self.length, self.E, self.I,
+                                [(0.0, "fixed"), (self.length, "fixed")],
+                                distributed_load=self.load, n_elements=400)
+        moment = results["moment_distribution"]
+
+        self.assertAlmostEqual(moment[0], -self.load * self.length**2 / 12, places=3)
+        self.assertAlmostEqual(moment[200], self.load * self.length**2 / 24, places=3)
+
+    def test_continuous_beam_reactions(self):
+        """İki açıklıklı sürekli kirişte orta mesnet tepkisini test et"""
+        results = solve_beam_fe(self.length, self.E, self.I,
+                                self.simple + [(self.length / 2, "pinned")],
+                                distributed_load=self.load, n_elements=400)
+        reactions = dict(results["reactions"])
+
+        # Orta mesnet tepkisi 10qL/8 (L: açıklık boyu)
+        span = self.length / 2
+        self.assertAlmostEqual(reactions[span], 10 * self.load * span / 8, places=2)
+        self.assertAlmostEqual(sum(reactions.values()), self.load * self.length, places=6)
+
+    def test_fast_path_matches_solver(self):
+        """Kapalı form hızlı yolun sonlu eleman çözümüyle uyumunu test et"""
+        for load_type in ["Tekil Yük", "Düzgün Yayılı Yük"]:
+            closed = calculate_beam_analysis_fe(self.length, self.load, 30, 50, "C25", load_type)
+            # Bitiş yüksekliği verildiğinde hızlı yol devre dışı kalır
+            fe = calculate_beam_analysis_fe(self.length, self.load, 30, 50, "C25", load_type,
+                                            height_end=50.0 + 1e-9)
+
+            self.assertEqual(closed["method"], "closed_form")
+            self.assertEqual(fe["method"], "fe")
+            self.assertAlmostEqual(closed["moment"], fe["moment"], places=6)
+            self.assertAlmostEqual(closed["max_deflection"] / fe["max_deflection"], 1.0, places=4)
+            self.assertTrue(np.allclose(closed["moment_distribution"], fe["moment_distribution"]))
+            self.assertTrue(np.allclose(closed["shear_distribution"], fe["shear_distribution"]))
+
+    def test_haunched_beam(self):
+        """Değişken kesitli kirişte sehimin sınır değerler arasında kalmasını test et"""
+        shallow = calculate_beam_analysis_fe(self.length, self.load, 30, 40, "C25", "Düzgün Yayılı Yük",
+                                             supports=[(0.0, "fixed")], height_end=40.0 + 1e-9)
+        deep = calculate_beam_analysis_fe(self.length, self.load, 30, 60, "C25", "Düzgün Yayılı Yük",
+                                          supports=[(0.0, "fixed")], height_end=60.0 + 1e-9)
+        haunched = calculate_beam_analysis_fe(self.length, self.load, 30, 60, "C25", "Düzgün Yayılı Yük",
+                                              supports=[(0.0, "fixed")], height_end=40.0)
+
+        self.assertGreater(haunched["max_deflection"], deep["max_deflection"])
+        self.assertLess(haunched["max_deflection"], shallow["max_deflection"])
+
+    def test_large_model_performance(self):
+        """10⁵ elemanlı modelin bir saniyenin altında çözülmesini test et"""
+        start_time = time.time()
+        results = solve_beam_fe(self.length, self.E, self.I, self.simple,
+                                distributed_load=self.load, n_elements=100000)
+        elapsed_time = time.time() - start_time
+
+        expected = 5 * self.load * 1000 * self.length**4 / (384 * self.E * self.I)
+        self.assertAlmostEqual(results["max_deflection"] / expected, 1.0, places=6)
+        self.assertLess(elapsed_time, 1.0)
+
+    def test_invalid_supports(self):
+        """Yetersiz ve geçersiz mesnet tanımları için hata kontrolü"""
+        with self.assertRaises(ValueError):
+            solve_beam_fe(self.length, self.E, self.I, [(0.0, "pinned")], distributed_load=self.load)
+        with self.assertRaises(ValueError):
+            solve_beam_fe(self.length, self.E, self.I, [(0.0, "roller")], distributed_load=self.load)
+        with self.assertRaises(ValueError):
+            solve_beam_fe(self.length, self.E, self.I, [(0.0, "pinned"), (3.0, "fixed")],
+                          distributed_load=self.load)
+
+if __name__ == '__main__':
+    unittest.main()
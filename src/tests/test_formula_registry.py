@@ -0,0 +1,110 @@
+import unittest
+import numpy as np
+from src.core.calculations.formula_registry import (
+    FORMULA_REGISTRY, SUPPORT_CONDITIONS, LOAD_TYPES, get_beam_kernel
+)
+from src.core.calculations.beam_calculation import calculate_beam_analysis, calculate_beam_batch
+from src.core.calculations.finite_element import solve_beam_fe
+
+# Sonlu eleman modelindeki mesnet tanımları (kiriş boyu L için)
+FE_SUPPORTS = {
+    "Konsol": lambda L: [(0.0, "fixed")],
+    "İki Ucu Ankastre": lambda L: [(0.0, "fixed"), (L, "fixed")],
+    "Ankastre-Mafsallı": lambda L: [(0.0, "fixed"), (L, "pinned")],
+}
+
+class TestFormulaRegistry(unittest.TestCase):
+    """Mesnet koşulu / yük tipi çekirdeklerini test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.length = 5.0  # m
+        self.load = 10.0  # kN veya kN/m
+        self.E = 30e9  # N/m²
+        self.I = 0.30 * 0.50**3 / 12  # m⁴
+
+    def solve_fe(self, support_condition, load_type, n_elements=1000):
+        """Aynı kirişi sonlu eleman çözücüsüyle hesapla"""
+        supports = FE_SUPPORTS[support_condition](self.length)
+        if load_type == "Tekil Yük":
+            position = self.length if support_condition == "Konsol" else self.length / 2
+            return solve_beam_fe(self.length, self.E, self.I, supports,
+                                 point_loads=[(position, self.load)], n_elements=n_elements)
+        if load_type == "Üçgen Yayılı Yük":
+            q_nodes = self.load * np.linspace(0, 1, n_elements + 1)
+            return solve_beam_fe(self.length, self.E, self.I, supports,
+                                 distributed_load=q_nodes, n_elements=n_elements)
+        return solve_beam_fe(self.length, self.E, self.I, supports,
+                             distributed_load=self.load, n_elements=n_elements)
+
+    def test_registry_is_complete(self):
+        """Tüm mesnet koşulu ve yük tipi birleşimlerinin tanımlı olmasını test et"""
+        for support_condition in SUPPORT_CONDITIONS:
+            for load_type in LOAD_TYPES:
+                self.assertIn((support_condition, load_type), FORMULA_REGISTRY)
+
+    def test_fixed_end_kernels_match_finite_element(self):
+        """Ankastre uçlu çekirdeklerin sonlu eleman çözümüyle uyumunu test et"""
+        for support_condition in FE_SUPPORTS:
+            for load_type in LOAD_TYPES:
+                with self.subTest(support=support_condition, load_type=load_type):
+                    kernel = get_beam_kernel(support_condition, load_type)
+                    fe = self.solve_fe(support_condition, load_type)
+                    x = fe["x_values"]
+
+                    self.assertAlmostEqual(kernel["moment"](self.load, self.length) / fe["moment"], 1.0, places=4)
+                    self.assertAlmostEqual(kernel["deflection"](self.load, self.length, self.E, self.I)
+                                           / fe["max_deflection"], 1.0, places=4)
+                    self.assertTrue(np.allclose(kernel["moment_distribution"](self.load, self.length, x),
+                                                fe["moment_distribution"], atol=1e-4))
+                    self.assertTrue(np.allclose(
+                        kernel["deflection_distribution"](self.load, self.length, self.E, self.I, x),
+                        fe["deflection_distribution"], rtol=1e-4, atol=1e-9))
+
+    def test_known_closed_forms(self):
+        """Bilinen kapalı form maksimum değerleri test et"""
+        q, L = self.load, self.length
+        cantilever = get_beam_kernel("Konsol", "Düzgün Yayılı Yük")
+        self.assertAlmostEqual(cantilever["moment"](q, L), q * L**2 / 2, places=6)
+        self.assertAlmostEqual(cantilever["deflection"](q, L, self.E, self.I),
+                               q * 1000 * L**4 / (8 * self.E * self.I), places=9)
+
+        fixed = get_beam_kernel("İki Ucu Ankastre", "Tekil Yük")
+        self.assertAlmostEqual(fixed["moment"](q, L), q * L / 8, places=6)
+        self.assertAlmostEqual(fixed["deflection"](q, L, self.E, self.I),
+                               q * 1000 * L**3 / (192 * self.E * self.I), places=9)
+
+    def test_batch_matches_single_analysis(self):
+        """Gruplu toplu hesabın tek tek analizle aynı sonucu vermesini test et"""
+        scenarios = []
+        for i, support_condition in enumerate(SUPPORT_CONDITIONS):
+            for j, load_type in enumerate(LOAD_TYPES):
+                scenarios.append({
+                    "length": 4.0 + i, "load": 10.0 + 5 * j, "width": 30.0, "height": 50.0 + 5 * i,
+                    "concrete_class": ["C25", "C30"][j % 2], "load_type": load_type,
+                    "support_condition": support_condition, "with_reinforcement": True
+                })
+
+        batch = calculate_beam_batch(scenarios)
+        for scenario, result in zip(scenarios, batch):
+            single = calculate_beam_analysis(
+                scenario["length"], scenario["load"], scenario["width"], scenario["height"],
+                scenario["concrete_class"], scenario["load_type"], True, scenario["support_condition"])
+
+            self.assertEqual(result["support_condition"], scenario["support_condition"])
+            self.assertAlmostEqual(result["moment"], single["moment"], places=9)
+            self.assertAlmostEqual(result["max_deflection"], single["max_deflection"], places=12)
+            self.assertTrue(np.allclose(result["moment_distribution"], single["moment_distribution"]))
+            self.assertTrue(np.allclose(result["deflection_distribution"], single["deflection_distribution"]))
+            self.assertAlmostEqual(result["reinforcement"]["required_area"],
+                                   single["reinforcement"]["required_area"], places=9)
+
+    def test_invalid_keys(self):
+        """Tanımsız mesnet koşulu veya yük tipi için hata kontrolü"""
+        with self.assertRaises(ValueError):
+            get_beam_kernel("Basit Mesnetli", "Geçersiz Yük Tipi")
+        with self.assertRaises(ValueError):
+            get_beam_kernel("Serbest", "Tekil Yük")
+
+if __name__ == '__main__':
+    unittest.main()
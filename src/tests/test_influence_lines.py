@@ -0,0 +1,72 @@
+import unittest
+import numpy as np
+from src.core.calculations.influence_lines import (
+    calculate_influence_lines, calculate_moving_load_envelope
+)
+
+class TestInfluenceLines(unittest.TestCase):
+    """Tesir çizgisi ve hareketli yük zarfı fonksiyonlarını test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.length = 10.0  # m
+        self.n_points = 101
+        self.axles = [(0.0, 100.0), (1.2, 100.0), (4.0, 60.0)]  # (konum, yük)
+
+    def brute_force_moments(self, axles, positions):
+        """Her araç konumu için kesit momentlerini doğrudan hesapla"""
+        x = np.linspace(0, self.length, self.n_points)
+        moments = np.zeros((len(x), len(positions)))
+        for k, lead in enumerate(positions):
+            for offset, P in axles:
+                a = lead - offset
+                if 0 <= a <= self.length:
+                    moments[:, k] += np.where(a <= x, P * a * (self.length - x),
+                                              P * x * (self.length - a)) / self.length
+        return moments
+
+    def test_influence_line_values(self):
+        """Orta kesit tesir çizgisinin tepe değerini test et"""
+        lines = calculate_influence_lines(self.length, self.n_points)
+        mid = self.n_points // 2
+
+        # Orta kesit için tesir çizgisi tepe değeri L/4
+        self.assertAlmostEqual(np.max(lines["moment"][mid]), self.length / 4, places=6)
+        # Mesnet kesitlerinde moment tesiri sıfır
+        self.assertTrue(np.allclose(lines["moment"][0], 0))
+        self.assertTrue(np.allclose(lines["moment"][-1], 0))
+
+    def test_single_axle(self):
+        """Tek aks için zarfın P*L/4 değerini vermesini test et"""
+        result = calculate_moving_load_envelope([(0.0, 50.0)], self.length, n_points=self.n_points)
+        self.assertAlmostEqual(result["moment"], 50.0 * self.length / 4, places=6)
+        self.assertAlmostEqual(result["moment_section"], self.length / 2, places=6)
+        self.assertAlmostEqual(result["shear"], 50.0, places=6)
+
+    def test_matches_brute_force(self):
+        """Zarfın doğrudan hesaplanan tepkilerle aynı olmasını test et"""
+        result = calculate_moving_load_envelope(self.axles, self.length, n_points=self.n_points)
+        expected = self.brute_force_moments(self.axles, result["positions"])
+
+        self.assertTrue(np.allclose(result["moment_envelope_max"], expected.max(axis=1)))
+
+    def test_fft_matches_direct(self):
+        """FFT ve doğrudan yöntemin aynı sonucu vermesini test et"""
+        lines = calculate_influence_lines(self.length, self.n_points)
+        direct = calculate_moving_load_envelope(self.axles, self.length, lines, fft_threshold=1000)
+        fft = calculate_moving_load_envelope(self.axles, self.length, lines, fft_threshold=1)
+
+        self.assertEqual(fft["method"], "fft")
+        self.assertTrue(np.allclose(direct["moment_envelope_max"], fft["moment_envelope_max"]))
+        self.assertTrue(np.allclose(direct["shear_envelope_min"], fft["shear_envelope_min"]))
+        self.assertAlmostEqual(direct["moment_position"], fft["moment_position"], places=6)
+
+    def test_invalid_axles(self):
+        """Geçersiz aks tanımları için hata kontrolü"""
+        with self.assertRaises(ValueError):
+            calculate_moving_load_envelope([], self.length)
+        with self.assertRaises(ValueError):
+            calculate_moving_load_envelope([(-1.0, 10.0)], self.length)
+
+if __name__ == '__main__':
+    unittest.main()
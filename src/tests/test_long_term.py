@@ -0,0 +1,71 @@
+import unittest
+import numpy as np
+from src.core.calculations.long_term import (
+    calculate_creep_coefficient, calculate_shrinkage_strain, calculate_long_term_deflection
+)
+from src.core.calculations.cracked_section import calculate_cracked_deflection
+
+class TestLongTerm(unittest.TestCase):
+    """Sünme ve rötre etkili uzun süreli sehim hesabını test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.times = np.array([28, 365, 18250])  # 28 gün, 1 yıl, 50 yıl
+        self.lengths = np.array([5.0, 6.0, 7.0])
+        self.loads = np.array([20.0, 25.0, 15.0])
+        self.classes = ["C25", "C30", "C40"]
+
+    def test_creep_coefficient_final_value(self):
+        """Sonsuz zamanda sünme katsayısının φ0 değerine yaklaşmasını test et"""
+        h0, fck, RH, t0 = 150.0, 25.0, 50.0, 28
+        fcm = fck + 8
+        phi_0 = (1 + (1 - RH / 100) / (0.1 * h0**(1/3))) * 16.8 / np.sqrt(fcm) / (0.1 + t0**0.2)
+
+        phi = calculate_creep_coefficient(np.array([t0, 1e12]), t0, h0, fck, RH)
+        self.assertEqual(phi[0], 0)
+        self.assertAlmostEqual(phi[1], phi_0, places=3)
+
+    def test_shrinkage_increases_with_time(self):
+        """Rötrenin zamanla artmasını ve kuru ortamda daha büyük olmasını test et"""
+        times = np.array([7, 28, 365, 18250])
+        humid = calculate_shrinkage_strain(times, 7, 150.0, 30.0, relative_humidity=80)
+        dry = calculate_shrinkage_strain(times, 7, 150.0, 30.0, relative_humidity=50)
+
+        self.assertTrue(np.all(np.diff(dry) > 0))
+        # Kuruma başladıktan sonra kuru ortamdaki rötre daha büyüktür
+        self.assertEqual(dry[0], humid[0])
+        self.assertTrue(np.all(dry[1:] > humid[1:]))
+
+    def test_deflection_matrix(self):
+        """Kiriş × zaman sehim matrisini test et"""
+        results = calculate_long_term_deflection(self.lengths, self.loads, 30, 50, self.classes,
+                                                 self.times, load_type="Düzgün Yayılı Yük")
+        immediate = calculate_cracked_deflection(self.lengths, self.loads, 30, 50, self.classes,
+                                                 "Düzgün Yayılı Yük")["max_deflection"]
+
+        self.assertEqual(results["deflection"].shape, (3, 3))
+        self.assertTrue(np.allclose(results["immediate_deflection"], immediate))
+        # Yükleme anında sünme yok, sonrasında sehim artar
+        self.assertTrue(np.allclose(results["creep_deflection"][:, 0], immediate))
+        self.assertTrue(np.all(np.diff(results["deflection"], axis=1) > 0))
+        self.assertTrue(np.all(results["long_term_multiplier"] >= 1))
+
+    def test_batch_matches_single_beam(self):
+        """Toplu hesabın tek kiriş hesaplarıyla aynı olmasını test et"""
+        batch = calculate_long_term_deflection(self.lengths, self.loads, 30, 50, self.classes,
+                                               self.times, load_type="Düzgün Yayılı Yük")
+        for i in range(len(self.lengths)):
+            single = calculate_long_term_deflection(self.lengths[i], self.loads[i], 30, 50, self.classes[i],
+                                                    self.times, load_type="Düzgün Yayılı Yük")
+            self.assertTrue(np.allclose(batch["deflection"][i], single["deflection"][0]))
+
+    def test_support_conditions(self):
+        """İki ucu ankastre kirişte rötre sehiminin sıfır olmasını test et"""
+        fixed = calculate_long_term_deflection(5.0, 20.0, 30, 50, "C25", self.times,
+                                               "Düzgün Yayılı Yük", "İki Ucu Ankastre")
+        self.assertTrue(np.allclose(fixed["shrinkage_deflection"], 0))
+        with self.assertRaises(ValueError):
+            calculate_long_term_deflection(5.0, 20.0, 30, 50, "C25", self.times, support_condition="Serbest")
+
+if __name__ == '__main__':
+    unittest.main()
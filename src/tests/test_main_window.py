@@ -0,0 +1,226 @@
+import unittest
+import numpy as np
+from PyQt6.QtWidgets import QApplication
+import sys
+import time
+import os
+import tempfile
+from src.app.ui.main_window import MainWindow, CalculationWorker, GRAPH_PANELS, CALCULATION_CACHE_SIZE
+from src.core.calculations.beam_calculation import calculate_beam_analysis
+
+class TestMainWindow(unittest.TestCase):
+    """Ana pencere grafik güncellemesi testleri"""
+
+    @classmethod
+    def setUpClass(cls):
+        # PyQt uygulaması başlat
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication(sys.argv)
+
+    def wait_for(self, condition, timeout=5.0):
+        """Koşul sağlanana kadar olay döngüsünü işletir"""
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            self.app.processEvents()
+            time.sleep(0.005)
+        return condition()
+
+    def params(self, load):
+        """Canlı hesap için örnek parametreler"""
+        return {"length": 5.0, "load": load, "width": 30.0, "height": 50.0, "concrete_class": "C25",
+                "load_type": "Düzgün Yayılı Yük", "support_condition": "Basit Mesnetli",
+                "with_reinforcement": False}
+
+    def test_graphs_are_reused(self):
+        """Eksen ve çizgilerin yeniden oluşturulmadan güncellendiği testi"""
+        window = MainWindow()
+        results = calculate_beam_analysis(5.0, 20.0, 30, 50, "C25", "Düzgün Yayılı Yük")
+        window.draw_graphs(results)
+        window.canvas.draw()
+
+        axes, lines = list(window.graph_axes), list(window.graph_lines)
+        self.assertEqual(len(axes), len(GRAPH_PANELS))
+        self.assertIsNotNone(window.graph_background)
+        self.assertTrue(np.allclose(lines[0].get_ydata(), results["moment_distribution"]))
+        self.assertTrue(np.allclose(lines[2].get_ydata(), np.asarray(results["deflection_distribution"]) * 1000))
+
+        # Benzer sonuçta sınırlar korunur, çizgiler blit ile güncellenir
+        limits = [ax.get_ylim() for ax in axes]
+        similar = calculate_beam_analysis(5.0, 21.0, 30, 50, "C25", "Düzgün Yayılı Yük")
+        window.draw_graphs(similar)
+        self.assertEqual(window.graph_axes, axes)
+        self.assertEqual(window.graph_lines, lines)
+        self.assertEqual([ax.get_ylim() for ax in axes], limits)
+        self.assertTrue(np.allclose(lines[0].get_ydata(), similar["moment_distribution"]))
+
+        # Aralık dışına taşan sonuç sınırları yeniden ölçekler
+        larger = calculate_beam_analysis(5.0, 60.0, 30, 50, "C25", "Düzgün Yayılı Yük")
+        window.draw_graphs(larger)
+        self.assertGreaterEqual(axes[0].get_ylim()[1], np.max(larger["moment_distribution"]))
+
+        # Sıfırlama kalıcı eksenleri bırakır
+        window.reset()
+        self.assertIsNone(window.graph_lines)
+        self.assertEqual(window.figure.get_axes(), [])
+
+    def test_savefig_keeps_blit_background(self):
+        """Araç çubuğu kaydının (SVG/PDF/yüksek dpi PNG) blit arka planını bozmadığı testi"""
+        window = MainWindow()
+        window.draw_graphs(calculate_beam_analysis(5.0, 20.0, 30, 50, "C25", "Düzgün Yayılı Yük"))
+        window.canvas.draw()
+        background = window.graph_background
+
+        directory = tempfile.mkdtemp()
+        for name, dpi in (("a.svg", 100), ("a.pdf", 100), ("a.png", 300)):
+            window.figure.savefig(os.path.join(directory, name), dpi=dpi)
+            self.assertIs(window.graph_background, background)
+        self.assertGreater(os.path.getsize(os.path.join(directory, "a.svg")), 0)
+
+    def test_calc_worker_keeps_latest(self):
+        """Bekleyen isteklerin en sonuncusuyla birleştirildiği testi"""
+        worker = CalculationWorker()
+        received = []
+        worker.calculation_complete.connect(received.append)
+        request_ids = [worker.submit(self.params(load)) for load in (10.0, 20.0, 30.0)]
+        self.assertEqual(request_ids, [1, 2, 3])
+
+        worker.start()
+        try:
+            self.assertTrue(self.wait_for(lambda: received))
+            self.assertEqual(len(received), 1)
+            self.assertEqual(received[0]["request_id"], 3)
+            self.assertEqual(received[0]["load"], 30.0)
+
+            # Aynı iş parçacığı sonraki istekleri de işler
+            reinforced = dict(self.params(40.0), with_reinforcement=True)
+            worker.submit(reinforced)
+            self.assertTrue(self.wait_for(lambda: len(received) == 2))
+            self.assertEqual(received[1]["request_id"], 4)
+
+            # Aynı parametreler önbellekten döner, sonuç ve dizileri paylaşılmaz
+            worker.submit(reinforced)
+            self.assertTrue(self.wait_for(lambda: len(received) == 3))
+            self.assertIsNot(received[2], received[1])
+            self.assertIsNot(received[2]["moment_distribution"], received[1]["moment_distribution"])
+            self.assertTrue(np.array_equal(received[2]["moment_distribution"], received[1]["moment_distribution"]))
+            self.assertEqual(received[1]["request_id"], 4)
+            self.assertEqual(received[2]["request_id"], 5)
+            self.assertEqual(len(worker.result_cache), 2)
+
+            # Önbellek sonucu işaretlenir ve süresi arama süresidir
+            self.assertNotIn("cached", received[1])
+            self.assertTrue(received[2]["cached"])
+            self.assertLess(received[2]["elapsed_time"], 0.1)
+
+            # Dönen sonucu değiştirmek sonraki önbellek sonucunu etkilemez
+            received[2]["moment_distribution"][:] = 0.0
+            received[2]["reinforcement"]["options"].clear()
+            worker.submit(reinforced)
+            self.assertTrue(self.wait_for(lambda: len(received) == 4))
+            self.assertTrue(np.array_equal(received[3]["moment_distribution"], received[1]["moment_distribution"]))
+            self.assertEqual(len(received[3]["reinforcement"]["options"]), len(received[1]["reinforcement"]["options"]))
+            self.assertGreater(len(received[3]["reinforcement"]["options"]), 0)
+        finally:
+            worker.stop()
+        self.assertTrue(worker.isFinished())
+
+    def test_live_mode(self):
+        """Canlı modda girişlerin ertelenerek hesaplandığı testi"""
+        window = MainWindow()
+        window.length_input.setText("5")
+        window.load_input.setText("20")
+        window.width_input.setText("30")
+        self.assertFalse(window.live_timer.isActive())
+
+        window.live_check.setChecked(True)
+        window.height_input.setText("50")
+        self.assertTrue(window.live_timer.isActive())
+        self.assertTrue(self.wait_for(lambda: window.graph_lines is not None))
+        self.assertIn("Maksimum Moment", window.result_label.toPlainText())
+        worker = window.calc_worker
+
+        # Hızlı düzenlemeler tek iş parçacığında, son değerle hesaplanır
+        for load in ("21", "22", "23"):
+            window.load_input.setText(load)
+        self.assertTrue(self.wait_for(lambda: "Yük: 23.0 kN" in window.result_label.toPlainText()))
+        self.assertIs(window.calc_worker, worker)
+
+        # 3D görünüm sekme açılınca güncellenir
+        self.assertIsNotNone(window.pending_3d_results)
+        window.result_tabs.setCurrentWidget(window.visualization_3d)
+        self.assertIsNone(window.pending_3d_results)
+        self.assertEqual(window.visualization_3d.beam_data["length"], 5.0)
+
+        # Geçersiz girişte hesap gönderilmez
+        window.load_input.setText("abc")
+        self.assertIsNone(window.read_live_params())
+        window.close()
+        self.assertIsNone(window.calc_worker)
+
+    def test_calculate_uses_persistent_worker(self):
+        """Hesap düğmesinin kalıcı iş parçacığını kullandığı ve bayat isteklerin atıldığı testi"""
+        window = MainWindow()
+        window.save_results_to_csv = lambda results: None
+        window.show_reinforcement_table.setChecked(False)
+        for line_edit, text in zip((window.length_input, window.load_input, window.width_input,
+                                    window.height_input), ("5", "20", "30", "50")):
+            line_edit.setText(text)
+
+        window.calculate()
+        worker = window.calc_worker
+        self.assertIsNotNone(worker)
+        self.assertTrue(self.wait_for(lambda: "Yük: 20.0 kN" in window.result_label.toPlainText()))
+        self.assertFalse(window.progress_bar.isVisible())
+
+        # Art arda tıklamalar aynı iş parçacığında, son istekle sonuçlanır
+        window.load_input.setText("25")
+        window.calculate()
+        window.load_input.setText("30")
+        window.calculate()
+        self.assertIs(window.calc_worker, worker)
+        self.assertTrue(self.wait_for(lambda: "Yük: 30.0 kN" in window.result_label.toPlainText()))
+
+        # Bayat kimlikli sonuç gösterilmez
+        stale = dict(calculate_beam_analysis(5.0, 99.0, 30, 50, "C25", "Tekil Yük"),
+                     request_id=window.request_id - 1, load=99.0)
+        window.on_worker_result(stale)
+        self.assertNotIn("Yük: 99.0 kN", window.result_label.toPlainText())
+        self.assertLessEqual(len(worker.result_cache), CALCULATION_CACHE_SIZE)
+        window.close()
+        self.assertTrue(worker.isFinished())
+
+    def test_save_graphs_in_background(self):
+        """Grafiklerin arayüz iş parçacığı dışında sonuç verisinden kaydedildiği testi"""
+        window = MainWindow()
+        window.graph_path = tempfile.mkdtemp()
+        window.save_graphs()
+        self.assertIsNone(window.export_thread)
+        self.assertIn("Kaydedilecek grafik yok", window.result_label.toPlainText())
+
+        results = dict(calculate_beam_analysis(5.0, 20.0, 30, 50, "C25", "Düzgün Yayılı Yük"),
+                       length=5.0, load=20.0, width=30.0, height=50.0, concrete_class="C25")
+        window.show_results(results, update_3d=False)
+        window.save_graphs()
+        self.assertTrue(self.wait_for(lambda: "Grafikler kaydedildi" in window.result_label.toPlainText(), 30))
+        files = sorted(os.listdir(window.graph_path))
+        self.assertEqual([os.path.splitext(name)[1] for name in files], [".png", ".svg"])
+        window.close()
+
+    def test_close_cancels_export(self):
+        """Pencere kapanırken süren toplu dışa aktarmanın iptal edildiği testi"""
+        window = MainWindow()
+        directory = tempfile.mkdtemp()
+        results = dict(calculate_beam_analysis(5.0, 20.0, 30, 50, "C25", "Düzgün Yayılı Yük"),
+                       length=5.0, load=20.0, width=30.0, height=50.0, concrete_class="C25")
+        window.start_figure_export([results] * 60, directory, "scenario", max_workers=1)
+        self.assertTrue(self.wait_for(lambda: os.listdir(directory), 30))
+
+        start = time.time()
+        window.close()
+        self.assertTrue(window.export_thread.isFinished())
+        self.assertLess(time.time() - start, 5.0)
+        self.assertLess(len(os.listdir(directory)), 60)
+
+if __name__ == '__main__':
+    unittest.main()
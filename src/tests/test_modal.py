@@ -0,0 +1,97 @@
+import unittest
+import numpy as np
+from src.core.calculations.modal import calculate_modal_analysis, solve_modal_fe
+from src.core.calculations.beam_calculation import calculate_elasticity_modulus
+
+class TestModalAnalysis(unittest.TestCase):
+    """Doğal frekans ve mod şekli hesaplarını test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.length = 6.0  # m
+        self.width = 30  # cm
+        self.height = 50  # cm
+        self.concrete_class = "C25"
+        self.support_conditions = ("Basit Mesnetli", "Konsol", "İki Ucu Ankastre", "Ankastre-Mafsallı")
+
+    def test_simply_supported_frequency(self):
+        """Basit mesnetli kirişin ilk frekansını el hesabıyla karşılaştır"""
+        result = calculate_modal_analysis(self.length, self.width, self.height, self.concrete_class)
+
+        E = calculate_elasticity_modulus(self.concrete_class)
+        I = 0.30 * 0.50**3 / 12
+        m = 2500 * 0.30 * 0.50
+        f1 = np.pi / (2 * self.length**2) * np.sqrt(E * I / m)
+
+        self.assertAlmostEqual(result["frequencies"][0, 0], f1, places=9)
+        # f_n = n²·f_1
+        self.assertTrue(np.allclose(result["frequencies"][0], f1 * np.array([1, 4, 9])))
+        self.assertTrue(np.allclose(result["periods"], 1 / result["frequencies"]))
+
+    def test_known_frequency_parameters(self):
+        """Mesnet koşullarına ait βL köklerini test et"""
+        expected = {"Konsol": 1.87510, "İki Ucu Ankastre": 4.73004, "Ankastre-Mafsallı": 3.92660}
+        for support_condition, beta_L in expected.items():
+            with self.subTest(support_condition=support_condition):
+                result = calculate_modal_analysis(self.length, self.width, self.height, self.concrete_class,
+                                                  support_condition, n_modes=1)
+                self.assertAlmostEqual(np.sqrt(result["frequency_parameters"][0]), beta_L, places=5)
+
+    def test_fe_matches_closed_form(self):
+        """Toplanmış kütleli sonlu eleman çözümünü kapalı formla karşılaştır"""
+        for support_condition in self.support_conditions:
+            with self.subTest(support_condition=support_condition):
+                closed = calculate_modal_analysis(self.length, self.width, self.height, self.concrete_class,
+                                                  support_condition, n_modes=4, n_points=101)
+                fe = calculate_modal_analysis(self.length, self.width, self.height, self.concrete_class,
+                                              support_condition, n_modes=4, method="fe", n_elements=100)
+                self.assertTrue(np.allclose(fe["frequencies"], closed["frequencies"], rtol=1e-3))
+                self.assertTrue(np.allclose(fe["mode_shapes"], closed["mode_shapes"], atol=5e-3))
+
+    def test_batch_matches_scalar(self):
+        """Vektörel hesabın tekil hesaplarla aynı sonucu verdiğini test et"""
+        lengths = np.array([4.0, 6.0, 8.0])
+        widths = np.array([25, 30, 35])
+        classes = ["C20", "C25", "C30"]
+        batch = calculate_modal_analysis(lengths, widths, self.height, classes, "Konsol")
+
+        for i in range(3):
+            single = calculate_modal_analysis(lengths[i], widths[i], self.height, classes[i], "Konsol")
+            self.assertTrue(np.allclose(batch["frequencies"][i], single["frequencies"][0]))
+
+    def test_variable_section_and_validation(self):
+        """Değişken kesitli kiriş çözümünü ve hatalı girdileri test et"""
+        E = calculate_elasticity_modulus(self.concrete_class)
+        t = (np.arange(100) + 0.5) / 100
+        h = 0.60 - 0.20 * t
+        result = solve_modal_fe(self.length, E, 0.30 * h**3 / 12, 2500 * 0.30 * h,
+                                [(0.0, "pinned"), (self.length, "pinned")], n_modes=2)
+
+        uniform = calculate_modal_analysis(self.length, self.width, [40, 60], self.concrete_class, n_modes=2)
+        f = uniform["frequencies"][:, 0]
+        self.assertTrue(f[0] < result["frequencies"][0] < f[1])
+        self.assertTrue(np.all(np.diff(result["frequencies"]) > 0))
+
+        with self.assertRaises(ValueError):
+            calculate_modal_analysis(self.length, self.width, self.height, self.concrete_class, "Geçersiz")
+        with self.assertRaises(ValueError):
+            calculate_modal_analysis(self.length, self.width, self.height, self.concrete_class, method="Geçersiz")
+
+    def test_results_do_not_share_cache(self):
+        """Sonuç dizilerini değiştirmenin önbelleği ve sonraki çağrıları etkilemediğini test et"""
+        for method in ("closed_form", "fe"):
+            with self.subTest(method=method):
+                first = calculate_modal_analysis(5.0, self.width, self.height, self.concrete_class,
+                                                 method=method, n_elements=50)
+                expected = {key: first[key].copy() for key in ("mode_shapes", "x_ratios", "frequency_parameters")}
+                for key in expected:
+                    first[key][...] = 0.0
+
+                second = calculate_modal_analysis(5.0, self.width, self.height, self.concrete_class,
+                                                  method=method, n_elements=50)
+                for key, values in expected.items():
+                    self.assertIsNot(second[key], first[key])
+                    self.assertTrue(np.array_equal(second[key], values))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import numpy as np
+from src.core.calculations.quantity_takeoff import calculate_quantity_takeoff
+from src.core.calculations.bar_schedule import calculate_bar_length
+from src.core.calculations.beam_calculation import calculate_beam_analysis
+from src.core.calculations.shear_design import calculate_stirrup_positions
+
+class TestQuantityTakeoff(unittest.TestCase):
+    """Akış halinde metraj hesabını test eden sınıf"""
+
+    def scenarios(self, count):
+        """Kat ve beton sınıfı dönüşümlü senaryo üreteci"""
+        for index in range(count):
+            yield {"length": 4.0 + index % 3, "load": 20.0, "width": 30, "height": 50,
+                   "concrete_class": ("C25", "C30")[index % 2], "floor": f"K{index % 4}",
+                   "load_type": "Düzgün Yayılı Yük"}
+
+    def test_concrete_and_formwork(self):
+        """Beton hacmi ve kalıp alanı gruplarını el hesabıyla karşılaştır"""
+        takeoff = calculate_quantity_takeoff(self.scenarios(120), chunk_size=25)
+        items = list(self.scenarios(120))
+
+        self.assertEqual(takeoff["floors"], ["K0", "K1", "K2", "K3"])
+        self.assertEqual(takeoff["beam_count"].sum(), 120)
+        for i, floor in enumerate(takeoff["floors"]):
+            for j, concrete_class in enumerate(takeoff["concrete_classes"]):
+                group = [item for item in items if item["floor"] == floor and item["concrete_class"] == concrete_class]
+                self.assertEqual(takeoff["beam_count"][i, j], len(group))
+                self.assertAlmostEqual(takeoff["concrete_volume"][i, j], sum(0.3 * 0.5 * item["length"] for item in group))
+                self.assertAlmostEqual(takeoff["formwork_area"][i, j], sum(1.3 * item["length"] for item in group))
+
+        # Parça boyundan bağımsız sonuç
+        single = calculate_quantity_takeoff(self.scenarios(120), chunk_size=1000)
+        self.assertTrue(np.allclose(single["concrete_volume"], takeoff["concrete_volume"]))
+        self.assertEqual(takeoff["totals"]["steel_weight"], 0.0)
+
+    def test_steel_weight(self):
+        """Donatı ağırlığının seçilen donatı ve etriyelerden hesaplandığını test et"""
+        result = calculate_beam_analysis(5.0, 20.0, 30, 50, "C25", "Düzgün Yayılı Yük", with_reinforcement=True)
+        result.update({"length": 5.0, "width": 30, "height": 50, "concrete_class": "C25"})
+        option = result["reinforcement"]["options"][0]
+        stirrups = result["reinforcement"]["stirrups"]
+
+        takeoff = calculate_quantity_takeoff(iter([result]))
+        unit_weight = lambda diameter: np.pi * (diameter / 1000)**2 / 4 * 7850
+        longitudinal = option["count"] * calculate_bar_length(5.0, option["diameter"]) * unit_weight(option["diameter"])
+        self.assertIn(option["diameter"], takeoff["diameters"])
+        self.assertGreater(takeoff["totals"]["steel_weight"], longitudinal)
+
+        # Her etriye kendi çapıyla: mesnetlere dense_length'ten yakın olanlar sıklaştırma çapında
+        self.assertEqual(len(stirrups["positions"]), stirrups["count"])
+        expected = {option["diameter"]: longitudinal}
+        for position in stirrups["positions"]:
+            dense = min(position, 5.0 - position) < stirrups["dense_length"] - 1e-9
+            diameter = stirrups["dense_diameter"] if dense else stirrups["normal_diameter"]
+            stirrup_length = 2 * (0.3 + 0.5) - 8 * 0.05 + 20 * diameter / 1000
+            expected[diameter] = expected.get(diameter, 0.0) + stirrup_length * unit_weight(diameter)
+
+        by_diameter = takeoff["totals"]["steel_weight_by_diameter"]
+        self.assertEqual(set(by_diameter), set(expected))
+        for diameter, weight in expected.items():
+            self.assertAlmostEqual(by_diameter[diameter], weight)
+        self.assertAlmostEqual(takeoff["totals"]["steel_weight"], sum(expected.values()))
+
+    def test_stirrup_diameters(self):
+        """Farklı çaplı etriyelerin üretildikleri bölgeye göre sayıldığını test et"""
+        stirrups = {"dense_length": 1.0, "dense_diameter": 10, "dense_spacing": 100,
+                    "normal_diameter": 8, "normal_spacing": 250}
+        stirrups["positions"] = calculate_stirrup_positions(5.0, 1.0, 100, 250)
+        item = {"length": 5.0, "width": 30, "height": 50, "concrete_class": "C25",
+                "reinforcement": {"stirrups": stirrups}}
+        takeoff = calculate_quantity_takeoff([item])
+
+        # Sıklaştırma: her mesnetten arange(0, 1.0, 0.1); orta bölge: 1.0'dan 4.0'a (dahil) 0.25 aralıkla
+        n_dense = 2 * len(np.arange(0.0, 1.0, 0.1))
+        n_normal = len(np.arange(1.0, 4.0 + 1e-9, 0.25))
+        self.assertEqual((n_dense, n_normal), (20, 13))
+        self.assertEqual(len(stirrups["positions"]), n_dense + n_normal)
+
+        unit_weight = lambda diameter: np.pi * (diameter / 1000)**2 / 4 * 7850
+        stirrup_weight = lambda diameter: (2 * (0.3 + 0.5) - 8 * 0.05 + 20 * diameter / 1000) * unit_weight(diameter)
+        by_diameter = takeoff["totals"]["steel_weight_by_diameter"]
+        self.assertEqual(takeoff["diameters"], [8, 10])
+        self.assertAlmostEqual(by_diameter[10], n_dense * stirrup_weight(10))
+        self.assertAlmostEqual(by_diameter[8], n_normal * stirrup_weight(8))
+
+    def test_scenarios_are_calculated(self):
+        """Sonucu olmayan donatılı senaryoların hesaplanıp toplandığını test et"""
+        scenarios = ({"length": 5.0, "load": 20.0, "width": 30, "height": 50, "concrete_class": "C25",
+                      "load_type": "Düzgün Yayılı Yük", "with_reinforcement": True, "floor": index % 2}
+                     for index in range(10))
+        takeoff = calculate_quantity_takeoff(scenarios, chunk_size=4)
+
+        self.assertEqual(takeoff["floors"], ["0", "1"])
+        self.assertEqual(takeoff["steel_weight"].shape, (2, len(takeoff["diameters"])))
+        self.assertTrue(np.allclose(takeoff["steel_weight"][0], takeoff["steel_weight"][1]))
+        self.assertAlmostEqual(sum(takeoff["totals"]["steel_weight_by_diameter"].values()),
+                               takeoff["totals"]["steel_weight"])
+
+        with self.assertRaises(ValueError):
+            calculate_quantity_takeoff([{"length": 5.0, "width": 30, "height": 50, "concrete_class": "C99"}])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+from statistics import NormalDist
+from src.core.calculations.reliability import calculate_failure_probability, iterate_failure_probability
+from src.core.calculations.reinforcement import calculate_moment_capacity
+
+class TestReliability(unittest.TestCase):
+    """Monte Carlo güvenilirlik analizini test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.length = 5.0  # m
+        self.load = 40.0  # kN/m
+        self.width = 30.0  # cm
+        self.height = 50.0  # cm
+        self.kwargs = {"load_type": "Düzgün Yayılı Yük", "seed": 42}
+
+    def test_reproducible_with_seed(self):
+        """Aynı tohumla aynı sonucun elde edilmesini test et"""
+        first = calculate_failure_probability(self.length, self.load, self.width, self.height, "C25", **self.kwargs)
+        second = calculate_failure_probability(self.length, self.load, self.width, self.height, "C25", **self.kwargs)
+        self.assertEqual(first["failures"], second["failures"])
+        self.assertEqual(first["history"], second["history"])
+
+    def test_matches_analytical_probability(self):
+        """Yalnızca yük rastgele iken kapalı form olasılıkla uyumu test et"""
+        steel_area = 800.0  # mm²
+        load_cov = 0.25
+        result = calculate_failure_probability(
+            self.length, self.load, self.width, self.height, "C25", steel_area=steel_area,
+            load_cov=load_cov, concrete_cov=0.0, steel_cov=0.0, dimension_std=0.0, cover_std=0.0,
+            target_cov=0.02, **self.kwargs)
+
+        # Kapasiteyi aşan yayılı yük ve lognormal dağılımın aşılma olasılığı
+        capacity = calculate_moment_capacity(steel_area, 0.30, 0.45, 25, 420)
+        critical_load = 8 * capacity / self.length**2
+        sigma = np.sqrt(np.log(1 + load_cov**2))
+        mu = np.log(self.load) - sigma**2 / 2
+        expected = 1 - NormalDist(mu, sigma).cdf(np.log(critical_load))
+
+        self.assertTrue(result["converged"])
+        self.assertLess(abs(result["probability"] - expected), 4 * result["std_error"])
+        self.assertLessEqual(result["ci_lower"], result["probability"])
+        self.assertGreaterEqual(result["ci_upper"], result["probability"])
+
+    def test_early_stopping(self):
+        """Hedef değişim katsayısına ulaşılınca örneklemenin durmasını test et"""
+        loose = calculate_failure_probability(self.length, self.load, self.width, self.height, "C25",
+                                              chunk_size=5000, target_cov=0.2, **self.kwargs)
+        unreachable = calculate_failure_probability(self.length, self.load, self.width, self.height, "C25",
+                                                    chunk_size=5000, max_samples=20000, target_cov=0.0,
+                                                    **self.kwargs)
+
+        self.assertTrue(loose["converged"])
+        self.assertLessEqual(loose["cov"], 0.2)
+        self.assertFalse(unreachable["converged"])
+        self.assertEqual(unreachable["samples"], 20000)
+        self.assertEqual([n for n, _ in unreachable["history"]], [5000, 10000, 15000, 20000])
+
+    def test_streaming_estimates(self):
+        """Parça bazlı tahminlerin birikimli olmasını test et"""
+        estimates = list(iterate_failure_probability(self.length, self.load, self.width, self.height, "C25",
+                                                     chunk_size=10000, max_samples=30000, target_cov=0.0,
+                                                     **self.kwargs))
+        self.assertEqual(len(estimates), 3)
+        failures = [estimate["failures"] for estimate in estimates]
+        self.assertEqual(failures, sorted(failures))
+
+    def test_invalid_concrete_class(self):
+        """Geçersiz beton sınıfı için hata kontrolü"""
+        with self.assertRaises(ValueError):
+            calculate_failure_probability(self.length, self.load, self.width, self.height, "C99")
+
+if __name__ == '__main__':
+    unittest.main()
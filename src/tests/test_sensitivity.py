@@ -0,0 +1,103 @@
+import unittest
+import numpy as np
+from src.core.calculations.beam_calculation import (
+    calculate_beam_analysis, calculate_beam_batch, GRADIENT_PARAMETERS
+)
+from src.core.calculations.reinforcement import calculate_reinforcement, calculate_required_steel_area
+
+class TestSensitivity(unittest.TestCase):
+    """Analitik türev çıktılarını test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.params = {"length": 5.0, "load": 20.0, "width": 30.0, "height": 50.0}
+        self.concrete_class = "C25"
+
+    def analysis(self, support_condition, load_type, **params):
+        """Donatılı kiriş analizi"""
+        return calculate_beam_analysis(concrete_class=self.concrete_class, load_type=load_type,
+                                       with_reinforcement=True, support_condition=support_condition,
+                                       **params)
+
+    def test_vectorized_area_matches_reinforcement(self):
+        """Vektörel donatı alanının calculate_reinforcement ile aynı olmasını test et"""
+        moments = np.array([5.0, 80.0, 250.0, 350.0])
+        areas = calculate_required_steel_area(moments, 0.30, 0.50, self.concrete_class)
+        for moment, area in zip(moments, areas):
+            expected = calculate_reinforcement(moment, self.concrete_class, 0.30, 0.50)["required_area"]
+            self.assertAlmostEqual(area, expected, places=6)
+
+        # calculate_reinforcement'ın hata verdiği kesitler NaN olur
+        self.assertTrue(np.isnan(calculate_required_steel_area(600.0, 0.30, 0.50, self.concrete_class)))
+
+    def test_area_gradient_matches_finite_difference(self):
+        """Donatı alanı türevlerinin sonlu farklarla uyumunu test et"""
+        for moment in [5.0, 150.0, 350.0]:  # Minimum donatı, tek donatılı, basınç donatılı
+            area, gradient = calculate_required_steel_area(moment, 0.30, 0.50, self.concrete_class,
+                                                           with_gradient=True)
+            args = {"moment": moment, "width": 0.30, "height": 0.50}
+            for name, step in [("moment", 1e-4), ("width", 1e-7), ("height", 1e-7)]:
+                plus, minus = dict(args), dict(args)
+                plus[name] += step
+                minus[name] -= step
+                fd = (calculate_required_steel_area(concrete_class=self.concrete_class, **plus)
+                      - calculate_required_steel_area(concrete_class=self.concrete_class, **minus)) / (2 * step)
+                self.assertAlmostEqual(gradient[name], fd, delta=1e-5 * max(abs(fd), 1.0))
+
+            # Alan (M, fck) çiftinde birinci dereceden homojendir (minimum donatı hariç)
+            if gradient["moment"] > 0:
+                self.assertAlmostEqual(25 * gradient["fck"] + moment * gradient["moment"], area, places=6)
+
+    def test_analysis_gradients_match_finite_difference(self):
+        """Kiriş analizi türevlerinin sonlu farklarla uyumunu test et"""
+        cases = [("Basit Mesnetli", "Düzgün Yayılı Yük"), ("Konsol", "Tekil Yük"),
+                 ("İki Ucu Ankastre", "Üçgen Yayılı Yük")]
+        for support_condition, load_type in cases:
+            results = calculate_beam_analysis(concrete_class=self.concrete_class, load_type=load_type,
+                                              with_reinforcement=True, support_condition=support_condition,
+                                              with_gradients=True, **self.params)
+            gradients = results["gradients"]
+            for name in ["length", "load", "width", "height"]:
+                with self.subTest(support=support_condition, parameter=name):
+                    step = 1e-5
+                    plus, minus = dict(self.params), dict(self.params)
+                    plus[name] += step
+                    minus[name] -= step
+                    upper = self.analysis(support_condition, load_type, **plus)
+                    lower = self.analysis(support_condition, load_type, **minus)
+
+                    for quantity in ["moment", "max_deflection"]:
+                        fd = (upper[quantity] - lower[quantity]) / (2 * step)
+                        self.assertAlmostEqual(gradients[quantity][name], fd, delta=1e-6 * max(abs(fd), 1e-3))
+                    fd = (upper["reinforcement"]["required_area"]
+                          - lower["reinforcement"]["required_area"]) / (2 * step)
+                    self.assertAlmostEqual(gradients["required_area"][name], fd, delta=1e-5 * max(abs(fd), 1.0))
+
+    def test_concrete_strength_gradient(self):
+        """Sehimin fck türevinin E'nin fck'ya bağlılığıyla tutarlı olmasını test et"""
+        results = calculate_beam_analysis(concrete_class="C25", with_gradients=True, **self.params)
+        stronger = calculate_beam_analysis(concrete_class="C30", **self.params)
+
+        # δ ∝ fck^-0.3 olduğundan logaritmik türev -0.3/fck
+        gradient = results["gradients"]["max_deflection"]["fck"]
+        self.assertAlmostEqual(gradient * 25 / results["max_deflection"], -0.3, places=9)
+        self.assertAlmostEqual(stronger["max_deflection"] / results["max_deflection"], (30 / 25)**-0.3, places=9)
+
+    def test_batch_gradients_match_single(self):
+        """Toplu hesap türevlerinin tek tek analizle aynı olmasını test et"""
+        scenarios = [dict(self.params, concrete_class=concrete_class, load_type=load_type,
+                          with_reinforcement=True)
+                     for concrete_class in ["C25", "C35"]
+                     for load_type in ["Tekil Yük", "Düzgün Yayılı Yük"]]
+        batch = calculate_beam_batch(scenarios, with_gradients=True)
+        for scenario, result in zip(scenarios, batch):
+            single = calculate_beam_analysis(scenario["length"], scenario["load"], scenario["width"],
+                                             scenario["height"], scenario["concrete_class"],
+                                             scenario["load_type"], True, with_gradients=True)
+            for quantity in ["moment", "max_deflection", "required_area"]:
+                for name in GRADIENT_PARAMETERS:
+                    self.assertAlmostEqual(result["gradients"][quantity][name],
+                                           single["gradients"][quantity][name], places=9)
+
+if __name__ == '__main__':
+    unittest.main()
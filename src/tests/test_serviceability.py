@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+from src.core.calculations.serviceability import calculate_crack_width, check_results_serviceability
+from src.core.calculations.cracked_section import calculate_cracked_section
+from src.core.calculations.beam_calculation import calculate_beam_batch
+
+class TestServiceability(unittest.TestCase):
+    """Çatlak genişliği ve donatı gerilmesi kontrollerini test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.width = 0.30  # m
+        self.height = 0.50  # m
+        self.cover = 0.05  # m
+        self.concrete_class = "C25"
+
+    def test_steel_stress_and_crack_width(self):
+        """Donatı gerilmesi ve çatlak genişliğini el hesabıyla karşılaştır"""
+        result = calculate_crack_width(100.0, self.width, self.height, self.concrete_class, 16, 4,
+                                       self.cover, quasi_permanent_ratio=0.6)
+        As = 4 * np.pi * 16**2 / 4
+        section = calculate_cracked_section(self.width, self.height, As, self.concrete_class, self.cover)
+        x, I_cr, n = section["neutral_axis"], section["cracked_inertia"], section["modular_ratio"]
+        sigma_s = n * 60.0 / 1000 * (0.45 - x) / I_cr
+        self.assertAlmostEqual(result["steel_stress"], sigma_s)
+
+        rho = As / 1e6 / (self.width * min(2.5 * 0.05, (0.50 - x) / 3, 0.25))
+        spacing = 3.4 * (50 - 8) + 0.425 * 0.8 * 0.5 * 16 / rho
+        self.assertAlmostEqual(result["crack_spacing"], spacing)
+
+        fct = 0.35 * np.sqrt(25)
+        strain = max((sigma_s - 0.4 * fct * (1 + n * rho) / rho) / 200000, 0.6 * sigma_s / 200000)
+        self.assertAlmostEqual(result["crack_width"], spacing * strain)
+        self.assertTrue(result["is_cracked"])
+
+    def test_uncracked_section(self):
+        """Çatlama momentinin altında çatlak genişliğinin sıfır olduğunu test et"""
+        result = calculate_crack_width(10.0, self.width, self.height, self.concrete_class, 16, 4, self.cover)
+        self.assertFalse(result["is_cracked"])
+        self.assertEqual(result["crack_width"], 0.0)
+        self.assertTrue(result["passed"])
+
+    def test_masks_and_utilization(self):
+        """Vektörel kontrol maskelerini ve kullanım oranlarını test et"""
+        moments = np.array([50.0, 150.0, 300.0])
+        result = calculate_crack_width(moments, self.width, self.height, self.concrete_class, 12, 3,
+                                       self.cover, exposure="Agresif")
+
+        self.assertEqual(result["crack_width"].shape, (3,))
+        self.assertTrue(np.all(np.diff(result["crack_width"]) > 0))
+        self.assertTrue(np.allclose(result["crack_width_utilization"], result["crack_width"] / 0.2))
+        self.assertTrue(np.array_equal(result["passed"], result["crack_width_ok"] & result["steel_stress_ok"]))
+        self.assertFalse(result["passed"][-1])
+
+        with self.assertRaises(ValueError):
+            calculate_crack_width(50.0, self.width, self.height, self.concrete_class, 12, 3, exposure="Geçersiz")
+
+    def test_results_are_annotated(self):
+        """Toplu hesap sonuçlarına servis kontrollerinin eklendiğini test et"""
+        scenarios = [
+            {"length": 5.0, "load": 20.0, "width": 30, "height": 50, "concrete_class": "C25",
+             "load_type": "Düzgün Yayılı Yük", "with_reinforcement": True},
+            {"length": 5.0, "load": 20.0, "width": 30, "height": 50, "concrete_class": "C25",
+             "load_type": "Düzgün Yayılı Yük"},
+            {"length": 7.0, "load": 30.0, "width": 30, "height": 60, "concrete_class": "C30",
+             "load_type": "Düzgün Yayılı Yük", "with_reinforcement": True},
+        ]
+        results = calculate_beam_batch(scenarios)
+        for scenario, result in zip(scenarios, results):
+            result.update({key: scenario[key] for key in ("width", "height", "concrete_class")})
+
+        checks = check_results_serviceability(results)
+        self.assertTrue(np.array_equal(checks["indices"], [0, 2]))
+        self.assertNotIn("serviceability", results[1])
+
+        option = results[2]["reinforcement"]["options"][0]
+        single = calculate_crack_width(results[2]["moment"], 0.30, 0.60, "C30",
+                                       option["diameter"], option["count"])
+        self.assertAlmostEqual(results[2]["serviceability"]["crack_width"], float(single["crack_width"]))
+        self.assertIsInstance(results[0]["serviceability"]["passed"], bool)
+
+if __name__ == '__main__':
+    unittest.main()
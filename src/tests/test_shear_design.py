@@ -0,0 +1,103 @@
+import unittest
+import numpy as np
+from src.core.calculations.shear_design import (
+    calculate_shear_capacity, calculate_shear_reinforcement, calculate_stirrup_positions
+)
+from src.core.calculations.beam_calculation import calculate_beam_analysis, calculate_beam_batch
+
+class TestShearDesign(unittest.TestCase):
+    """Kesme (etriye) tasarımını test eden sınıf"""
+
+    def setUp(self):
+        """Test için ortak değişkenleri ayarla"""
+        self.length = 6.0  # m
+        self.width = 0.30  # m
+        self.height = 0.50  # m
+        self.concrete_class = "C25"
+        self.x_values = np.linspace(0, self.length, 101)
+
+    def test_shear_capacity(self):
+        """TS500 kesme dayanımlarını el hesabıyla karşılaştır"""
+        capacity = calculate_shear_capacity(self.width, self.height, self.concrete_class)
+        fctd = 0.35 * np.sqrt(25) / 1.5
+        V_cr = 0.65 * fctd * 0.30 * 0.45 * 1000
+
+        self.assertAlmostEqual(capacity["cracking_shear"], V_cr)
+        self.assertAlmostEqual(capacity["concrete_shear"], 0.8 * V_cr)
+        self.assertAlmostEqual(capacity["max_shear"], 0.22 * 25 / 1.5 * 0.30 * 0.45 * 1000)
+
+    def test_required_ratio(self):
+        """Gerekli Asw/s değerinin minimum ve hesap değerlerini test et"""
+        shear = np.where(self.x_values < self.length / 2, 200.0, -200.0)
+        design = calculate_shear_reinforcement(np.full_like(self.x_values, 50.0), self.x_values,
+                                               self.width, self.height, self.concrete_class)
+        fctd = 0.35 * np.sqrt(25) / 1.5
+        fywd = 420 / 1.15
+        minimum = 0.3 * fctd / fywd * 300
+        self.assertTrue(np.allclose(design["required_ratio"], minimum))
+
+        design = calculate_shear_reinforcement(shear, self.x_values, self.width, self.height, self.concrete_class)
+        V_c = calculate_shear_capacity(self.width, self.height, self.concrete_class)["concrete_shear"]
+        self.assertTrue(np.allclose(design["required_ratio"], (200.0 - V_c) * 1000 / (fywd * 450)))
+        self.assertTrue(np.all(design["provided_ratio"] >= design["required_ratio"]))
+        self.assertTrue(design["adequate"][0])
+
+    def test_dense_zones(self):
+        """Sıklaştırma bölgelerini ve aralık sınırlarını test et"""
+        shear = np.linspace(60.0, -60.0, len(self.x_values))
+        design = calculate_shear_reinforcement(shear, self.x_values, self.width, self.height, self.concrete_class)
+
+        # Mesnetlerden 2h = 1 m içindeki noktalar sıklaştırma bölgesidir
+        expected = (self.x_values <= 1.0) | (self.x_values >= self.length - 1.0)
+        self.assertTrue(np.array_equal(design["dense_zone"][0], expected))
+        self.assertLessEqual(design["dense_spacing"][0], min(500 / 4, 150))
+        self.assertLessEqual(design["normal_spacing"][0], 450 / 2)
+        self.assertLessEqual(design["dense_spacing"][0], design["normal_spacing"][0])
+
+        # Konsolda yalnızca ankastre uçta sıklaştırma yapılır
+        cantilever = calculate_shear_reinforcement(shear, self.x_values, self.width, self.height,
+                                                   self.concrete_class, "Konsol")
+        self.assertTrue(np.array_equal(cantilever["dense_zone"][0], self.x_values <= 1.0))
+
+    def test_positions_match_count(self):
+        """Etriye konumlarının sayısı ve aralıklarını test et"""
+        for support_condition in ("Basit Mesnetli", "Konsol"):
+            with self.subTest(support_condition=support_condition):
+                results = calculate_beam_analysis(self.length, 10, 30, 50, self.concrete_class,
+                                                  "Düzgün Yayılı Yük", with_reinforcement=True,
+                                                  support_condition=support_condition)
+                stirrups = results["reinforcement"]["stirrups"]
+                positions = stirrups["positions"]
+
+                self.assertEqual(len(positions), stirrups["count"])
+                self.assertAlmostEqual(positions[0], 0.0)
+                gaps = np.diff(positions) * 1000
+                self.assertLessEqual(gaps.max(), stirrups["normal_spacing"] + 1e-6)
+
+        positions = calculate_stirrup_positions(self.length, 1.0, 100, 200)
+        self.assertAlmostEqual(positions[-1], self.length)
+
+    def test_batch_matches_scalar(self):
+        """Toplu hesapta etriye tasarımının tekil hesapla aynı olduğunu test et"""
+        scenarios = [
+            {"length": 4.0, "load": 30.0, "width": 25, "height": 40, "concrete_class": "C20",
+             "load_type": "Düzgün Yayılı Yük", "with_reinforcement": True},
+            {"length": 6.0, "load": 60.0, "width": 30, "height": 50, "concrete_class": "C30",
+             "load_type": "Düzgün Yayılı Yük", "with_reinforcement": True},
+        ]
+        batch = calculate_beam_batch(scenarios, n_points=100)
+        for scenario, result in zip(scenarios, batch):
+            single = calculate_beam_analysis(scenario["length"], scenario["load"], scenario["width"],
+                                             scenario["height"], scenario["concrete_class"],
+                                             scenario["load_type"], with_reinforcement=True)
+            expected = single["reinforcement"]["stirrups"]
+            actual = result["reinforcement"]["stirrups"]
+            for key in ("dense_diameter", "dense_spacing", "normal_diameter", "normal_spacing", "count"):
+                self.assertEqual(actual[key], expected[key])
+
+        with self.assertRaises(ValueError):
+            calculate_shear_reinforcement(np.zeros(5), np.linspace(0, 1, 5), self.width, self.height,
+                                          self.concrete_class, "Geçersiz")
+
+if __name__ == '__main__':
+    unittest.main()
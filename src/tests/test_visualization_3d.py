@@ -2,7 +2,8 @@ import unittest
 import numpy as np
 from PyQt6.QtWidgets import QApplication
 import sys
-from src.app.ui.visualization_3d import Beam3DVisualization
+from src.app.ui.visualization_3d import (Beam3DVisualization, build_beam_mesh, build_reinforcement_lines,
+                                        GEOMETRY_CACHE_SIZE)
 
 class TestVisualization3D(unittest.TestCase):
     """3D görselleştirme modülü testleri"""
@@ -62,5 +63,158 @@ class TestVisualization3D(unittest.TestCase):
         # Verilerin doğru ayarlandığını kontrol et
         self.assertEqual(widget.reinforcement_data, reinforcement)
 
+    def test_build_beam_mesh(self):
+        """Kiriş ağının dörtgen sayısı ve deformasyon alanı testi"""
+        x_values = np.linspace(0, 5.0, 100)
+        deflection = -np.sin(np.pi * x_values / 5.0) * 0.01
+        mesh = build_beam_mesh(x_values, 30.0, 50.0, deflection, n_width=30)
+        
+        n_faces = 2 * 29 * 99 + 2 * 99 + 2 * 29
+        self.assertEqual(mesh["vertices"].shape, (n_faces, 4, 3))
+        self.assertEqual(mesh["deflection"].shape, (n_faces, 4))
+        self.assertEqual(mesh["surface"].sum(), 2 * 29 * 99)
+        
+        # Köşe deformasyonları köşenin x konumundaki sehime eşit olmalı (cm)
+        corner_x = mesh["vertices"][..., 0]
+        self.assertTrue(np.allclose(mesh["deflection"], np.interp(corner_x, x_values, deflection * 100)))
+        self.assertTrue(np.allclose(np.abs(mesh["vertices"][mesh["surface"]][..., 2]), 25.0))
+        
+        # Yan yüzeysiz ağ yalnızca alt ve üst yüzeyleri içerir
+        self.assertEqual(len(build_beam_mesh(x_values, 30.0, 50.0, sides=False)["vertices"]), 2 * 29 * 99)
+    
+    def test_stress_view_single_collection(self):
+        """Gerilme görünümünde kiriş ağının tek koleksiyon olarak çizildiği testi"""
+        widget = Beam3DVisualization()
+        x_values = np.linspace(0, 5.0, 100)
+        widget.set_beam_data(5.0, 30.0, 50.0, x_values, -np.sin(np.pi * x_values / 5.0) * 0.01, "Tekil Yük")
+        widget.beam_data['moment_distribution'] = np.sin(np.pi * x_values / 5.0) * 50
+        widget.stress_combo.setCurrentIndex(1)
+        
+        self.assertIn(widget.beam_mesh, widget.ax.collections)
+        self.assertLess(len(widget.ax.collections), 20)
+        self.assertEqual(len(widget.beam_mesh.get_facecolor()), 2 * 29 * 99 + 2 * 99 + 2 * 29)
+
+    def test_animation_updates_in_place(self):
+        """Animasyon karelerinin aynı ağ üzerinde yalnızca z koordinatlarını güncellediği testi"""
+        widget = Beam3DVisualization()
+        x_values = np.linspace(0, 5.0, 100)
+        deflection = -np.sin(np.pi * x_values / 5.0) * 0.01
+        widget.set_beam_data(5.0, 30.0, 50.0, x_values, deflection, "Tekil Yük")
+        widget.animate_button.setChecked(True)
+        widget.toggle_animation()
+        
+        mesh = widget.anim_mesh
+        collections = len(widget.ax.collections)
+        self.assertEqual(widget.anim_z.shape[0], 50)
+        
+        update = widget.animation._func
+        for frame in range(10):
+            update(frame)
+        self.assertIs(widget.anim_mesh, mesh)
+        self.assertEqual(len(widget.ax.collections), collections)
+        
+        # Son karede en büyük sehim ölçeklenmiş olarak uygulanmalı (cm)
+        update(49)
+        scale = widget.scale_slider.value() / 10.0
+        self.assertAlmostEqual(widget.anim_vertices[..., 2].min(), -25.0 - 1.0 * scale, places=2)
+        self.assertTrue(widget.fps_label.text().startswith("FPS"))
+        
+        widget.animate_button.setChecked(False)
+        widget.toggle_animation()
+        self.assertEqual(widget.fps_label.text(), "")
+
+    def test_geometry_cache(self):
+        """Ölçek değişiminde ağın önbellekten kullanıldığı ve yeni veride geçersizleştiği testi"""
+        widget = Beam3DVisualization()
+        widget.lod_button.setChecked(False)
+        x_values = np.linspace(0, 5.0, 100)
+        deflection = -np.sin(np.pi * x_values / 5.0) * 0.01
+        widget.set_beam_data(5.0, 30.0, 50.0, x_values, deflection, "Tekil Yük",
+                             moment_distribution=np.sin(np.pi * x_values / 5.0) * 50)
+        
+        n_length, n_width = widget.mesh_resolution()
+        mesh = widget.get_mesh(n_width, False, n_length)
+        buffer = mesh["buffer"]
+        widget.scale_slider.setValue(40)
+        self.assertIs(widget.get_mesh(n_width, False, n_length), mesh)
+        self.assertIs(mesh["buffer"], buffer)
+        self.assertTrue(np.allclose(buffer[..., 2], mesh["vertices"][..., 2] + 4.0 * mesh["deflection"]))
+        
+        # Gerilme renkleri de önbellekten kullanılır
+        widget.stress_combo.setCurrentIndex(1)
+        key = (n_width, True, n_length)
+        colors = widget.get_stress_colors("Moment", key, widget.get_mesh(*key)["segment"])
+        widget.scale_slider.setValue(10)
+        self.assertIs(widget.get_stress_colors("Moment", key, None), colors)
+        
+        # Önbellek boyutu sınırlı
+        for n_width in range(2, 2 + 2 * GEOMETRY_CACHE_SIZE):
+            widget.get_mesh(n_width)
+        self.assertEqual(len(widget.geometry_cache), GEOMETRY_CACHE_SIZE)
+        
+        # Yeni veri önbelleği geçersizleştirir
+        widget.set_beam_data(6.0, 30.0, 50.0, np.linspace(0, 6.0, 100), deflection, "Tekil Yük")
+        self.assertIsNot(widget.get_mesh(30, False), mesh)
+        self.assertAlmostEqual(widget.get_mesh(30, False)["vertices"][..., 0].max(), 6.0)
+    
+    def face_count(self, widget):
+        """Çizim sonrası kiriş ağındaki yüz sayısı"""
+        widget.canvas.draw()
+        return len(widget.beam_mesh.get_facecolor())
+    
+    def test_level_of_detail(self):
+        """Etkileşim sırasında kaba ağın, ardından tam çözünürlüklü ağın çizildiği testi"""
+        widget = Beam3DVisualization()
+        widget.resize(900, 700)
+        x_values = np.linspace(0, 20.0, 100)
+        widget.set_beam_data(20.0, 30.0, 60.0, x_values, -np.sin(np.pi * x_values / 20.0) * 0.05, "Tekil Yük")
+        
+        # Tam çözünürlük kiriş boyuyla artar, tuval genişliğiyle sınırlıdır
+        n_length, n_width = widget.mesh_resolution()
+        self.assertEqual(n_length, min(400, widget.canvas.width() // 4))
+        full_faces = 2 * (n_width - 1) * (n_length - 1)
+        self.assertEqual(self.face_count(widget), full_faces)
+        
+        # Kaydırıcı hareketi kaba ağı gösterir ve tam çizimi erteler
+        mesh = widget.beam_mesh
+        widget.scale_slider.setValue(30)
+        self.assertIs(widget.beam_mesh, mesh)
+        self.assertTrue(widget.lod_coarse)
+        self.assertTrue(widget.lod_timer.isActive())
+        self.assertEqual(self.face_count(widget), 2 * 4 * 19)
+        
+        widget.finish_interaction()
+        self.assertFalse(widget.lod_coarse)
+        self.assertEqual(self.face_count(widget), full_faces)
+        
+        # Mod kapalıyken her değişiklik tam çizim yapar
+        widget.lod_button.setChecked(False)
+        widget.scale_slider.setValue(20)
+        self.assertFalse(widget.lod_coarse)
+        self.assertEqual(len(widget.beam_mesh.get_facecolor()), full_faces)
+    
+    def test_reinforcement_line_collections(self):
+        """Donatı ve etriye geometrisinin malzeme başına tek koleksiyonda çizildiği testi"""
+        positions = np.linspace(0, 12.0, 61)
+        lines = build_reinforcement_lines(12.0, 30.0, 50.0, 5, 1.6, positions)
+        
+        # 5 çubuk + 5 × 10 halka, 61 etriye × (4 kenar + 2 kanca)
+        self.assertEqual(lines["bars"].shape, (55, 20, 3))
+        self.assertEqual(len(lines["bar_widths"]), 55)
+        self.assertEqual(lines["stirrups"].shape, (61 * 6, 2, 3))
+        self.assertTrue(np.allclose(np.abs(lines["stirrups"][..., 1]), 10.0))
+        self.assertAlmostEqual(lines["stirrups"][..., 2].max(), 20.0)
+        
+        widget = Beam3DVisualization()
+        x_values = np.linspace(0, 12.0, 100)
+        widget.set_beam_data(12.0, 30.0, 50.0, x_values, np.zeros(100), "Tekil Yük")
+        widget.show_reinforcement.setChecked(True)
+        widget.set_reinforcement_data({'options': [{'count': 5, 'diameter': 16, 'spacing': 30, 'area': 1005.3}]})
+        
+        self.assertEqual(len(widget.ax.lines), 0)
+        labels = [collection.get_label() for collection in widget.ax.collections]
+        self.assertIn('Donatı', labels)
+        self.assertIn('Etriye', labels)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file